@@ -1,6 +1,16 @@
 import json
-from data import courses 
-with open("data.json", "w") as json_file:
-    json.dump(courses, json_file, indent=4)
+import os
+import sys
 
-print("Dictionary successfully converted to data.json")
\ No newline at end of file
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from catalog import DEFAULT_CATALOG_PATH
+from catalog_snapshot import write_data_module
+
+# data.json is the single source of truth; data.py is generated from it
+with open(DEFAULT_CATALOG_PATH, "r", encoding="utf-8") as json_file:
+    courses = json.load(json_file)
+
+if write_data_module(DEFAULT_CATALOG_PATH, courses):
+    print("data.py successfully regenerated from data.json")
+else:
+    print("data.py is already up to date with data.json")
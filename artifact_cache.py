@@ -0,0 +1,104 @@
+"""
+Content-hash keyed cache of derived planning artifacts (selected_courses,
+courses_left, ...).
+
+A key combines the hashes of everything an artifact is derived from, e.g.
+data.json, the timetable overlay, the program spec from dept.py, minors.json
+and the student state. Unchanged inputs give the same key, so a re-run can load
+the artifact instead of rebuilding and rewriting it.
+"""
+import hashlib
+import json
+import os
+import pickle
+
+from fileio import atomic_write, file_sha256
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+CACHE_DIR = os.path.join(BASE_DIR, ".plan_cache")
+
+# Modules whose code derives the artifacts; editing them invalidates the cache
+SOURCE_FILES = ("planner.py", "minor_planner.py", "catalog.py", "catalog_snapshot.py", "course.py", "prereqs.py")
+
+_file_digests = {}      # (path, size, mtime_ns) -> sha256, so a warm process hashes each file once
+
+
+def file_digest(path):
+    """sha256 of a file's contents ("" for no file)"""
+    if path is None:
+        return ""
+    stat = os.stat(path)
+    memo_key = (os.path.abspath(path), stat.st_size, stat.st_mtime_ns)
+    if memo_key not in _file_digests:
+        _file_digests[memo_key] = file_sha256(path)
+    return _file_digests[memo_key]
+
+
+def spec_digest(obj):
+    """sha256 of a JSON-able spec (dept dict, student state, ...)"""
+    text = json.dumps(obj, sort_keys=True, default=str)
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def source_digest():
+    """Hash of the code that derives the artifacts"""
+    return spec_digest([file_digest(os.path.join(BASE_DIR, name)) for name in SOURCE_FILES])
+
+
+def student_state(user):
+    """The parts of a UserData that the derived artifacts depend on"""
+    return {
+        "current_semester": user.current_semester,
+        "num_semesters": user.num_semesters,
+        "completed_corecourses": sorted(user.completed_corecourses),
+        "completed_hul": sorted(user.completed_hul),
+        "completed_DE": sorted(user.completed_DE),
+        "completed_minor": sorted(user.completed_minor),
+        "minor_type": user.minor_type,
+        "min_credits": user.min_credits,
+        "max_credits": user.max_credits,
+    }
+
+
+def artifact_key(*parts):
+    """Combine digests / plain values into one cache key"""
+    return spec_digest([str(part) for part in parts])
+
+
+def load_artifacts(key):
+    """Cached artifacts for `key`, or None"""
+    try:
+        with open(os.path.join(CACHE_DIR, f"{key}.pkl"), "rb") as f:
+            return pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError):
+        return None
+
+
+def save_artifacts(key, artifacts):
+    """Store artifacts under `key`"""
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    with atomic_write(os.path.join(CACHE_DIR, f"{key}.pkl"), "wb") as f:
+        pickle.dump(artifacts, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def _written_marker(path):
+    return os.path.join(CACHE_DIR, "written", spec_digest(os.path.abspath(path)))
+
+
+def is_written(path, key):
+    """True if `path` still holds the artifact written for `key`"""
+    try:
+        stat = os.stat(path)
+        with open(_written_marker(path), "r", encoding="utf-8") as f:
+            return f.read() == f"{key} {stat.st_size} {stat.st_mtime_ns}"
+    except OSError:
+        return False
+
+
+def mark_written(path, key):
+    """Remember that `path` was just written from the artifact for `key`"""
+    marker = _written_marker(path)
+    os.makedirs(os.path.dirname(marker), exist_ok=True)
+    stat = os.stat(path)
+    with atomic_write(marker, "w", encoding="utf-8") as f:
+        f.write(f"{key} {stat.st_size} {stat.st_mtime_ns}")
@@ -0,0 +1,121 @@
+"""
+Benchmark the model engines (model_engines.py): model size and solve time of
+the "bool" and "int" encodings on the EE1 sample plan from planner.py and on
+synthetic catalogs of growing size.
+
+    python benchmark_engines.py                 # EE1 + synthetic 200 / 500 / 1000 courses
+    python benchmark_engines.py 300 3000        # EE1 + synthetic catalogs of these sizes
+"""
+import contextlib
+import io
+import random
+import sys
+import time
+
+from catalog import CourseCatalog
+from model_engines import ENGINES, restrict_to_windows
+from planner import CONFIG, SELECTED_MINOR, PlanModelBuilder, new_solver, sample_student
+from user import UserData
+
+TIME_LIMIT = 30.0           # seconds per solve
+WORKERS = 8
+SLOTS = "ABCDEFHJKLM"
+SEMESTERS = range(1, 9)
+
+
+def ee1_inputs():
+    """courses_left / user / catalog / minor of the planner.py sample student"""
+    builder = PlanModelBuilder()
+    with contextlib.redirect_stdout(io.StringIO()):
+        built = builder.build(sample_student(builder.selected_courses()), SELECTED_MINOR)
+    minor_req = built["minor_req"] if SELECTED_MINOR else None
+    return built["courses_left"], built["student"], built["config"], builder.catalog, minor_req
+
+
+def synthetic_inputs(n_courses, seed=0, n_core=24):
+    """
+    A random program over a catalog of n_courses: n_core Core courses in prereq
+    chains across 5 levels, the rest split between DE (prereqs on Core, with OR
+    groups and some EC rules) and HUL. Every course has a random slot letter
+    and is offered in all 8 semesters, so only the elective pool grows with n.
+    """
+    rng = random.Random(seed)
+    data = {}
+    core = []               # (code, level)
+    for i in range(n_courses):
+        kind = "Core" if i < n_core else rng.choice(["DE", "DE", "HUL2XX"])
+        prefix = {"Core": "SC", "DE": "SD", "HUL2XX": "SH"}[kind]
+        code = f"{prefix}{chr(ord('A') + i // 1000)}{i % 1000:03d}"
+
+        prereqs = ""
+        if kind == "Core":
+            level = i * 5 // n_core
+            earlier = [c for c, l in core if l == level - 1]
+            if earlier:
+                prereqs = "[" + " and ".join(rng.sample(earlier, min(len(earlier), rng.randint(1, 2)))) + "]"
+            core.append((code, level))
+        elif kind == "DE":
+            a, b, c = rng.sample([c for c, _ in core], 3)
+            prereqs = f"[{a} and ({b} or {c})" + (" and EC60]" if rng.random() < 0.1 else "]")
+
+        data[code] = {
+            "code": code, "name": code, "credits": rng.choice([3, 3, 4, 4, 4.5]),
+            "prereqs": prereqs, "overlap": "", "slot": rng.choice(SLOTS),
+            "hours": {"lecture": 3, "tutorial": rng.randint(0, 1), "practical": 0},
+            "type": kind,
+        }
+
+    catalog = CourseCatalog(data)
+    courses = [catalog.record(code).tagged(course["type"]) for code, course in data.items()]
+    courses_left = {sem: list(courses) for sem in SEMESTERS}
+
+    core_credits = sum(c.credits for c in courses if c.type == "Core")
+    config = {
+        "TOTAL_TARGET_CREDITS": int(core_credits) + 40, "CREDIT_SCALE": 10, "MAX_HUL_PER_SEM": 2,
+        "MIN_HUL_CREDITS": 10, "MIN_DE_CREDITS": 15, "MINOR_UNIQUE_CREDITS": 10, "MAX_MINOR_PER_SEM": 2,
+    }
+    user = UserData(name="Synthetic", current_semester=1, EE_courses={}, completed_corecourses=[],
+                    min_credits=12, max_credits=24)
+    courses_left, _ = restrict_to_windows(courses_left, user)
+    return courses_left, user, config, catalog, None
+
+
+def run_engine(name, inputs):
+    """Build and solve with one engine -> result row"""
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        model, course_vars, _ = ENGINES[name](*inputs)
+    build_time = time.perf_counter() - start
+
+    proto = model.Proto()
+    solver, _ = new_solver({**CONFIG, "SOLVER_MAX_TIME": TIME_LIMIT, "SOLVER_WORKERS": WORKERS, "SOLVER_SEED": 0})
+    status = solver.Solve(model)
+    return {
+        "engine": name,
+        "variables": len(proto.variables),
+        "constraints": len(proto.constraints),
+        "build_s": build_time,
+        "solve_s": solver.WallTime(),
+        "status": solver.StatusName(status),
+    }
+
+
+def print_rows(title, rows):
+    print(f"\n📊 {title}")
+    print(f"   {'engine':<6} {'vars':>8} {'constraints':>12} {'build s':>8} {'solve s':>8}  status")
+    for row in rows:
+        print(f"   {row['engine']:<6} {row['variables']:>8} {row['constraints']:>12} "
+              f"{row['build_s']:>8.2f} {row['solve_s']:>8.2f}  {row['status']}")
+
+
+if __name__ == "__main__":
+    sizes = [int(arg) for arg in sys.argv[1:]] or [200, 500, 1000]
+
+    inputs = ee1_inputs()
+    print_rows(f"EE1 sample plan ({sum(len(c) for c in inputs[0].values())} course slots)",
+               [run_engine(name, inputs) for name in ENGINES])
+
+    for n in sizes:
+        inputs = synthetic_inputs(n)
+        print_rows(f"Synthetic catalog, {n} courses x {len(SEMESTERS)} semesters",
+                   [run_engine(name, inputs) for name in ENGINES])
@@ -0,0 +1,288 @@
+import json
+import os
+
+from course import Course
+from fileio import atomic_write
+from overlaps import maximal_cliques, overlap_graph
+from prereqs import prereq_tree
+from catalog_snapshot import SnapshotCourses, build_snapshot, is_fresh, snapshot_path_for
+
+WILDCARD = "X"         # HUL2XX, ELL3XX: X stands for any digit
+DEPT_CODE_LEN = 3       # the letters of a code are never wildcards
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_CATALOG_PATH = os.path.join(BASE_DIR, "data.json")
+
+# Per-semester timetable overlays written by slotting/merge.py, e.g. 2025-26-1.json
+OVERLAY_DIR = os.path.join(BASE_DIR, "slotting", "overlays")
+LATEST_OVERLAY = "latest"
+
+
+def overlay_path(term=LATEST_OVERLAY, overlay_dir=OVERLAY_DIR):
+    """
+    Overlay file for `term`; LATEST_OVERLAY picks the newest term (terms sort
+    chronologically, e.g. 2025-26-1 < 2025-26-2). None if there is no overlay.
+    """
+    if term is None:
+        return None
+    if term != LATEST_OVERLAY:
+        path = os.path.join(overlay_dir, f"{term}.json")
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"No timetable overlay for term '{term}' in {overlay_dir}")
+        return path
+    try:
+        terms = sorted(name for name in os.listdir(overlay_dir) if name.endswith(".json"))
+    except OSError:
+        return None
+    return os.path.join(overlay_dir, terms[-1]) if terms else None
+
+
+def load_overlay(path):
+    """Read an overlay file -> {course_code: {field: value}} patches"""
+    if path is None:
+        return {}
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)["courses"]
+
+
+def write_overlay(term, patches, overlay_dir=OVERLAY_DIR):
+    """
+    Write {course_code: {field: value}} as the overlay for `term`.
+    The file is swapped in atomically, so concurrent ingest runs never leave a
+    half-written overlay and never touch data.json. Returns the overlay path.
+    """
+    os.makedirs(overlay_dir, exist_ok=True)
+    path = os.path.join(overlay_dir, f"{term}.json")
+    with atomic_write(path, "w", encoding="utf-8") as f:
+        json.dump({"term": term, "courses": patches}, f, indent=1, ensure_ascii=False, sort_keys=True)
+    return path
+
+
+class CourseCatalog:
+    """
+    In-memory course catalog (data.json), keyed by course code.
+
+    Load it through get_catalog() so that the planner, MinorPlanner and the
+    tests all share one parsed copy per process instead of each calling
+    json.load on the 2.2 MB file.
+    """
+
+    def __init__(self, courses, path=None, descriptions=None, prereq_trees=None, overlap_cliques=None):
+        self.courses = courses              # dict: course_code -> course dict
+        self.path = path
+        self._descriptions = descriptions   # code -> description store, kept out of the records
+        self._prereq_trees = prereq_trees   # code -> parsed prereq tree, filled when the catalog is built
+        self._overlap_cliques = overlap_cliques     # () -> maximal cliques of overlapping codes
+        self._prefix_index = None           # prefix -> [codes], built on first match()
+        self.overlay_path = None            # timetable overlay applied on top (set by get_catalog)
+        self._ids = None                    # code -> dense integer id (catalog order)
+        self._codes = []                    # id -> code
+        self._records = []                  # id -> immutable Course, filled on demand
+
+    @classmethod
+    def from_json(cls, path=None, lazy_descriptions=True, overlay=None):
+        """
+        Parse a data.json style file into a catalog.
+        With lazy_descriptions the "description" fields are moved out of the
+        course records; pass False to get the file back unchanged (e.g. to rewrite it).
+        `overlay` ({code: {field: value}}) is applied on top of the records.
+        """
+        path = path or DEFAULT_CATALOG_PATH
+        with open(path, "r", encoding="utf-8") as f:
+            courses = json.load(f)
+        for code, patch in (overlay or {}).items():
+            if code in courses:
+                courses[code].update(patch)
+        # Each distinct prereq string is parsed once, here
+        trees = {code: prereq_tree(course.get("prereqs") or "") for code, course in courses.items()}
+        cliques = maximal_cliques(overlap_graph(courses))
+        if not lazy_descriptions:
+            return cls(courses, path, prereq_trees=trees.get, overlap_cliques=lambda: cliques)
+        descriptions = {code: course.pop("description", "") for code, course in courses.items()}
+        return cls(courses, path, descriptions.get, trees.get, lambda: cliques)
+
+    @classmethod
+    def from_snapshot(cls, path=None, rebuild=True, overlay=None):
+        """
+        Open the memory-mapped binary snapshot of `path` (see catalog_snapshot.py).
+        A missing or stale snapshot is rebuilt from the JSON when `rebuild` is set,
+        otherwise the JSON is parsed directly. The tracked data.py is left alone;
+        only `python catalog_snapshot.py` regenerates it.
+        The snapshot always holds the untouched base catalog; `overlay` is applied
+        as records are loaded.
+        """
+        path = path or DEFAULT_CATALOG_PATH
+        snapshot = snapshot_path_for(path)
+        if not is_fresh(snapshot, path):
+            if not rebuild:
+                return cls.from_json(path, overlay=overlay)
+            catalog = cls.from_json(path, lazy_descriptions=False)
+            try:
+                build_snapshot(path, snapshot, catalog.courses)
+            except OSError:
+                return cls.from_json(path, overlay=overlay)     # read-only checkout: keep the parsed JSON
+        courses = SnapshotCourses(snapshot, overlay)
+        return cls(courses, path, courses.description, courses.prereq_tree, courses.overlap_cliques)
+
+    def get(self, code, default=None):
+        """O(1) lookup by course code"""
+        return self.courses.get(code, default)
+
+    def id_of(self, code):
+        """Dense integer id of a course code (None if unknown)"""
+        if self._ids is None:
+            self._codes = list(self.courses)
+            self._ids = {code: i for i, code in enumerate(self._codes)}
+            self._records = [None] * len(self._codes)
+        return self._ids.get(code)
+
+    def record(self, code):
+        """Immutable Course record for a catalog code (shared, never mutated)"""
+        cid = self.id_of(code)
+        if cid is None:
+            raise KeyError(code)
+        if self._records[cid] is None:
+            data = {**self.courses[code], "prereqs_parsed": self.prereq_tree(code)}
+            self._records[cid] = Course.from_dict(cid, data)
+        return self._records[cid]
+
+    def extra_record(self, data):
+        """
+        Record for a course missing from data.json (e.g. only listed in minors.json).
+        It gets the next free id, so ids stay dense and unique per process.
+        """
+        cid = self.id_of(data["code"])
+        if cid is None:
+            cid = len(self._codes)
+            self._ids[data["code"]] = cid
+            self._codes.append(data["code"])
+            data = {**data, "prereqs_parsed": prereq_tree(data.get("prereqs") or "")}
+            self._records.append(Course.from_dict(cid, data))
+        return self._records[cid]
+
+    def adopt(self, record):
+        """
+        A record made by another process (e.g. loaded from the artifact cache)
+        with this catalog's id: a course missing from data.json is registered
+        as by extra_record(), since its id only held in the process that made it.
+        """
+        cid = self.id_of(record.code)
+        if cid is None:
+            data = {key: value for key, value in record.to_dict().items()
+                    if key not in ("type", "minor_name", "prereqs_parsed")}
+            cid = self.extra_record(data).id
+        return record if record.id == cid else record.tagged(record.type, id=cid)
+
+    def record_by_id(self, cid):
+        """Course record for a dense id"""
+        if self._ids is None:
+            self.id_of("")
+        return self._records[cid] or self.record(self._codes[cid])
+
+    def _build_prefix_index(self):
+        """
+        Flattened trie: every prefix of every code maps to the codes under it,
+        in catalog order. Built once, so match() never scans the catalog.
+        """
+        index = {}
+        for code in self.courses:
+            for end in range(len(code) + 1):
+                index.setdefault(code[:end], []).append(code)
+        self._prefix_index = index
+
+    def match(self, pattern):
+        """
+        Codes matching a bucket pattern, in catalog order.
+        "HUL2XX" / "ELL3XX" - X is a wildcard digit
+        "ELL"               - department prefix
+        Runs in time proportional to the result size.
+        """
+        if self._prefix_index is None:
+            self._build_prefix_index()
+
+        # The literal prefix ends at the first wildcard after the department letters
+        cut = len(pattern)
+        for i in range(DEPT_CODE_LEN, len(pattern)):
+            if pattern[i] == WILDCARD:
+                cut = i
+                break
+        codes = self._prefix_index.get(pattern[:cut], [])
+
+        rest = pattern[cut:]
+        if rest.strip(WILDCARD):
+            # Literal characters after a wildcard (e.g. "ELL3X1"): filter the bucket
+            return [
+                code for code in codes
+                if len(code) >= len(pattern)
+                and all(p == WILDCARD or p == ch for p, ch in zip(rest, code[cut:]))
+            ]
+        return list(codes)
+
+    def prereq_tree(self, code):
+        """Prereq tree of a catalog course, parsed when the catalog was built (None if none)"""
+        if self._prereq_trees is None:
+            trees = {code: prereq_tree(course.get("prereqs") or "") for code, course in self.courses.items()}
+            self._prereq_trees = trees.get
+        return self._prereq_trees(code)
+
+    def overlap_cliques(self):
+        """
+        Maximal cliques of mutually overlapping course codes (see overlaps.py),
+        built with the catalog. At most one course of a clique counts in a plan.
+        """
+        if self._overlap_cliques is None:
+            cliques = maximal_cliques(overlap_graph(self.courses))
+            self._overlap_cliques = lambda: cliques
+        return self._overlap_cliques()
+
+    def description(self, code):
+        """Course description, fetched by code only when a caller asks for it"""
+        if code not in self.courses:
+            return None
+        if self._descriptions is None:
+            return self.courses[code].get("description", "")
+        return self._descriptions(code) or ""
+
+    def codes(self):
+        return self.courses.keys()
+
+    def items(self):
+        return self.courses.items()
+
+    def values(self):
+        return self.courses.values()
+
+    def __getitem__(self, code):
+        return self.courses[code]
+
+    def __contains__(self, code):
+        return code in self.courses
+
+    def __iter__(self):
+        return iter(self.courses)
+
+    def __len__(self):
+        return len(self.courses)
+
+
+_catalogs = {}      # (absolute path, overlay path) -> CourseCatalog, one per process
+
+
+def get_catalog(path=None, term=LATEST_OVERLAY):
+    """
+    Return the shared catalog for `path`, loading it on first use.
+    The timetable overlay for `term` (newest by default, None for the bare
+    data.json) is applied on top. `path` defaults to DEFAULT_CATALOG_PATH.
+    """
+    overlay_file = overlay_path(term)
+    key = (os.path.abspath(path or DEFAULT_CATALOG_PATH), overlay_file)
+    if key not in _catalogs:
+        catalog = CourseCatalog.from_snapshot(key[0], overlay=load_overlay(overlay_file))
+        catalog.overlay_path = overlay_file
+        _catalogs[key] = catalog
+    return _catalogs[key]
+
+
+def clear_catalog_cache():
+    """Forget loaded catalogs (e.g. after data.json was rewritten)"""
+    _catalogs.clear()
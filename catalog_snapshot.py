@@ -0,0 +1,304 @@
+"""
+Compact binary snapshot of data.json, opened with mmap.
+
+Layout (little endian, every section padded to 4 bytes):
+
+    header   MAGIC, version, course count, source size/mtime, section offsets
+    credits  float32[n]
+    hours    uint8[n * 3]              lecture, tutorial, practical
+    flags    uint8[n]                  FLAG_* bits
+    offsets  uint32[n * len(FIELDS) + 1] start of every string in the blob
+    blob     utf-8 strings, FIELDS order per course
+    tree ids uint32[n]                 index into the prereq trees (0 = no prereqs)
+    derived  pickled {"prereq_trees": [tree per distinct prereq string],
+                      "overlap_cliques": [maximal cliques of the overlap graph]}
+
+Build it with `python catalog_snapshot.py` (get_catalog() also rebuilds it
+automatically when data.json is newer). Prerequisites are parsed here, once
+per distinct string, and the overlap field is turned into maximal cliques, so
+loading a catalog never runs the parsers. Worker processes that open the same
+snapshot share one page-cached copy instead of each holding a dict tree.
+
+`python catalog_snapshot.py` also regenerates data.py, a fast-import module
+that only lists the course codes and hands out records from the snapshot on
+first access. data.py is tracked, so only that explicit step writes it.
+"""
+import json
+import mmap
+import os
+import pickle
+import struct
+from collections.abc import Mapping
+
+from fileio import atomic_write, file_sha256
+from overlaps import maximal_cliques, overlap_graph
+from prereqs import prereq_tree
+
+MAGIC = b"DPCATLG\0"
+VERSION = 3
+HEADER = struct.Struct("<8sIIQq7I")     # magic, version, n, src size, src mtime_ns, 7 section offsets
+FIELDS = ("code", "name", "prereqs", "overlap", "description", "slot")
+HOURS = ("lecture", "tutorial", "practical")
+
+FLAG_HAS_SLOT = 1       # course has a "slot" key
+FLAG_INT_CREDITS = 2    # credits were an int in data.json (keeps round trips exact)
+FLAG_NULL_SLOT = 4      # "slot" is present but null
+
+
+def snapshot_path_for(json_path):
+    """data.json -> data.catalog"""
+    return os.path.splitext(json_path)[0] + ".catalog"
+
+
+def data_module_path_for(json_path):
+    """data.json -> data.py"""
+    return os.path.splitext(json_path)[0] + ".py"
+
+
+DATA_MODULE_TEMPLATE = '''# Generated from {source} by catalog_snapshot.py - do not edit by hand.
+# Run `python catalog_snapshot.py` after changing {source}.
+"""
+Fast-import view of {source}: importing this module only builds the code list.
+`courses` is the shared catalog mapping and loads each record on first access
+by code (see catalog.get_catalog).
+"""
+
+SOURCE = "{source}"
+SOURCE_SHA256 = "{sha256}"
+
+CODES = (
+{codes}
+)
+
+
+def __getattr__(name):
+    if name == "courses":
+        from catalog import get_catalog
+        return get_catalog().courses
+    raise AttributeError(f"module {{__name__!r}} has no attribute {{name!r}}")
+'''
+
+
+def write_data_module(json_path, courses, out_path=None):
+    """
+    Regenerate data.py from data.json. The file is only rewritten when its
+    content changes, so rebuilding from an unchanged catalog leaves git clean.
+    Returns True if the module was written.
+    """
+    out_path = out_path or data_module_path_for(json_path)
+    sha256 = file_sha256(json_path)
+
+    codes = list(courses)
+    lines = []
+    for i in range(0, len(codes), 8):
+        lines.append("    " + " ".join(f'"{code}",' for code in codes[i:i + 8]))
+    text = DATA_MODULE_TEMPLATE.format(
+        source=os.path.basename(json_path), sha256=sha256, codes="\n".join(lines)
+    )
+
+    try:
+        with open(out_path, "r", encoding="utf-8") as f:
+            if f.read() == text:
+                return False
+    except OSError:
+        pass
+    with atomic_write(out_path, "w", encoding="utf-8") as f:
+        f.write(text)
+    return True
+
+
+def _pad(buf):
+    buf.extend(b"\0" * (-len(buf) % 4))
+
+
+def build_snapshot(json_path, out_path=None, courses=None):
+    """
+    Compile a data.json style catalog into a binary snapshot.
+    `courses` can be passed if the JSON is already loaded.
+    Returns the snapshot path.
+    """
+    out_path = out_path or snapshot_path_for(json_path)
+    if courses is None:
+        with open(json_path, "r", encoding="utf-8") as f:
+            courses = json.load(f)
+
+    n = len(courses)
+    credits = bytearray()
+    hours = bytearray()
+    flags = bytearray()
+    offsets = [0]
+    blob = bytearray()
+    tree_ids = []
+    trees = [None]          # id 0: no prereqs
+    tree_id_of = {}         # prereq string -> tree id, so each distinct string is parsed once
+
+    for code, course in courses.items():
+        credits += struct.pack("<f", course.get("credits", 0))
+        for key in HOURS:
+            value = course.get("hours", {}).get(key, 0)
+            if not 0 <= value <= 255:
+                raise ValueError(f"{code}: {key} hours {value} does not fit the snapshot format")
+            hours.append(int(value))
+
+        flag = 0
+        if "slot" in course:
+            flag |= FLAG_HAS_SLOT
+            if course["slot"] is None:
+                flag |= FLAG_NULL_SLOT
+        if isinstance(course.get("credits", 0), int):
+            flag |= FLAG_INT_CREDITS
+        flags.append(flag)
+
+        for field in FIELDS:
+            value = course.get(field) or ""
+            if field == "code":
+                value = code
+            blob += value.encode("utf-8")
+            offsets.append(len(blob))
+
+        prereqs = course.get("prereqs") or ""
+        if prereqs not in tree_id_of:
+            tree = prereq_tree(prereqs)
+            tree_id_of[prereqs] = 0 if tree is None else len(trees)
+            if tree is not None:
+                trees.append(tree)
+        tree_ids.append(tree_id_of[prereqs])
+
+    derived = {"prereq_trees": trees, "overlap_cliques": maximal_cliques(overlap_graph(courses))}
+
+    body = bytearray()
+    sections = []
+    parts = (
+        credits, hours, flags, struct.pack(f"<{len(offsets)}I", *offsets), blob,
+        struct.pack(f"<{n}I", *tree_ids), pickle.dumps(derived, protocol=pickle.HIGHEST_PROTOCOL),
+    )
+    for part in parts:
+        sections.append(HEADER.size + len(body))
+        body += part
+        _pad(body)
+
+    stat = os.stat(json_path)
+    header = HEADER.pack(MAGIC, VERSION, n, stat.st_size, stat.st_mtime_ns, *sections)
+
+    with atomic_write(out_path, "wb") as f:
+        f.write(header)
+        f.write(body)
+    return out_path
+
+
+def is_fresh(snapshot_path, json_path):
+    """True if the snapshot exists and was built from the current data.json"""
+    try:
+        with open(snapshot_path, "rb") as f:
+            magic, version, _, size, mtime_ns, *_ = HEADER.unpack(f.read(HEADER.size))
+        stat = os.stat(json_path)
+    except (OSError, struct.error):
+        return False
+    return (magic == MAGIC and version == VERSION
+            and size == stat.st_size and mtime_ns == stat.st_mtime_ns)
+
+
+class SnapshotCourses(Mapping):
+    """
+    Read-only code -> course dict mapping over a memory-mapped snapshot.
+    Course dicts are only built for the codes that are actually accessed,
+    and never carry the description (use description(code) for that).
+    prereq_tree(code) and overlap_cliques() serve what was derived at build time.
+    `overlay` ({code: {field: value}}) is applied as each record is built.
+    """
+
+    def __init__(self, path, overlay=None):
+        with open(path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, n, _, _, credits_at, hours_at, flags_at, offsets_at, blob_at, tree_ids_at, derived_at = \
+            HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} is not a version {VERSION} course snapshot")
+
+        view = memoryview(self._mm)
+        n_strings = n * len(FIELDS)
+        self._credits = view[credits_at:credits_at + 4 * n].cast("f")
+        self._hours = view[hours_at:hours_at + 3 * n]
+        self._flags = view[flags_at:flags_at + n]
+        self._offsets = view[offsets_at:offsets_at + 4 * (n_strings + 1)].cast("I")
+        self._blob_at = blob_at
+        self._tree_ids = view[tree_ids_at:tree_ids_at + 4 * n].cast("I")
+        self._derived_at = derived_at
+        self._derived = None        # unpickled on first use
+        self._overlay = overlay or {}
+        self._cache = {}
+
+        # Only the code column is decoded up front; it backs the O(1) index
+        self._index = {self._string(i, 0): i for i in range(n)}
+
+    def _string(self, i, field):
+        k = i * len(FIELDS) + field
+        start = self._blob_at + self._offsets[k]
+        end = self._blob_at + self._offsets[k + 1]
+        return self._mm[start:end].decode("utf-8")
+
+    def _materialize(self, i):
+        flag = self._flags[i]
+        credits = self._credits[i]
+        course = {
+            "code": self._string(i, 0),
+            "name": self._string(i, 1),
+            "prereqs": self._string(i, 2),
+            "overlap": self._string(i, 3),
+            "credits": int(credits) if flag & FLAG_INT_CREDITS else credits,
+            "hours": {key: self._hours[3 * i + j] for j, key in enumerate(HOURS)},
+        }
+        if flag & FLAG_HAS_SLOT:
+            course["slot"] = None if flag & FLAG_NULL_SLOT else self._string(i, 5)
+        patch = self._overlay.get(course["code"])
+        if patch:
+            course.update(patch)
+        return course
+
+    def description(self, code):
+        """Decode one course description straight from the mapped blob"""
+        return self._string(self._index[code], 4)
+
+    def prereq_tree(self, code):
+        """Parsed prereq tree of a course (None if it has none)"""
+        patch = self._overlay.get(code)
+        if patch and "prereqs" in patch:
+            return prereq_tree(patch["prereqs"])
+        return self._derived_table()["prereq_trees"][self._tree_ids[self._index[code]]]
+
+    def overlap_cliques(self):
+        """Maximal cliques of overlapping course codes"""
+        return self._derived_table()["overlap_cliques"]
+
+    def _derived_table(self):
+        if self._derived is None:
+            self._derived = pickle.loads(self._mm[self._derived_at:])
+        return self._derived
+
+    def __getitem__(self, code):
+        course = self._cache.get(code)
+        if course is None:
+            course = self._materialize(self._index[code])   # KeyError for unknown codes
+            self._cache[code] = course
+        return course
+
+    def __contains__(self, code):
+        return code in self._index
+
+    def __iter__(self):
+        return iter(self._index)
+
+    def __len__(self):
+        return len(self._index)
+
+
+if __name__ == "__main__":
+    from catalog import DEFAULT_CATALOG_PATH
+
+    with open(DEFAULT_CATALOG_PATH, "r", encoding="utf-8") as f:
+        all_courses = json.load(f)
+    out = build_snapshot(DEFAULT_CATALOG_PATH, courses=all_courses)
+    print(f"✅ Snapshot written to '{out}' ({os.path.getsize(out)} bytes)")
+    if write_data_module(DEFAULT_CATALOG_PATH, all_courses):
+        print(f"✅ Regenerated '{data_module_path_for(DEFAULT_CATALOG_PATH)}'")
@@ -0,0 +1,35 @@
+"""
+Keep test runs out of the working tree: the tests load a copy of data.json in
+a temp dir (so its data.catalog snapshot is built there), and the artifact
+cache lives next to it instead of in .plan_cache.
+
+This is done in pytest_configure rather than a fixture because some test
+modules load the catalog at import time.
+"""
+import os
+import shutil
+import tempfile
+
+import pytest
+
+import artifact_cache
+import catalog
+
+_patch = pytest.MonkeyPatch()
+_tmp_dir = None
+
+
+def pytest_configure(config):
+    global _tmp_dir
+    _tmp_dir = tempfile.mkdtemp(prefix="planner-tests-")
+    data_json = os.path.join(_tmp_dir, "data.json")
+    shutil.copy(catalog.DEFAULT_CATALOG_PATH, data_json)
+    _patch.setattr(catalog, "DEFAULT_CATALOG_PATH", data_json)
+    _patch.setattr(artifact_cache, "CACHE_DIR", os.path.join(_tmp_dir, ".plan_cache"))
+    catalog.clear_catalog_cache()
+
+
+def pytest_unconfigure(config):
+    _patch.undo()
+    catalog.clear_catalog_cache()
+    shutil.rmtree(_tmp_dir, ignore_errors=True)
@@ -0,0 +1,101 @@
+import sys
+
+
+class Course:
+    """
+    Immutable course record.
+
+    `id` is a dense integer assigned by the catalog (catalog order), `code` is an
+    interned string. Planning tags (type, minor_name, prereqs_parsed) are set
+    through tagged(), which returns a new record, so records shared between
+    semesters and students are never mutated.
+
+    Supports the read-only dict style access the planner and UserData use
+    (course["code"], course.get("type", "")); to_dict() gives the JSON form.
+    """
+
+    __slots__ = (
+        "id", "code", "name", "credits", "lecture", "tutorial", "practical",
+        "prereqs", "overlap", "slot", "timetable",
+        "type", "minor_name", "prereqs_parsed",
+    )
+
+    def __init__(self, id, code, name="", credits=0, lecture=0, tutorial=0, practical=0,
+                 prereqs="", overlap="", slot=None, timetable=None,
+                 type=None, minor_name=None, prereqs_parsed=None):
+        values = {
+            "id": id, "code": sys.intern(code), "name": name, "credits": credits,
+            "lecture": lecture, "tutorial": tutorial, "practical": practical,
+            "prereqs": prereqs, "overlap": overlap, "slot": slot, "timetable": timetable,
+            "type": type, "minor_name": minor_name, "prereqs_parsed": prereqs_parsed,
+        }
+        for key, value in values.items():
+            object.__setattr__(self, key, value)
+
+    @classmethod
+    def from_dict(cls, id, data):
+        """Build a record from a data.json style course dict"""
+        hours = data.get("hours", {})
+        return cls(
+            id, data["code"], data.get("name", ""), data.get("credits", 0),
+            hours.get("lecture", 0), hours.get("tutorial", 0), hours.get("practical", 0),
+            data.get("prereqs", ""), data.get("overlap", ""), data.get("slot"), data.get("timetable"),
+            data.get("type"), data.get("minor_name"), data.get("prereqs_parsed"),
+        )
+
+    def tagged(self, type, **changes):
+        """Copy of this record with a planning type (and any other field) set"""
+        values = {key: getattr(self, key) for key in self.__slots__}
+        values["type"] = type
+        values.update(changes)
+        return Course(**values)
+
+    @property
+    def hours(self):
+        return {"lecture": self.lecture, "tutorial": self.tutorial, "practical": self.practical}
+
+    def to_dict(self):
+        """JSON form, same keys as data.json plus the planning tags that are set"""
+        data = {
+            "code": self.code,
+            "name": self.name,
+            "prereqs": self.prereqs,
+            "overlap": self.overlap,
+            "credits": self.credits,
+            "hours": self.hours,
+        }
+        for key in ("slot", "timetable", "prereqs_parsed", "type", "minor_name"):
+            value = getattr(self, key)
+            if value is not None:
+                data[key] = value
+        return data
+
+    # Read-only dict style access
+    def get(self, key, default=None):
+        value = getattr(self, key, None) if key in self.__slots__ or key == "hours" else None
+        return default if value is None else value
+
+    def __getitem__(self, key):
+        if key not in self.__slots__ and key != "hours":
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __setattr__(self, key, value):
+        raise AttributeError(f"Course records are immutable (use tagged() to change '{key}')")
+
+    def __delattr__(self, key):
+        raise AttributeError("Course records are immutable")
+
+    def __reduce__(self):
+        return (Course, tuple(getattr(self, key) for key in self.__slots__))
+
+    def __eq__(self, other):
+        if not isinstance(other, Course):
+            return NotImplemented
+        return all(getattr(self, key) == getattr(other, key) for key in self.__slots__)
+
+    def __hash__(self):
+        return hash((self.id, self.type))
+
+    def __repr__(self):
+        return f"Course({self.id}, {self.code!r}, type={self.type!r})"
@@ -0,0 +1,36 @@
+"""
+File helpers shared by the catalog, its snapshot, the artifact cache and the
+slotting scripts.
+"""
+import contextlib
+import hashlib
+import os
+
+
+@contextlib.contextmanager
+def atomic_write(path, mode="w", encoding=None):
+    """
+    Write `path` through a temp file that is swapped in when the block ends,
+    so readers and concurrent runs never see a half-written file. If the
+    block raises, `path` is left as it was.
+
+        with atomic_write(path, "wb") as f:
+            pickle.dump(obj, f)
+    """
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, mode, encoding=encoding) as f:
+            yield f
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def file_sha256(path):
+    """sha256 of a file's contents, read in 1 MB chunks"""
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
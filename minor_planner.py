@@ -1,15 +1,18 @@
 import json
+import os
+from catalog import BASE_DIR, get_catalog
+
+MINORS_PATH = os.path.join(BASE_DIR, "minors.json")
 
 class MinorPlanner:
-    def __init__(self, minors_json_path="minors.json", all_courses_path="data.json"):
+    def __init__(self, minors_json_path=MINORS_PATH, all_courses_path=None, catalog=None):
         """Initialize minor planner with minors data AND full course catalog"""
         with open(minors_json_path, "r",encoding="utf-8") as f:
             self.minors_data = json.load(f)                   # Load minors data from minors.json into python dictionary
         self.minors = self.minors_data["minors"]
         
-        # Load data.json to get prerequisites
-        with open(all_courses_path, "r",encoding="utf-8") as f:
-            self.all_courses = json.load(f)
+        # Shared catalog (data.json) to get prerequisites - parsed once per process
+        self.all_courses = catalog if catalog is not None else get_catalog(all_courses_path)
     
     def list_available_minors(self):
         """List all available minors"""
@@ -50,6 +53,23 @@ class MinorPlanner:
 
 
     
+    def get_course_record(self, course):
+        """Catalog record for a minors.json course entry, falling back to the minors.json data"""
+        code = course["code"]
+        if code in self.all_courses:
+            return self.all_courses.record(code)
+        return self.all_courses.extra_record({
+            "code": code,
+            "name": course.get("name", ""),
+            "credits": course.get("credits", 0),
+            "prereqs": "",
+            "hours": {
+                "lecture": course.get("lecture", 0),
+                "tutorial": course.get("tutorial", 0),
+                "practical": course.get("practical", 0)
+            }
+        })
+
     def get_minor_courses_with_full_data(self, minor_name):
         """
         Get minor courses WITH prerequisites from data.json
@@ -67,52 +87,17 @@ class MinorPlanner:
         
         # Process core courses
         for course in minor.get("core_courses", []):         # Iterate over each core course in the minor
-            code = course["code"]
-            
-            # Get full data from data.json if available
-            if code in self.all_courses:
-                full_course = self.all_courses[code].copy()   # Make a copy of the course dictionary from all_courses
-            else:
-                # Fallback to minors.json data
-                full_course = {
-                    "code": code,
-                    "name": course.get("name", ""),
-                    "credits": course.get("credits", 0),
-                    "prereqs": "",
-                    "hours": {
-                        "lecture": course.get("lecture", 0),
-                        "tutorial": course.get("tutorial", 0),
-                        "practical": course.get("practical", 0)
-                    }
-                }
+            # Get full data from data.json if available (shared immutable record)
+            base = self.get_course_record(course)
             
-            # Tag as minor course
-            full_course["type"] = "Minor_Core"                # Tag course type as Minor_Core
-            full_course["minor_name"] = minor_name            # Add minor name for reference
+            # Tag as minor course (tagged() returns a new record, the shared one is untouched)
+            full_course = base.tagged("Minor_Core", minor_name=minor_name)     # Tag course type as Minor_Core, add minor name for reference
             result['core'].append(full_course)                  # Append to core courses list
         
         # Process elective courses
         for course in minor.get("elective_courses", []):
-            code = course["code"]
-            
-            if code in self.all_courses:
-                full_course = self.all_courses[code].copy()
-            else:
-                full_course = {
-                    "code": code,
-                    "name": course.get("name", ""),
-                    "credits": course.get("credits", 0),
-                    "prereqs": "",
-                    "hours": {
-                        "lecture": course.get("lecture", 0),
-                        "tutorial": course.get("tutorial", 0),
-                        "practical": course.get("practical", 0)
-                    }
-                }
-            
-            full_course["type"] = "Minor_Elective"
-            full_course["minor_name"] = minor_name
-            full_course["scheduled"] = False
+            base = self.get_course_record(course)
+            full_course = base.tagged("Minor_Elective", minor_name=minor_name)
             result['elective'].append(full_course)
         
         return result
@@ -172,11 +157,11 @@ class MinorPlanner:
 
 
     def add_minor_to_courses_left(self, minor_name, courses_left, program_courses, 
-                                  current_semester, parse_prereqs_func):
+                                  current_semester):
         """
         Add minor courses to courses_left for planning
         - Excludes overlapping courses
-        - Parses prereqs using your parse_prereqs function
+        - Prereqs come already parsed on the catalog records (prereqs_parsed)
         - Adds to all future semesters
         
         Returns:
@@ -203,33 +188,22 @@ class MinorPlanner:
         # Add non-overlapping courses to future semesters
         courses_added = 0
         
+        to_add = [
+            course
+            for course in minor_courses['core'] + minor_courses['elective']   # core first, then electives
+            if course["code"] in overlap_info['non_overlapping_codes']         # Only add if not overlapping
+        ]
+        
         for sem in range(current_semester, 9):
             if sem not in courses_left:                                     # Initialize semester if not present
                 courses_left[sem] = []
             
-            # Add core courses (non-overlapping only)
-            for course in minor_courses['core']:
-                if course["code"] in overlap_info['non_overlapping_codes']: # Only add if not overlapping
-                    # Parse prereqs using your function
-                    prereq_string = course.get("prereqs", "")
-                    course["prereqs_parsed"] = parse_prereqs_func(prereq_string)
-                    
-                    # Add if not duplicate
-                    if not any(c["code"] == course["code"] for c in courses_left[sem]):     # Check for duplicates before adding to semester
-                        courses_left[sem].append(course)
-                        if sem == current_semester:
-                            courses_added += 1
-            
-            # Add elective courses (non-overlapping only)
-            for course in minor_courses['elective']:
-                if course["code"] in overlap_info['non_overlapping_codes']:
-                    prereq_string = course.get("prereqs", "")
-                    course["prereqs_parsed"] = parse_prereqs_func(prereq_string)
-                    
-                    if not any(c["code"] == course["code"] for c in courses_left[sem]):
-                        courses_left[sem].append(course)
-                        if sem == current_semester:
-                            courses_added += 1
+            for course in to_add:
+                # Add if not duplicate
+                if not any(c["code"] == course["code"] for c in courses_left[sem]):     # Check for duplicates before adding to semester
+                    courses_left[sem].append(course)
+                    if sem == current_semester:
+                        courses_added += 1
         
         print(f"\n✅ Added {courses_added} unique minor courses to semester {current_semester}")
         print(f"   (Available in all semesters {current_semester}-8)")
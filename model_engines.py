@@ -0,0 +1,981 @@
+"""
+CP-SAT model builders ("engines") for a student's remaining semesters.
+
+Every engine takes the same inputs and returns (model, course_vars, info):
+course_vars maps (semester, course id) to a literal that is true iff the course
+is taken in that semester, so solution read-out and printing do not depend on
+the engine; info carries the credit bookkeeping the planner prints.
+
+    "bool"  one BoolVar per (semester, course) - the original encoding
+    "int"   one optional "semester taken" IntVar per course (see build_int_model)
+
+Pick one with CONFIG["MODEL_ENGINE"]; benchmark_engines.py compares them.
+"""
+from ortools.sat.python import cp_model
+
+from prereqs import compile_prereqs, semester_windows
+from timetable import clash_groups, planning_mask, slot_masks
+
+
+def restrict_to_windows(courses_left, user):
+    """
+    Presolve: keep each course only in the semesters of its prerequisite window
+    (prereqs.semester_windows). Returns (courses_left, codes with no feasible semester).
+    Both engines expect this: the bool engine relies on it for courses whose
+    prereqs cannot have been scheduled yet.
+    """
+    completed_codes = set(user.completed_corecourses) | set(user.completed_hul) | set(user.completed_DE)
+    planned_trees = {course.code: course.prereqs_parsed for courses in courses_left.values() for course in courses}
+    core_codes = {course.code for courses in courses_left.values() for course in courses if course.type == "Core"}
+    windows = semester_windows(planned_trees, completed_codes, core_codes, min(courses_left), max(courses_left))
+
+    courses_left = {
+        sem: [course for course in courses if windows[course.code][0] <= sem <= windows[course.code][1]]
+        for sem, courses in courses_left.items()
+    }
+    unschedulable = sorted(code for code, (earliest, latest) in windows.items() if earliest > latest)
+    return courses_left, unschedulable
+
+
+def missing_core(courses_left, unschedulable):
+    """
+    The Core codes among restrict_to_windows()'s unschedulable ones (courses_left
+    as passed to it). Pass them to the engine as missing_core: they are gone
+    from the windowed courses_left, and a plan must not drop them silently.
+    """
+    core_codes = {course.code for courses in courses_left.values() for course in courses if course.type == "Core"}
+    return [code for code in unschedulable if code in core_codes]
+
+
+def overlap_constraints(courses_left, user, all_courses):
+    """
+    The catalog's overlap cliques restricted to the plan: (ruled_out, at_most_one).
+    A clique member that is completed or Core is taken anyway, so the other
+    planned members of its clique are ruled out (Core itself never is);
+    otherwise at most one planned member of the clique can be taken.
+    """
+    completed_codes = set(user.completed_corecourses) | set(user.completed_hul) | set(user.completed_DE)
+    planned = {course.code: course for courses in courses_left.values() for course in courses}
+
+    ruled_out = set()
+    at_most_one = []
+    for clique in all_courses.overlap_cliques():
+        members = [planned[code] for code in clique if code in planned]
+        taken_anyway = any(code in completed_codes for code in clique) or any(c.type == "Core" for c in members)
+        if taken_anyway:
+            ruled_out.update(c.id for c in members if c.type != "Core")
+        elif len(members) > 1:
+            at_most_one.append(sorted(c.id for c in members))
+    return sorted(ruled_out), at_most_one
+
+
+def course_index(courses_left, scale):
+    """
+    ({(sem, course id): course}, {course id: credits * scale as int}) - built once,
+    so constraint passes and solution read-out look courses up in O(1).
+    """
+    course_at = {}
+    scaled_credits = {}
+    for sem, courses in courses_left.items():
+        for course in courses:
+            course_at[(sem, course.id)] = course
+            scaled_credits[course.id] = int(course.credits * scale)
+    return course_at, scaled_credits
+
+
+def completed_credits(user):
+    """(all completed program credits, completed HUL credits, completed DE credits)"""
+    credits_done = 0
+    seen_courses = set()
+
+    for sem, courses in user.EE_courses.items():
+        for course in courses:
+            code = course["code"]
+            if code in seen_courses:
+                continue
+
+            if code in user.completed_corecourses or code in user.completed_hul or code in user.completed_DE:
+                credits_done += course["credits"]
+                seen_courses.add(code)
+
+    hul_credits_done = sum(
+        course["credits"] for sem, courses in user.EE_courses.items()
+        for course in courses
+        if course["code"] in user.completed_hul
+    )
+    de_credits_done = sum(
+        course["credits"] for sem, courses in user.EE_courses.items()
+        for course in courses
+        if course["code"] in user.completed_DE
+    )
+    return credits_done, hul_credits_done, de_credits_done
+
+
+def add_hints(model, course_vars, course_at, preferred, complete=False, strategy=False):
+    """
+    Warm start: hint every course with a preferred semester ({code: sem}) into
+    its offered semester closest to it, and its other semesters to 0.
+    complete=True (a previous plan) also hints every other course slot to 0.
+    strategy=True adds a decision strategy that tries the hinted slots first,
+    in semester order. Returns the number of hinted courses.
+    """
+    slots = {}              # code -> [(sem, course id)]
+    for key in course_vars:
+        slots.setdefault(course_at[key].code, []).append(key)
+    chosen = set()
+    for code, sem in preferred.items():
+        if code in slots:
+            chosen.add(min(slots[code], key=lambda key: (abs(key[0] - sem), key[0])))
+
+    for key, var in course_vars.items():
+        if key in chosen:
+            model.AddHint(var, 1)
+        elif complete or course_at[key].code in preferred:
+            model.AddHint(var, 0)
+    if strategy and chosen:
+        model.AddDecisionStrategy([course_vars[key] for key in sorted(chosen)],
+                                  cp_model.CHOOSE_FIRST, cp_model.SELECT_MAX_VALUE)
+    return len(chosen)
+
+
+class StudentTerms:
+    """
+    What the bool model needs to know about the student, as constants:
+    completions, prerequisite gates and the scaled credit targets.
+    model_template.TemplateTerms gives the same terms as variables, so one
+    model serves every student of a department.
+    """
+
+    def __init__(self, model, user, config):
+        scale = config["CREDIT_SCALE"]
+        credits_done, hul_credits_done, de_credits_done = completed_credits(user)
+        self.completed = set(user.completed_corecourses) | set(user.completed_hul) | set(user.completed_DE)
+        self.min_load = user.min_credits * scale
+        self.credits_done = int(credits_done * scale)
+        self.credits_done_bounds = (self.credits_done, self.credits_done)
+        self.remaining = int((config["TOTAL_TARGET_CREDITS"] - credits_done) * scale)
+        self.hul_needed = int((config["MIN_HUL_CREDITS"] - hul_credits_done) * scale)
+        self.de_needed = int((config["MIN_DE_CREDITS"] - de_credits_done) * scale)
+
+    def done(self, code):
+        """True / False, or a literal: the course is completed"""
+        return code in self.completed
+
+    def clique_done(self, clique):
+        """True / False, or a literal: some course of an overlap clique is completed"""
+        return any(code in self.completed for code in clique)
+
+    def gated(self, course):
+        """False, or a literal that lifts prerequisites the student cannot meet in the plan at all"""
+        return False
+
+
+def build_bool_model(courses_left, user, config, all_courses, minor_req=None, guards=None, terms=StudentTerms,
+                     missing_core=()):
+    """
+    Bool engine: one BoolVar per (semester, course), e.g. ELL202_sem5.
+    The dictionary course_vars holds tuple: BoolVar pairs, e.g. (5, <ELL202 id>): BoolVar("ELL202_sem5");
+    courses are identified by their dense integer catalog id (course.id), not by code string.
+
+    guards: pass a dict to have every requirement (per semester / per course /
+    per credit bucket) enforced only under a guard literal, filled in as
+    {requirement text: literal} - see explain_infeasibility(). Course
+    uniqueness and the credit bookkeeping stay unguarded.
+
+    terms: factory (model, user, config) -> StudentTerms of the per-student
+    quantities; ModelTemplate passes one that makes them variables.
+
+    missing_core: Core codes with no feasible semester (see missing_core());
+    each is a "Core course X" requirement that cannot hold.
+    """
+    model = cp_model.CpModel()
+    terms = terms(model, user, config)
+    course_vars = {}
+
+    def guard(requirement):
+        """Enforcement literals of a requirement: [] unless guards are asked for"""
+        if guards is None:
+            return []
+        if requirement not in guards:
+            guards[requirement] = model.NewBoolVar(f"guard{len(guards)}")
+        return [guards[requirement]]
+
+    def guarded_at_most_one(literals, requirement):
+        if guards is None:
+            model.AddAtMostOne(literals)
+        else:
+            model.Add(sum(literals) <= 1).OnlyEnforceIf(guard(requirement))
+
+    # ============================================================
+    # CREATE ALL COURSE VARIABLES FIRST
+    # ============================================================
+    print("\n📋 Creating course variables...")
+    total_vars = 0
+    for sem, courses in courses_left.items():
+        for course in courses:
+            course_vars[(sem, course.id)] = model.NewBoolVar(f"{course.code}_sem{sem}")
+            total_vars += 1
+
+    print(f"✅ Created {total_vars} course variables across {len(courses_left)} semesters")
+    print(f"   Average {total_vars // len(courses_left)} variables per semester\n")
+
+    # Every pass below looks courses up here instead of scanning courses_left[sem]
+    course_at, scaled_credits = course_index(courses_left, config["CREDIT_SCALE"])
+
+    # ============================================================
+    # CONSTRAINT 1: SEMESTER CREDIT LIMITS WITH EXTENDED CREDITS
+    # ============================================================
+
+    print("="*70)
+    print("📋 CONSTRAINT 1: Semester Credit Limits (with Extended Credits)")
+    print("="*70)
+
+    extended_semester_vars = {}
+
+    for sem, courses in courses_left.items():
+        total_credits = 0
+
+        for course in courses:
+            total_credits += course_vars[(sem, course.id)] * scaled_credits[course.id]
+
+        # Minimum credits constraint
+        model.Add(total_credits >= terms.min_load).OnlyEnforceIf(
+            guard(f"at least {user.min_credits} credits in semester {sem}")
+        )
+
+        # Maximum credits with extended credit rules
+        if sem > 2:
+            max_credits = guard(f"at most 24 credits (26.5 extended) in semester {sem}")
+
+            # After semester 2, can use up to 26.5 credits
+            model.Add(total_credits <= int(26.5 * config["CREDIT_SCALE"])).OnlyEnforceIf(max_credits)
+
+            # Track if using extended credits
+            extended_semester_vars[sem] = model.NewBoolVar(f"extended_sem{sem}")
+
+            # If not using extended, max is 24
+            model.Add(total_credits <= 24 * config["CREDIT_SCALE"]).OnlyEnforceIf(
+                [extended_semester_vars[sem].Not()] + max_credits
+            )
+        else:
+            # Strict 24 limit for semesters 1-2
+            model.Add(total_credits <= 24 * config["CREDIT_SCALE"]).OnlyEnforceIf(
+                guard(f"at most 24 credits in semester {sem}")
+            )
+
+    # Maximum 2 semesters can use extended credits
+    if extended_semester_vars:
+        model.Add(sum(extended_semester_vars.values()) <= 2).OnlyEnforceIf(guard("at most 2 extended semesters"))
+        print(f"   ✅ Semester credit limits applied")
+        print(f"   ✅ At most 2 semesters can exceed 24 credits (up to 26.5)")
+
+    print("="*70 + "\n")
+
+    # ============================================================
+    # CONSTRAINT 2 (UPDATED): Total Credits with Flexibility
+    # Also update your CONSTRAINT 2 to allow some flexibility
+    # ============================================================
+
+    print("📋 CONSTRAINT 2: Total Credit Target (with flexibility)")
+
+    total_target_credits = config["TOTAL_TARGET_CREDITS"]
+
+    # Compute credits already completed
+    credits_done, hul_credits_done, de_credits_done = completed_credits(user)
+
+    print(f"   Credits completed: {credits_done}")
+    print(f"   Total target: {total_target_credits}")
+
+    # Target credits for remaining semesters
+    remaining_target_credits = int((total_target_credits - credits_done) * config["CREDIT_SCALE"])
+
+    # Create sum across all remaining semesters
+    total_remaining_credits = sum(var * scaled_credits[cid] for (sem, cid), var in course_vars.items())
+
+    # Allow small flexibility: 150-159 credits total
+    # This is because with discrete course credits, hitting exactly 150 might be impossible
+    total_credits_needed = guard(f"{remaining_target_credits / config['CREDIT_SCALE']} more credits (at most 9 over)")
+    model.Add(total_remaining_credits >= terms.remaining).OnlyEnforceIf(total_credits_needed)
+    model.Add(total_remaining_credits <= terms.remaining + int(9 * config["CREDIT_SCALE"])).OnlyEnforceIf(
+        total_credits_needed
+    )
+
+    print(f"   Remaining needed: {remaining_target_credits / config['CREDIT_SCALE']} credits")
+    print(f"   Allowed range: {remaining_target_credits / config['CREDIT_SCALE']}-{(remaining_target_credits + int(9 * config['CREDIT_SCALE'])) / config['CREDIT_SCALE']} credits")
+    print(f"   ✅ Some flexibility to account for discrete course credits\n")
+
+
+    # ============================================================
+    # VERIFICATION: Check feasibility with new limits
+    # ============================================================
+
+    print("🔍 Feasibility Check with Extended Credits:")
+
+    num_sems = len([s for s in courses_left.keys() if s > 2])  # Semesters after sem 2
+    num_extended_allowed = 2
+
+    # Calculate capacity
+    normal_sems = num_sems - num_extended_allowed  # Semesters with 24 limit
+    extended_sems = min(num_extended_allowed, num_sems)  # Semesters with 26.5 limit
+
+    min_possible = num_sems * user.min_credits
+    max_possible = (normal_sems * 24) + (extended_sems * 26.5)
+
+    target_needed = remaining_target_credits / config['CREDIT_SCALE']
+
+    print(f"   Semesters after sem 2: {num_sems}")
+    print(f"   Normal capacity: {normal_sems} × 24 = {normal_sems * 24}")
+    print(f"   Extended capacity: {extended_sems} × 26.5 = {extended_sems * 26.5}")
+    print(f"   Total capacity: {min_possible} - {max_possible} credits")
+    print(f"   Target needed: {target_needed} credits")
+
+    if target_needed > max_possible:
+        print(f"   ❌ STILL INFEASIBLE: Need {target_needed - max_possible} more credits!")
+        print(f"      → Consider: Reduce minor requirements or extend to more semesters")
+    else:
+        print(f"   ✅ FEASIBLE with extended credits")
+
+    print()
+     #sets the min credit limit instead of setting exact value like in previous lineconfig
+
+    #CONSTRAINT 3 
+    # max of 2 hul courses per sem 
+    for sem, courses in courses_left.items():
+        hul_vars = []
+        for course in courses:
+            if course.get("type", "").startswith("HUL"):
+                hul_vars.append(course_vars[(sem, course.id)])
+
+        # Constraint: sum of HUL course selection <= MAX_HUL_PER_SEM
+        if hul_vars:
+            model.Add(sum(hul_vars) <= config["MAX_HUL_PER_SEM"]).OnlyEnforceIf(
+                guard(f"at most {config['MAX_HUL_PER_SEM']} HUL courses in semester {sem}")
+            )
+
+    # CONSTRAINT 4: PREREQS SHOULD COME BEFORE ACTUAL COURSE
+    # The prereq tree (prereqs.py) is compiled straight to CP-SAT: one literal per
+    # and/or node instead of one path variable per combination of OR choices.
+    # A course leaf holds if the prereq is completed or taken in an earlier semester.
+    taken_before = {}       # (code, sem) -> literal / False: done or taken in some semester < sem
+
+
+    def prereq_taken_before(code, sem):
+        if (code, sem) not in taken_before:
+            cid = all_courses.id_of(code)
+            earlier = [course_vars[(s, cid)] for s in range(1, sem) if (s, cid) in course_vars]
+            done = terms.done(code)
+            if done is not False:
+                earlier.append(done)
+            if len(earlier) > 1:
+                literal = model.NewBoolVar(f"taken_{code}_before_sem{sem}")
+                model.AddBoolOr(earlier).OnlyEnforceIf(literal)
+                earlier = [literal]
+            taken_before[(code, sem)] = earlier[0] if earlier else False
+        return taken_before[(code, sem)]
+
+
+    # Earned credits (EC50, EC80 ...) use shared prefix sums: earned_before[sem] is the
+    # scaled credits completed before the plan plus those planned in semesters < sem,
+    # so every EC prereq is a single reified ">=" on one of these variables.
+    least_done, most_done = terms.credits_done_bounds
+    max_earned = most_done + sum(scaled_credits[cid] for (sem, cid) in course_vars)
+    earned_before = {}      # sem -> IntVar
+    previous_sem = None
+    for sem in sorted(courses_left):
+        earned_before[sem] = model.NewIntVar(least_done, max_earned, f"earned_before_sem{sem}")
+        if previous_sem is None:
+            model.Add(earned_before[sem] == terms.credits_done)
+        else:
+            model.Add(earned_before[sem] == earned_before[previous_sem] + sum(
+                course_vars[(previous_sem, course.id)] * scaled_credits[course.id]
+                for course in courses_left[previous_sem]
+            ))
+        previous_sem = sem
+
+    earned_at_least = {}    # (scaled threshold, sem) -> literal / constant
+
+
+    def prereq_earned_credits(credits, sem):
+        needed = int(credits * config["CREDIT_SCALE"])
+        if (needed, sem) not in earned_at_least:
+            if least_done >= needed:
+                earned_at_least[(needed, sem)] = True
+            else:
+                literal = model.NewBoolVar(f"earned_{credits}_before_sem{sem}")
+                model.Add(earned_before[sem] >= needed).OnlyEnforceIf(literal)
+                earned_at_least[(needed, sem)] = literal
+        return earned_at_least[(needed, sem)]
+
+
+    def prereq_leaf(node, sem):
+        kind, value = node
+        if kind == "credits":
+            return prereq_earned_credits(value, sem)
+        if kind != "course":
+            return True                 # permissions, minor areas, ... are not modelled
+        if terms.done(value) is True:
+            return True
+        return prereq_taken_before(value, sem)
+
+
+    prereq_memo = {}        # sem -> {tree node: literal}, shared by courses with the same prereqs
+    prereq_nodes = 0
+    for (sem, cid), var in course_vars.items():
+        course_data = course_at[(sem, cid)]
+        if course_data.prereqs_parsed is None:
+            continue
+
+        memo = prereq_memo.setdefault(sem, {})
+        before = len(memo)
+        satisfied = compile_prereqs(
+            model, course_data.prereqs_parsed, lambda node: prereq_leaf(node, sem), memo, f"pre_sem{sem}"
+        )
+        prereq_nodes += len(memo) - before
+
+        # If taking this course, its prerequisites must be met. Prereqs that cannot
+        # be met inside the plan at all (False) are left unconstrained, as before;
+        # so are those of a gated course (prereqs outside this student's plan).
+        if satisfied is not True and satisfied is not False:
+            gated = terms.gated(course_data)
+            if guards is None and gated is False:
+                model.AddImplication(var, satisfied)
+            else:
+                model.AddBoolOr([satisfied] + ([gated] if gated is not False else [])).OnlyEnforceIf(
+                    [var] + guard(f"prerequisites of {course_data.code}")
+                )
+
+    print(f"✅ Prerequisite constraints compiled ({prereq_nodes} expression nodes, "
+          f"{len(earned_at_least)} earned-credit thresholds)\n")
+
+
+    # Constraint 5 : every core course must be taken exactly once across the degree
+    # Constraint 5: Every course must be taken AT MOST once across the degree
+    # (Core courses exactly once, others at most once)
+
+    print("\n📋 Applying Constraint 5: Course Uniqueness")
+
+    # Group every course's variables in one pass, then one constraint per course
+    vars_by_course = {}
+    course_types = {}
+    course_codes = {}
+    for (sem, cid), var in course_vars.items():
+        vars_by_course.setdefault(cid, []).append(var)
+        course_types[cid] = course_at[(sem, cid)].type
+        course_codes[cid] = course_at[(sem, cid)].code
+
+    core_count = 0
+    other_count = 0
+
+    for cid, course_vars_list in vars_by_course.items():
+        done = terms.done(course_codes[cid])           # a completion counts as the one time
+        if done is not True and done is not False:
+            course_vars_list = course_vars_list + [done]
+        if course_types[cid] == "Core":
+            if guards is None:
+                model.AddExactlyOne(course_vars_list)
+            else:
+                # taken at most once always; taken at all is the requirement
+                model.AddAtMostOne(course_vars_list)
+                model.AddBoolOr(course_vars_list).OnlyEnforceIf(guard(f"Core course {course_codes[cid]}"))
+            core_count += 1
+        elif len(course_vars_list) > 1:
+            model.AddAtMostOne(course_vars_list)
+            other_count += 1
+
+    # A Core course with no feasible semester: its requirement is an empty clause
+    for code in missing_core:
+        model.AddBoolOr([]).OnlyEnforceIf(guard(f"Core course {code}"))
+        print(f"   ❌ Core course {code} has no feasible semester")
+
+    print(f"✅ Applied uniqueness constraint to {core_count + other_count} courses "
+          f"({core_count} core, {other_count} electives)\n")
+
+
+
+
+    # Add these constraints after CONSTRAINT 4 (prerequisites) and before CONSTRAINT 5 (core courses)
+
+    # CONSTRAINT 6: Minimum HUL credits = 15 across all semesters
+    min_hul_credits=config["MIN_HUL_CREDITS"]
+    hul_credit_vars = []
+    for (sem, cid), var in course_vars.items():
+        if course_at[(sem, cid)].get("type", "").startswith("HUL"):
+            # Add this course's scaled credits if selected
+            hul_credit_vars.append(var * scaled_credits[cid])
+
+    # Account for already completed HUL credits
+    remaining_hul_needed = int((min_hul_credits - hul_credits_done) * config["CREDIT_SCALE"])
+
+    if hul_credit_vars and remaining_hul_needed > 0:
+        model.Add(sum(hul_credit_vars) >= terms.hul_needed).OnlyEnforceIf(
+            guard(f"{remaining_hul_needed / config['CREDIT_SCALE']} more HUL credits")
+        )
+        print(f"✅ Added HUL credit constraint: min {remaining_hul_needed / config['CREDIT_SCALE']} more credits needed (total 15)")
+    elif remaining_hul_needed <= 0:
+        print(f"✅ HUL credits already satisfied: {hul_credits_done} completed")
+
+    # CONSTRAINT 7: Minimum DE credits = 10 across all semesters
+    min_de_credits=config["MIN_DE_CREDITS"]
+    de_credit_vars = []
+    for (sem, cid), var in course_vars.items():
+        if course_at[(sem, cid)].get("type") == "DE":
+            # Add this course's scaled credits if selected
+            de_credit_vars.append(var * scaled_credits[cid])
+
+    # Account for already completed DE credits
+    remaining_de_needed = int((min_de_credits - de_credits_done) * config["CREDIT_SCALE"])
+
+    if de_credit_vars and remaining_de_needed > 0:
+        model.Add(sum(de_credit_vars) >= terms.de_needed).OnlyEnforceIf(
+            guard(f"{remaining_de_needed / config['CREDIT_SCALE']} more DE credits")
+        )
+        print(f"✅ Added DE credit constraint: min {remaining_de_needed / config['CREDIT_SCALE']} more credits needed (total 10)")
+    elif remaining_de_needed <= 0:
+        print(f"✅ DE credits already satisfied: {de_credits_done} completed")
+
+
+    #CONSTRAINT 8 : SLOTTING
+    # ============================================================
+    # CONSTRAINT 8: Time clashes (from weekly timetable bitmasks)
+    # ============================================================
+
+    print("📋 CONSTRAINT 8: Time clashes (lecture vs lecture)")
+
+    # Courses without their own lecture times borrow the usual times of their slot letter
+    fallback_masks = slot_masks(course for courses in courses_left.values() for course in courses)
+
+    for sem, courses in courses_left.items():
+        # Only consider lecture courses
+        lecture_masks = {}
+        for course in courses:
+            if course.get("hours", {}).get("lecture", 0) > 0:
+                mask = planning_mask(course, fallback_masks)
+                if mask:
+                    lecture_masks[course.id] = mask
+
+        # Courses meeting in the same day x half-hour cell: at most 1 of them
+        groups = clash_groups(lecture_masks)
+        for group in groups:
+            guarded_at_most_one([course_vars[(sem, cid)] for cid in sorted(group)], f"no time clashes in semester {sem}")
+        print(f"   ✅ Semester {sem}: {len(groups)} clash constraints over {len(lecture_masks)} lecture courses")
+
+    print("✅ Slot constraints applied\n")
+
+    # ============================================================
+    # CONSTRAINT 9: Overlapping courses (catalog overlap cliques)
+    # ============================================================
+    # As overlap_constraints(): a completed or Core member rules the other planned
+    # members out, otherwise at most one of them (or a completion) counts.
+    planned = {course.code: course for courses in courses_left.values() for course in courses}
+    cliques = 0
+    ruled_out = 0
+    for clique in all_courses.overlap_cliques():
+        members = [planned[code] for code in clique if code in planned]
+        member_vars = [course_vars[(sem, c.id)] for c in members if c.type != "Core"
+                       for sem in courses_left if (sem, c.id) in course_vars]
+        if not member_vars:
+            continue
+        clique_done = terms.clique_done(clique)
+        if clique_done is True or any(c.type == "Core" for c in members):
+            for var in member_vars:
+                model.Add(var == 0).OnlyEnforceIf(guard("no overlapping courses"))
+            ruled_out += len(member_vars)
+        elif clique_done is not False:
+            guarded_at_most_one(member_vars + [clique_done], "no overlapping courses")
+            cliques += 1
+        elif len(members) > 1:
+            guarded_at_most_one(member_vars, "no overlapping courses")
+            cliques += 1
+    print(f"📋 CONSTRAINT 9: {cliques} overlap cliques, {ruled_out} course slots overlapping completed/Core courses\n")
+
+
+    # ============================================================
+    # MINOR CONSTRAINTS
+    # ============================================================
+
+    if minor_req:
+        print("\n" + "="*70)
+        print("🎯 Adding Minor Constraints")
+        print("="*70)
+
+        # Collect minor course variables
+        minor_core_vars = []
+        minor_elec_vars = []
+        minor_all_credits = []
+
+        minor_sem_vars = {}     # sem -> minor course vars in that semester
+        for (sem, cid), var in course_vars.items():
+            course_type = course_at[(sem, cid)].get("type", "")
+            if course_type.startswith("Minor"):
+                minor_sem_vars.setdefault(sem, []).append(var)
+                if course_type == "Minor_Core":
+                    minor_core_vars.append(var)
+                    minor_all_credits.append(var * scaled_credits[cid])
+                elif course_type == "Minor_Elective":
+                    minor_elec_vars.append(var)
+                    minor_all_credits.append(var * scaled_credits[cid])
+
+        print(f"   Found {len(minor_core_vars)} core + {len(minor_elec_vars)} elective courses")
+
+        if minor_all_credits:
+            # CONSTRAINT: Minimum unique minor credits (10 credits)
+            unique_required = config["MINOR_UNIQUE_CREDITS"]
+            min_scaled = int(unique_required * config["CREDIT_SCALE"])
+
+            model.Add(sum(minor_all_credits) >= min_scaled).OnlyEnforceIf(guard(f"{unique_required} unique minor credits"))
+            print(f"   ✅ Minimum {unique_required} unique minor credits")
+            print(f"      (+ {config['MINOR_OC_CREDITS']} from OC = {config['MINOR_TOTAL_CREDITS']} total)")
+
+            # CONSTRAINT: Core requirements
+            if minor_req["core_required"] > 0:
+                core_credits = [
+                    var * scaled_credits[cid]
+                    for (sem, cid), var in course_vars.items()
+                    if course_at[(sem, cid)].get("type") == "Minor_Core"
+                ]
+
+                if core_credits:
+                    core_scaled = int(minor_req["core_required"] * config["CREDIT_SCALE"])
+                    model.Add(sum(core_credits) >= core_scaled).OnlyEnforceIf(
+                        guard(f"{minor_req['core_required']} minor core credits")
+                    )
+                    print(f"   ✅ Minimum {minor_req['core_required']} core credits")
+
+            # CONSTRAINT: Max minor courses per semester
+            max_per_sem = config["MAX_MINOR_PER_SEM"]
+            for sem in courses_left.keys():
+                sem_minor_vars = minor_sem_vars.get(sem, [])
+                if sem_minor_vars:
+                    model.Add(sum(sem_minor_vars) <= max_per_sem).OnlyEnforceIf(
+                        guard(f"at most {max_per_sem} minor courses in semester {sem}")
+                    )
+
+            print(f"   ✅ Max {max_per_sem} minor courses per semester")
+
+        print("="*70)
+
+    info = {"credits_done": credits_done, "remaining_target_credits": remaining_target_credits}
+    return model, course_vars, info
+
+
+def credit_bucket_conflicts(courses_left, user, config, minor_req=None):
+    """
+    Conflicts of the credit minimums with the credit caps that need no search
+    (the linear reasoning presolve does on the plain model): the Core, HUL, DE
+    and minor minimums against the total target and the per-semester caps.
+    Returns the requirement texts of build_bool_model(guards=...) that cannot
+    all hold, with every credit bucket the conflict holds without dropped;
+    [] if the buckets fit.
+    """
+    scale = config["CREDIT_SCALE"]
+    credits_done, hul_credits_done, de_credits_done = completed_credits(user)
+    remaining_target_credits = int((config["TOTAL_TARGET_CREDITS"] - credits_done) * scale)
+    remaining = remaining_target_credits / scale
+    total = f"{remaining} more credits (at most 9 over)"
+
+    semesters = sorted(courses_left)
+    extended = min(2, len([sem for sem in semesters if sem > 2]))
+    capacity = 24 * len(semesters) + 2.5 * extended
+    caps = [f"at most 24 credits (26.5 extended) in semester {sem}" if sem > 2 else f"at most 24 credits in semester {sem}"
+            for sem in semesters] + (["at most 2 extended semesters"] if extended else [])
+
+    # Each course once, by type
+    courses = {course.code: course for sem in semesters for course in courses_left[sem]}
+
+    def of_type(match):
+        return [course for course in courses.values() if match(course.get("type", ""))]
+
+    def is_minor(kind):
+        return kind in ("Minor_Core", "Minor_Elective")
+
+    # Credit minimums: {requirement text: credits}
+    buckets = {}
+    core = sum(course.credits for course in of_type(lambda kind: kind == "Core"))
+    if core:
+        buckets[f"{core} credits of Core courses"] = core
+    hul_needed = int((config["MIN_HUL_CREDITS"] - hul_credits_done) * scale)
+    if hul_needed > 0 and of_type(lambda kind: kind.startswith("HUL")):
+        buckets[f"{hul_needed / scale} more HUL credits"] = hul_needed / scale
+    de_needed = int((config["MIN_DE_CREDITS"] - de_credits_done) * scale)
+    if de_needed > 0 and of_type(lambda kind: kind == "DE"):
+        buckets[f"{de_needed / scale} more DE credits"] = de_needed / scale
+    minor = None
+    if minor_req and of_type(is_minor):
+        if minor_req["core_required"] > config["MINOR_UNIQUE_CREDITS"] and of_type(lambda kind: kind == "Minor_Core"):
+            minor = f"{minor_req['core_required']} minor core credits"
+            buckets[minor] = minor_req["core_required"]
+        else:
+            minor = f"{config['MINOR_UNIQUE_CREDITS']} unique minor credits"
+            buckets[minor] = config["MINOR_UNIQUE_CREDITS"]
+
+    def shrink(labels, fits):
+        """Deletion: drop every bucket the conflict still holds without"""
+        labels = list(labels)
+        for label in list(labels):
+            rest = [other for other in labels if other != label]
+            if not fits(rest):
+                labels = rest
+        return labels
+
+    # The minimums against at most target + 9 credits, and against the semester caps
+    for bound, limits in ((remaining + 9, [total]), (capacity, caps)):
+        def fits(labels, bound=bound):
+            return sum(buckets[label] for label in labels) <= bound
+        if not fits(buckets):
+            return shrink(buckets, fits) + limits
+
+    # The minimum semester loads against the total, the total against the caps
+    if len(semesters) * user.min_credits > remaining + 9:
+        return [f"at least {user.min_credits} credits in semester {sem}" for sem in semesters] + [total]
+    if remaining > capacity:
+        return caps + [total]
+
+    # A bucket against its per-semester course cap
+    hul = [label for label in buckets if label.endswith("more HUL credits")]
+    for labels, match, cap, cap_text in (
+        (hul, lambda kind: kind.startswith("HUL"), config["MAX_HUL_PER_SEM"], "HUL courses"),
+        ([minor] if minor else [], lambda kind: kind.startswith("Minor"), config["MAX_MINOR_PER_SEM"], "minor courses"),
+    ):
+        if not labels:
+            continue
+        offered = [sem for sem in semesters if any(match(course.get("type", "")) for course in courses_left[sem])]
+        largest = max(course.credits for course in of_type(match))
+        if buckets[labels[0]] > len(offered) * cap * largest:
+            return labels + [f"at most {cap} {cap_text} in semester {sem}" for sem in offered]
+    return []
+
+
+def explain_infeasibility(courses_left, user, config, all_courses, minor_req=None, solver=None, shrink_time=2,
+                          missing_core=()):
+    """
+    Requirements that cannot all hold together: the bool model with every
+    requirement guarded (build_bool_model(guards=...)), all guards assumed,
+    and CP-SAT's SufficientAssumptionsForInfeasibility mapped back to the
+    requirement texts. [] if the requirements can all hold, None if nothing
+    was proven before the time limit.
+
+    The core is then shrunk by deletion: each requirement is dropped if the
+    rest still conflict (a re-solve of at most shrink_time seconds), so
+    dropping any one requirement of the answer removes the conflict, unless
+    a re-solve timed out.
+
+    Guarded constraints lose the presolve reasoning of the plain model, so
+    a conflict presolve finds instantly (e.g. credit buckets that add up past
+    the target) can take much longer to prove here - give the solver a time
+    limit. When it runs out, credit_bucket_conflicts() covers those linear
+    conflicts. Without presolve, finding a plan for a feasible student is slow
+    too; call this on students the plain model found INFEASIBLE.
+    """
+    guards = {}
+    model, _, _ = build_bool_model(courses_left, user, config, all_courses, minor_req, guards=guards,
+                                   missing_core=missing_core)
+    model.ClearObjective()              # any plan answers the question
+    model.AddAssumptions(list(guards.values()))
+
+    solver = solver or cp_model.CpSolver()
+    status = solver.Solve(model)
+    if status != cp_model.INFEASIBLE:
+        if status in (cp_model.OPTIMAL, cp_model.FEASIBLE):
+            return []
+        return credit_bucket_conflicts(courses_left, user, config, minor_req) or None
+
+    requirement_of = {literal.Index(): requirement for requirement, literal in guards.items()}
+    core = [requirement_of[index] for index in solver.SufficientAssumptionsForInfeasibility()]
+
+    solver.parameters.max_time_in_seconds = shrink_time
+    for requirement in list(core):
+        if requirement not in core:
+            continue                    # already dropped by an earlier, smaller core
+        rest = [other for other in core if other != requirement]
+        model.ClearAssumptions()
+        model.AddAssumptions([guards[other] for other in rest])
+        if solver.Solve(model) == cp_model.INFEASIBLE:
+            smaller = {requirement_of[index] for index in solver.SufficientAssumptionsForInfeasibility()}
+            core = [other for other in rest if other in smaller]
+    return core
+
+
+def build_int_model(courses_left, user, config, all_courses, minor_req=None, missing_core=()):
+    """
+    Int engine: one optional "semester taken" IntVar per course (domain = the
+    semesters it is offered in) with a presence literal, and an optional
+    interval [sem, sem + 1) on top of it.
+
+    - prereqs:  p before c is  present[p] and sem[p] < sem[c]
+    - loads:    a table constraint channels sem[c] into per-semester literals,
+                which are the course_vars handed back and sum into the credit loads
+    - counts:   HUL / minor courses per semester are cumulative constraints
+    - clashes:  clashing courses get a NoOverlap on their intervals
+    - earned credits (EC50): element of the prefix sums at sem[c]
+    Uniqueness needs no constraint: a course has a single semester variable.
+    """
+    scale = config["CREDIT_SCALE"]
+    completed_codes = set(user.completed_corecourses) | set(user.completed_hul) | set(user.completed_DE)
+    credits_done, hul_credits_done, de_credits_done = completed_credits(user)
+    remaining_target_credits = int((config["TOTAL_TARGET_CREDITS"] - credits_done) * scale)
+
+    # One entry per course, with the semesters it is offered in
+    courses = {}
+    offered = {}
+    for sem in sorted(courses_left):
+        for course in courses_left[sem]:
+            courses.setdefault(course.id, course)
+            offered.setdefault(course.id, []).append(sem)
+    semesters = sorted(courses_left)
+    first, last = semesters[0], semesters[-1]
+
+    model = cp_model.CpModel()
+    present = {}
+    sem_of = {}
+    interval = {}
+    course_vars = {}
+    _, credits = course_index(courses_left, scale)
+
+    print(f"\n📋 Int engine: {len(courses)} optional semester variables "
+          f"over {sum(len(s) for s in offered.values())} course slots")
+    for cid, course in courses.items():
+        sems = offered[cid]
+        present[cid] = model.NewBoolVar(f"{course.code}_taken")
+        if course.type == "Core":
+            model.Add(present[cid] == 1)
+        sem_of[cid] = model.NewIntVarFromDomain(cp_model.Domain.FromValues(sems), f"{course.code}_sem")
+        interval[cid] = model.NewOptionalFixedSizeIntervalVar(sem_of[cid], 1, present[cid], f"{course.code}_when")
+
+        # Table: (sem, present, one literal per offered semester); absent courses sit at their first semester
+        for sem in sems:
+            course_vars[(sem, cid)] = model.NewBoolVar(f"{course.code}_sem{sem}")
+        literals = [course_vars[(sem, cid)] for sem in sems]
+        rows = [[sem, 1] + [int(s == sem) for s in sems] for sem in sems]
+        rows.append([sems[0], 0] + [0] * len(sems))
+        model.AddAllowedAssignments([sem_of[cid], present[cid]] + literals, rows)
+
+    # A Core course with no feasible semester cannot be present: the plan is infeasible
+    for code in missing_core:
+        model.AddBoolOr([])
+        print(f"   ❌ Core course {code} has no feasible semester")
+
+    # CONSTRAINT 1: semester credit loads, with at most 2 extended (24 -> 26.5) semesters
+    loads = {
+        sem: sum(course_vars[(sem, course.id)] * credits[course.id] for course in courses_left[sem])
+        for sem in semesters
+    }
+    extended_semester_vars = {}
+    for sem, load in loads.items():
+        model.Add(load >= user.min_credits * scale)
+        if sem > 2:
+            model.Add(load <= int(26.5 * scale))
+            extended_semester_vars[sem] = model.NewBoolVar(f"extended_sem{sem}")
+            model.Add(load <= 24 * scale).OnlyEnforceIf(extended_semester_vars[sem].Not())
+        else:
+            model.Add(load <= 24 * scale)
+    if extended_semester_vars:
+        model.Add(sum(extended_semester_vars.values()) <= 2)
+    # Same capacity again over the intervals, which the scheduling propagators reason about directly
+    model.AddCumulative(list(interval.values()), [credits[cid] for cid in interval], int(26.5 * scale))
+
+    # CONSTRAINT 2: total credits, one term per course
+    total_remaining_credits = sum(present[cid] * credits[cid] for cid in courses)
+    model.Add(total_remaining_credits >= remaining_target_credits)
+    model.Add(total_remaining_credits <= remaining_target_credits + int(9 * scale))
+
+    # CONSTRAINT 3: max HUL courses per semester
+    hul_ids = [cid for cid, course in courses.items() if course.get("type", "").startswith("HUL")]
+    if hul_ids:
+        model.AddCumulative([interval[cid] for cid in hul_ids], [1] * len(hul_ids), config["MAX_HUL_PER_SEM"])
+
+    # CONSTRAINT 4: prerequisites, p before c  <=>  present[p] and sem[p] < sem[c]
+    # earned_before[s]: scaled credits earned before semester s, from the previous planned
+    # semester (semesters need not be contiguous); earned_at is it indexed by semester number
+    done = int(credits_done * scale)
+    max_earned = done + sum(credits.values())
+    earned_before = {first: done}
+    for previous_sem, sem in zip(semesters, semesters[1:]):
+        earned_before[sem] = model.NewIntVar(done, max_earned, f"earned_before_sem{sem}")
+        model.Add(earned_before[sem] == earned_before[previous_sem] + loads[previous_sem])
+    earned_at = [earned_before.get(sem, done) for sem in range(last + 1)]
+
+    prereq_nodes = 0
+    for cid, course in courses.items():
+        if course.prereqs_parsed is None:
+            continue
+        before = {}
+
+        def prereq_leaf(node, cid=cid, course=course, before=before):
+            kind, value = node
+            if kind == "credits":
+                needed = int(value * scale)
+                if done >= needed:
+                    return True
+                earned = model.NewIntVar(done, max_earned, f"{course.code}_earned")
+                model.AddElement(sem_of[cid], earned_at, earned)
+                literal = model.NewBoolVar(f"{course.code}_earned_{value}")
+                model.Add(earned >= needed).OnlyEnforceIf(literal)
+                return literal
+            if kind != "course":
+                return True                 # permissions, minor areas, ... are not modelled
+            if value in completed_codes:
+                return True
+            pid = all_courses.id_of(value)
+            if pid not in present or pid == cid:
+                return False
+            literal = model.NewBoolVar(f"{value}_before_{course.code}")
+            model.AddImplication(literal, present[pid])
+            model.Add(sem_of[pid] < sem_of[cid]).OnlyEnforceIf(literal)
+            return literal
+
+        satisfied = compile_prereqs(model, course.prereqs_parsed, prereq_leaf, before, f"pre_{course.code}")
+        prereq_nodes += len(before)
+        # Prereqs that cannot be met inside the plan at all (False) are left unconstrained
+        if satisfied is not True and satisfied is not False:
+            model.AddImplication(present[cid], satisfied)
+    print(f"✅ Prerequisite constraints compiled ({prereq_nodes} expression nodes)")
+
+    # CONSTRAINT 6 / 7: minimum HUL and DE credits
+    remaining_hul_needed = int((config["MIN_HUL_CREDITS"] - hul_credits_done) * scale)
+    if hul_ids and remaining_hul_needed > 0:
+        model.Add(sum(present[cid] * credits[cid] for cid in hul_ids) >= remaining_hul_needed)
+    de_ids = [cid for cid, course in courses.items() if course.get("type") == "DE"]
+    remaining_de_needed = int((config["MIN_DE_CREDITS"] - de_credits_done) * scale)
+    if de_ids and remaining_de_needed > 0:
+        model.Add(sum(present[cid] * credits[cid] for cid in de_ids) >= remaining_de_needed)
+
+    # CONSTRAINT 8: courses sharing a lecture cell never share a semester
+    fallback_masks = slot_masks(courses.values())
+    lecture_masks = {}
+    for cid, course in courses.items():
+        if course.get("hours", {}).get("lecture", 0) > 0:
+            mask = planning_mask(course, fallback_masks)
+            if mask:
+                lecture_masks[cid] = mask
+    groups = clash_groups(lecture_masks)
+    for group in groups:
+        model.AddNoOverlap(interval[cid] for cid in sorted(group))
+    print(f"✅ {len(groups)} clash groups over {len(lecture_masks)} lecture courses")
+
+    # CONSTRAINT 9: overlapping courses, at most one per clique
+    ruled_out, at_most_one = overlap_constraints(courses_left, user, all_courses)
+    for cid in ruled_out:
+        model.Add(present[cid] == 0)
+    for ids in at_most_one:
+        model.AddAtMostOne(present[cid] for cid in ids)
+    print(f"✅ {len(at_most_one)} overlap cliques, {len(ruled_out)} courses ruled out by overlaps")
+
+    # MINOR CONSTRAINTS
+    if minor_req:
+        minor_ids = [cid for cid, course in courses.items() if course.get("type", "").startswith("Minor")]
+        minor_core_ids = [cid for cid in minor_ids if courses[cid].type == "Minor_Core"]
+        if minor_ids:
+            model.Add(sum(present[cid] * credits[cid] for cid in minor_ids)
+                      >= int(config["MINOR_UNIQUE_CREDITS"] * scale))
+            if minor_req["core_required"] > 0 and minor_core_ids:
+                model.Add(sum(present[cid] * credits[cid] for cid in minor_core_ids)
+                          >= int(minor_req["core_required"] * scale))
+            model.AddCumulative([interval[cid] for cid in minor_ids], [1] * len(minor_ids),
+                                config["MAX_MINOR_PER_SEM"])
+        print(f"✅ Minor constraints over {len(minor_ids)} courses")
+
+    info = {"credits_done": credits_done, "remaining_target_credits": remaining_target_credits}
+    return model, course_vars, info
+
+
+ENGINES = {"bool": build_bool_model, "int": build_int_model}
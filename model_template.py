@@ -0,0 +1,183 @@
+"""
+Department model template (bool encoding) with per-student deltas.
+
+Most of a student's CP-SAT model depends only on the program, the first planned
+semester and the minor: course variables, semester loads and extended credits,
+HUL caps, clashes, the prereq structure and the minor rules. ModelTemplate
+builds that part once, over every program course, and turns what differs
+between students into variables:
+
+    done[code]          course completed (prereq leaves, uniqueness, overlap cliques)
+    gated[course id]    prereqs cannot be met by this student's plan at all
+    min_load, credits_done, remaining, hul_needed, de_needed     credit targets
+
+The model is model_engines.build_bool_model itself, with TemplateTerms handing
+it those variables where a student's build gets constants. instantiate(student)
+clones the template and fixes them, plus the student's semester windows
+(model_engines.restrict_to_windows), by writing variable domains.
+"""
+import contextlib
+import io
+
+from model_engines import StudentTerms, build_bool_model, completed_credits, restrict_to_windows
+from prereqs import satisfiable
+
+PARAM_MAX = 10 ** 6         # bound of the scaled credit parameters
+
+
+class TemplateTerms(StudentTerms):
+    """StudentTerms as variables of the template, fixed per student later"""
+
+    def __init__(self, template, model):
+        self.template = template
+        self.model = model
+        self.min_load = self._param("min_load")
+        self.credits_done = self._param("credits_done")
+        self.credits_done_bounds = (0, PARAM_MAX)
+        self.remaining = self._param("remaining")
+        self.hul_needed = self._param("hul_needed")
+        self.de_needed = self._param("de_needed")
+
+    def _param(self, name):
+        self.template.params[name] = self.model.NewIntVar(-PARAM_MAX, PARAM_MAX, name)
+        return self.template.params[name]
+
+    def done(self, code):
+        if code not in self.template.done:
+            self.template.done[code] = self.model.NewBoolVar(f"done_{code}")
+        return self.template.done[code]
+
+    def clique_done(self, clique):
+        literal = self.model.NewBoolVar(f"overlap_done_{clique[0]}")
+        for code in clique:
+            self.model.AddImplication(self.done(code), literal)
+        return literal
+
+    def gated(self, course):
+        if course.id not in self.template.gated:
+            self.template.gated[course.id] = self.model.NewBoolVar(f"gated_{course.code}")
+            self.template.trees[course.id] = course.prereqs_parsed
+        return self.template.gated[course.id]
+
+
+class ModelTemplate:
+    """
+    The bool-encoded model of one program / first semester / minor, shared by
+    every student starting there.
+
+        template = ModelTemplate(courses_left, blank_student, CONFIG, catalog, minor_req)
+        model, course_vars, info = template.instantiate(student)
+
+    courses_left is build_courses_left() (+ integrate_minor()) for blank_student,
+    a student with nothing completed: every program course in every planned
+    semester. The model is build_bool_model() with TemplateTerms.
+    """
+
+    def __init__(self, courses_left, student, config, all_courses, minor_req=None):
+        self.courses_left = courses_left
+        self.config = config
+        self.minor_req = minor_req
+        self.done = {}              # code -> BoolVar
+        self.gated = {}             # course id -> BoolVar
+        self.trees = {}             # course id -> prereq tree of the gated courses
+        self.params = {}            # name -> IntVar
+        # The engine's progress output would describe the blank student, not a real one
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.model, self.course_vars, _ = build_bool_model(
+                courses_left, student, config, all_courses, minor_req,
+                terms=lambda model, user, config: TemplateTerms(self, model),
+            )
+
+    def _clone(self, student):
+        """(clone of the template, fix(var, value)) with the student's gates fixed"""
+        completed_codes = set(student.completed_corecourses) | set(student.completed_hul) | set(student.completed_DE)
+        available = completed_codes | {course.code for courses in self.courses_left.values() for course in courses}
+        model = self.model.clone()
+        variables = model.Proto().variables
+
+        def fix(var, value):
+            domain = variables[var.Index()].domain
+            domain[0] = domain[1] = value
+
+        for cid, var in self.gated.items():
+            fix(var, int(not satisfiable(self.trees[cid], available)))
+        fix(self.params["min_load"], int(student.min_credits * self.config["CREDIT_SCALE"]))
+        return model, fix
+
+    def instantiate(self, student):
+        """
+        (model, course_vars, info) for one student: a clone of the template with
+        the student's completions, gates, credit targets and semester windows
+        fixed. info also carries the student's pruned courses_left and the
+        codes with no feasible semester ("unschedulable").
+        """
+        scale = self.config["CREDIT_SCALE"]
+        completed_codes = set(student.completed_corecourses) | set(student.completed_hul) | set(student.completed_DE)
+        credits_done, hul_credits_done, de_credits_done = completed_credits(student)
+        remaining_target_credits = int((self.config["TOTAL_TARGET_CREDITS"] - credits_done) * scale)
+
+        # The student's courses_left: program courses not completed (minor courses
+        # are kept, as in integrate_minor), pruned to their semester windows
+        courses_left = {
+            sem: [c for c in courses if c.type.startswith("Minor") or c.code not in completed_codes]
+            for sem, courses in self.courses_left.items()
+        }
+        courses_left, unschedulable = restrict_to_windows(courses_left, student)
+        open_keys = {(sem, course.id) for sem, courses in courses_left.items() for course in courses}
+
+        model, fix = self._clone(student)
+        for code, var in self.done.items():
+            fix(var, int(code in completed_codes))
+        for key, var in self.course_vars.items():
+            if key not in open_keys:
+                fix(var, 0)
+
+        fix(self.params["remaining"], remaining_target_credits)
+        fix(self.params["credits_done"], int(credits_done * scale))
+        fix(self.params["hul_needed"], int((self.config["MIN_HUL_CREDITS"] - hul_credits_done) * scale))
+        fix(self.params["de_needed"], int((self.config["MIN_DE_CREDITS"] - de_credits_done) * scale))
+
+        # The clone keeps the template's variable indices, so its variables serve the clone too
+        course_vars = {key: var for key, var in self.course_vars.items() if key in open_keys}
+        info = {
+            "credits_done": credits_done,
+            "remaining_target_credits": remaining_target_credits,
+            "courses_left": courses_left,
+            "unschedulable": unschedulable,
+        }
+        return model, course_vars, info
+
+    def session(self, student):
+        """
+        (model, course_vars) for what-if re-solving (what_if.WhatIfSession): a
+        clone like instantiate() gives, but with done[code] left free - each
+        solve sets the completions through assumptions - and the credit targets
+        tied to the done literals. Semester windows are left to presolve, since
+        they move with the completions. course_vars covers every template slot.
+        """
+        scale = self.config["CREDIT_SCALE"]
+        model, _ = self._clone(student)
+
+        # Completed credits as completed_credits() counts them: each program course
+        # once in the total, HUL / DE entries once per listing in the program
+        credits = {}
+        hul_credits = {}
+        de_credits = {}
+        for courses in student.EE_courses.values():
+            for course in courses:
+                scaled = int(course["credits"] * scale)
+                credits[course["code"]] = scaled
+                if course.get("type", "").startswith("HUL"):
+                    hul_credits[course["code"]] = hul_credits.get(course["code"], 0) + scaled
+                elif course.get("type") == "DE":
+                    de_credits[course["code"]] = de_credits.get(course["code"], 0) + scaled
+
+        def done_credits(weights):
+            return sum(self.done[code] * weight for code, weight in weights.items() if code in self.done)
+
+        model.Add(self.params["credits_done"] == done_credits(credits))
+        model.Add(self.params["remaining"] == int(self.config["TOTAL_TARGET_CREDITS"] * scale) - self.params["credits_done"])
+        model.Add(self.params["hul_needed"] == int(self.config["MIN_HUL_CREDITS"] * scale) - done_credits(hul_credits))
+        model.Add(self.params["de_needed"] == int(self.config["MIN_DE_CREDITS"] * scale) - done_credits(de_credits))
+
+        return model, self.course_vars
@@ -0,0 +1,57 @@
+"""
+Overlapping courses (the catalog "overlap" field).
+
+    "APL105, APL108"                    -> APL105, APL108
+    "ELL784, ELL789, COL341/COL774"     -> ELL784, ELL789, COL341, COL774
+    "Some overlap with ELL201, ELL304"  -> ELL201, ELL304
+    "COL765 & COL226"                   -> nothing (overlaps the pair taken together, not either one)
+
+The listed pairs are symmetrized into an overlap graph and grouped into maximal
+cliques: of the courses in one clique at most one can count in a plan, and one
+"at most one" per clique propagates better than a constraint per pair.
+"""
+import re
+
+_CODE = re.compile(r"\b([A-Z]{3})\s?(\d{3})\b")
+
+
+def parse_overlap(text):
+    """Course codes an overlap string lists as overlapping one by one"""
+    codes = []
+    for part in (text or "").split(","):
+        if "&" in part:
+            continue
+        for dept, number in _CODE.findall(part):
+            if dept + number not in codes:
+                codes.append(dept + number)
+    return codes
+
+
+def overlap_graph(courses):
+    """{code: set of overlapping codes} over catalog codes, both directions"""
+    graph = {}
+    for code, course in courses.items():
+        for other in parse_overlap(course.get("overlap")):
+            if other != code and other in courses:
+                graph.setdefault(code, set()).add(other)
+                graph.setdefault(other, set()).add(code)
+    return graph
+
+
+def maximal_cliques(graph):
+    """Maximal cliques (sorted tuples, sorted) of an adjacency dict - Bron-Kerbosch with pivoting"""
+    cliques = []
+
+    def expand(clique, candidates, excluded):
+        if not candidates and not excluded:
+            if len(clique) > 1:
+                cliques.append(tuple(sorted(clique)))
+            return
+        pivot = max(candidates | excluded, key=lambda node: len(graph[node] & candidates))
+        for node in sorted(candidates - graph[pivot]):
+            expand(clique | {node}, candidates & graph[node], excluded & graph[node])
+            candidates = candidates - {node}
+            excluded = excluded | {node}
+
+    expand(set(), set(graph), set())
+    return sorted(cliques)
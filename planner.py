@@ -1,10 +1,18 @@
 from ortools.sat.python import cp_model
+import contextlib
+import copy
+import io
 import json
-import re
-from itertools import product
 from dept import Electrical   # import your dept dictionary
 from user import UserData
-from minor_planner import MinorPlanner
+from minor_planner import MINORS_PATH, MinorPlanner
+from catalog import get_catalog
+from course import Course
+from model_engines import ENGINES, add_hints, course_index, explain_infeasibility, missing_core, restrict_to_windows
+from model_template import ModelTemplate
+from artifact_cache import (artifact_key, file_digest, is_written, load_artifacts, mark_written,
+                            save_artifacts, source_digest, spec_digest, student_state)
+from fileio import atomic_write
 
 CONFIG = {
     "TOTAL_TARGET_CREDITS": 150,   # EE degree requirement
@@ -20,314 +28,141 @@ CONFIG = {
     "MINOR_OC_CREDITS": 10,             # minimum open choice credits for a minor
     "MINOR_UNIQUE_CREDITS": 10,         # minimum unique credits (not shared with core) for a minor(electives)
     "MAX_MINOR_PER_SEM": 2,             # max minor courses per semester
+
+    # MODEL
+    "MODEL_ENGINE": "bool",             # "bool" (BoolVar per semester x course) or "int" (semester IntVar per course)
+    "MODEL_TEMPLATE": False,            # bool engine: clone a per-department template per student (model_template.py)
+    "HINTS": True,                      # warm start from the recommended sequence / the previous plan
+    "DECISION_STRATEGY": False,         # also branch on the hinted slots first
+
+    # SOLVER (see new_solver)
+    "SOLVER_MAX_TIME": None,            # seconds per solve (None: no limit)
+    "SOLVER_WORKERS": 0,                # search workers (0: one per core); pin it in batch jobs
+    "SOLVER_SEED": None,                # random seed (None: OR-Tools default)
+    "SOLVER_INTERLEAVE": False,         # interleaved search - with fixed workers and seed, runs repeat exactly
+    "SOLVER_LOG": False,                # capture the search log into result["solver_log"]
+    "SOLVER_EXPLAIN_MAX_TIME": 10,      # seconds for the conflict of an infeasible plan (see PlanModelBuilder.explain)
+
+    # ALTERNATIVES (see alternative_plans)
+    "ALTERNATIVE_PLANS": 1,             # plans to show; > 1 streams alternatives as they are found
+    "ALTERNATIVE_MIN_DIFFERENCE": 5,    # course-semester assignments each alternative must change
 }
 
 
-def parse_prereqs(prereq_string):
+def build_selected_courses(all_courses, program):
     """
-    Parse prerequisite string into list of lists.
-    
-    Input: "[ELL101 and ELL202 and (ELL211 or ELL231)]"
-    Output: [['ELL101', 'ELL202', 'ELL211'], ['ELL101', 'ELL202', 'ELL231']]
-    
-    Logic:
-    - 'and' means the course is required in all combinations
-    - 'or' within parentheses creates alternative paths
+    Expand a program's recommended sequence into full course records per semester.
+    Placeholders (DE, HUL2XX, HUL3XX) expand to every matching course.
     """
-    if not prereq_string or prereq_string.strip() in ["", "[]", "None"]:
-        return []
-    
-    # Remove outer brackets if present
-    prereq_string = prereq_string.strip()
-    if prereq_string.startswith('[') and prereq_string.endswith(']'):
-        prereq_string = prereq_string[1:-1]
-    
-    # Find all course codes (alphanumeric pattern)
-    course_pattern = r'[A-Z]{3}\d{3}'
-    
-    # Split by 'and' to get main required courses and OR groups
-    and_parts = re.split(r'\s+and\s+', prereq_string)
-    
-    required_courses = []  # Courses that must be in all combinations
-    or_groups = []  # Groups of alternatives
-    
-    for part in and_parts:
-        part = part.strip()
-        
-        # Check if this part contains an OR group (has parentheses)
-        if '(' in part and ')' in part:
-            # Extract content within parentheses
-            match = re.search(r'\((.*?)\)', part)
-            if match:
-                or_content = match.group(1)
-                # Split by 'or' to get alternatives
-                alternatives = re.split(r'\s+or\s+', or_content)
-                # Extract course codes from each alternative
-                or_group = [re.findall(course_pattern, alt)[0] for alt in alternatives if re.findall(course_pattern, alt)]
-                if or_group:
-                    or_groups.append(or_group)
-            else:
-                # Malformed parentheses, treat as regular courses
-                courses = re.findall(course_pattern, part)
-                required_courses.extend(courses)
-        else:
-            # This is a required course (no parentheses)
-            courses = re.findall(course_pattern, part)
-            required_courses.extend(courses)
-    
-    # Generate all combinations
-    if not or_groups:
-        # No OR groups, just return required courses
-        return [required_courses] if required_courses else []
-    
-    # Create cartesian product of OR groups
-    combinations = list(product(*or_groups))
-    
-    # Add required courses to each combination
-    result = []
-    for combo in combinations:
-        combination = required_courses + list(combo)
-        result.append(combination)
-    
-    return result
-
-
-# 1️⃣ Load master data JSON
-with open("data.json", "r",encoding="utf-8") as f:
-    all_courses = json.load(f)  # dict with course_code as key
-
-# 2️⃣ Extract recommended courses semester-wise
-recommended_courses = Electrical["recommended"]
-dept_code = Electrical["code"]
-
-selected_courses = {}                           # dict to hold final selected courses semester-wise
-
-for sem_idx, course_list in enumerate(recommended_courses, start=1):  
-    selected_courses[sem_idx] = []              # initialize list for this semester
-    for course_code in course_list:             #course_list is list of course codes for that sem that are recommended
-        if course_code in all_courses:
-            # Parse prerequisites for core courses
-            prereq_string = all_courses[course_code].get("prereqs", "")                 #get prereq string from course data
-            all_courses[course_code]["prereqs_parsed"] = parse_prereqs(prereq_string)   #parse and store prereqs
-            all_courses[course_code]["type"] = "Core"                                   #recommended courses are core
-            selected_courses[sem_idx].append(all_courses[course_code])                  #add full course data to selected courses semester-wise
-            
-        elif course_code == "DE":
-            for de_code in Electrical["courses"]["DE"]:
-                if de_code in all_courses:
-                    # Parse prerequisites for DE courses
-                    prereq_string = all_courses[de_code].get("prereqs", "")
-                    all_courses[de_code]["prereqs_parsed"] = parse_prereqs(prereq_string)
-                    all_courses[de_code]["type"] = "DE"
-                    selected_courses[sem_idx].append(all_courses[de_code])
-
-        elif course_code == "HUL2XX":         
-            # dynamically find all courses whose code starts with HUL2
-            for code, course_data in all_courses.items():
-                if code.startswith("HUL2"):
-                    # Parse prerequisites for HUL2XX courses
-                    prereq_string = course_data.get("prereqs", "")
-                    course_data["prereqs_parsed"] = parse_prereqs(prereq_string)
-                    course_data["type"] = "HUL2XX"
-                    selected_courses[sem_idx].append(course_data)
-                    
-        elif course_code == "HUL3XX":         
-            # dynamically find all courses whose code starts with HUL3
-            for code, course_data in all_courses.items():
-                if code.startswith("HUL3"):
-                    # Parse prerequisites for HUL3XX courses
-                    prereq_string = course_data.get("prereqs", "")
-                    course_data["prereqs_parsed"] = parse_prereqs(prereq_string)
-                    course_data["type"] = "HUL3XX"
+    selected_courses = {}                           # dict to hold final selected courses semester-wise
+
+    for sem_idx, course_list in enumerate(program["recommended"], start=1):  
+        selected_courses[sem_idx] = []              # initialize list for this semester
+        for course_code in course_list:             #course_list is list of course codes for that sem that are recommended
+            if course_code in all_courses:
+                # Prerequisites were parsed when the catalog was built (record.prereqs_parsed)
+                record = all_courses.record(course_code)                                    #shared immutable catalog record
+                course_data = record.tagged("Core")                                         #recommended courses are core (tagged copy)
+                selected_courses[sem_idx].append(course_data)                               #add full course data to selected courses semester-wise
+                
+            elif course_code == "DE":
+                for de_code in program["courses"]["DE"]:
+                    if de_code in all_courses:
+                        course_data = all_courses.record(de_code).tagged("DE")
+                        selected_courses[sem_idx].append(course_data)
+
+            elif course_code in ("HUL2XX", "HUL3XX"):
+                # all HUL2xx / HUL3xx courses, straight from the catalog's prefix index
+                for code in all_courses.match(course_code):
+                    course_data = all_courses.record(code).tagged(course_code)
                     selected_courses[sem_idx].append(course_data)
-        else:
-            print(f"⚠ Warning: {course_code} not found in data.json")
-
-# 3️⃣ Save to a JSON file (optional)
-output_file = f"{dept_code}_courses_data.json"
-with open(output_file, "w",encoding="utf-8") as f:
-    json.dump(selected_courses, f, indent=4)
-
-print(f"✅ Department courses saved to '{output_file}'")
-print(f"✅ Prerequisites parsed for all courses")
-
-#--------------------------------------------------------------------------------#
-
-
-# Corrected User Initialization in planner.py
-
-user = UserData(
-    name="Monisha",
-    current_semester=4,  # You're STARTING semester 5 (not in it yet)
-    EE_courses=selected_courses,
-    
-    # ALL courses completed in semesters 1-4
-    completed_corecourses=[
-        # Semester 1
-        'ELL101', 'PYL101', 'ELP101', 'MTL100', 'COL100',
-        'PYP100','NLN100',
-        
-        # Semester 2
-        'APL100', 'CML101', 'MTL101', 'CMP100','MCP100','MCP101','NLN101',
-        
-        # Semester 3
-        'ELL205', 'ELL203', 'ELL211', 'COL106', 'ELL202', 
-        
-        
-        
-        
-        # Add any other CORE courses you've completed
-    ],
-    
-    completed_hul=[
-        'HUL270',  # Add any HUL courses completed in sem 1-4
-    ],
-    
-    completed_DE=[
-        # Add any DE courses completed
-    ],
-    
-    completed_minor=[
-        'COL100',  # This was in your major, counts for minor too 
-        'COL106',  # This was in your major, counts for minor too
-    ],
-    
-    minor_type="CS",
-    min_credits=18,
-    max_credits=24
-)
-
-
-
-user.print_user_summary(debug=True)
-
-courses_left = {}
+            else:
+                print(f"⚠ Warning: {course_code} not found in data.json")
 
-# Build set of all completed courses from all tracking methods
-# all_completed_codes = set(user.completed_corecourses)
-# all_completed_codes.update(user.completed_hul)
-# all_completed_codes.update(user.completed_DE)
+    return selected_courses
 
-# ============================================================
-# BUILD courses_left DICTIONARY - CORRECTED VERSION
-# ============================================================
 
-print("\n" + "="*70)
-print("📋 BUILDING courses_left")
-print("="*70)
+def build_courses_left(user, selected_courses):
+    """Every incomplete program course, offered in every remaining semester"""
+    print("\n" + "="*70)
+    print("📋 BUILDING courses_left")
+    print("="*70)
 
-courses_left = {}
+    courses_left = {}
 
-# Build set of all completed courses
-all_completed_codes = set(user.completed_corecourses)
-all_completed_codes.update(user.completed_hul)
-all_completed_codes.update(user.completed_DE)
+    # Build set of all completed courses
+    all_completed_codes = set(user.completed_corecourses)
+    all_completed_codes.update(user.completed_hul)
+    all_completed_codes.update(user.completed_DE)
 
-print(f"Current semester: {user.current_semester}")
-print(f"Completed courses: {len(all_completed_codes)}")
+    print(f"Current semester: {user.current_semester}")
+    print(f"Completed courses: {len(all_completed_codes)}")
 
-# STEP 1: Add courses to ALL future semesters for flexibility
-for sem, courses in selected_courses.items():
-    for course in courses:
-        code = course["code"]
-        ctype = course.get("type", "")
-        
-        # Skip if already completed
-        if code in all_completed_codes:
-            continue
-        
-        # Add to ALL future semesters (gives solver flexibility)
-        for future_sem in range(user.current_semester, 9):
-            if future_sem not in courses_left:
-                courses_left[future_sem] = []
+    # STEP 1: Add courses to ALL future semesters for flexibility
+    for sem, courses in selected_courses.items():
+        for course in courses:
+            code = course["code"]
             
-            # Only add if not already present
-            if not any(c["code"] == code for c in courses_left[future_sem]):
-                courses_left[future_sem].append(course)
-
-print(f"✅ All incomplete courses added to semesters {user.current_semester}-8")
-print("="*70 + "\n")
-
-# Save courses_left
-output_file = "courses_left.json"
-with open(output_file, "w",encoding="utf-8") as f:
-    json.dump(courses_left, f, indent=4)
-
-print(f"✅ Courses left saved to '{output_file}'")
-
-# Count UNIQUE courses per type
-unique_core = set()
-unique_hul = set()
-unique_de = set()
-
-for sem, courses in courses_left.items():
-    for c in courses:
-        if c.get("type") == "Core":
-            unique_core.add(c["code"])
-        elif c.get("type", "").startswith("HUL"):
-            unique_hul.add(c["code"])
-        elif c.get("type") == "DE":
-            unique_de.add(c["code"])
-
-print(f"\n📊 Unique Courses Available:")
-print(f"  Core: {len(unique_core)} courses")
-print(f"  HUL: {len(unique_hul)} courses")
-print(f"  DE: {len(unique_de)} courses")
-
-print(f"\n  Per-semester breakdown:")
-for sem in sorted(courses_left.keys()):
-    hul_count = sum(1 for c in courses_left[sem] if c.get("type", "").startswith("HUL"))
-    de_count = sum(1 for c in courses_left[sem] if c.get("type") == "DE")
-    core_count = sum(1 for c in courses_left[sem] if c.get("type") == "Core")
-    total_count = len(courses_left[sem])
-    print(f"    Semester {sem}: {total_count} courses ({core_count} Core, {hul_count} HUL, {de_count} DE)")
-
-
-# Save courses_left
-
-
-# DIAGNOSTIC: Check Core Course Distribution
-# ============================================================
-
-# print("\n" + "="*70)
-# print("🔍 DIAGNOSTIC: Core Course Credits Per Semester")
-# print("="*70)
+            # Skip if already completed
+            if code in all_completed_codes:
+                continue
+            
+            # Add to ALL future semesters (gives solver flexibility)
+            for future_sem in range(user.current_semester, 9):
+                if future_sem not in courses_left:
+                    courses_left[future_sem] = []
+                
+                # Only add if not already present
+                if not any(c["code"] == code for c in courses_left[future_sem]):
+                    courses_left[future_sem].append(course)
 
-# for sem in sorted(courses_left.keys()):
-#     core_courses = [c for c in courses_left[sem] if c.get("type") == "Core"]
-#     core_credits = sum(c["credits"] for c in core_courses)
-    
-#     print(f"\n  Semester {sem}:")
-#     print(f"     Core courses: {len(core_courses)}")
-#     print(f"     Core credits: {core_credits}")
-    
-  
-    
-#     if core_courses:
-#         print(f"     Courses:")
-#         for c in core_courses:
-#             print(f"       • {c['code']}: {c['name']} ({c['credits']} cr)")
+    print(f"✅ All incomplete courses added to semesters {user.current_semester}-8")
+    print("="*70 + "\n")
 
-# print("="*70 + "\n")
+    # Count UNIQUE courses per type
+    unique_core = set()
+    unique_hul = set()
+    unique_de = set()
 
+    for sem, courses in courses_left.items():
+        for c in courses:
+            if c.get("type") == "Core":
+                unique_core.add(c["code"])
+            elif c.get("type", "").startswith("HUL"):
+                unique_hul.add(c["code"])
+            elif c.get("type") == "DE":
+                unique_de.add(c["code"])
+
+    print(f"\n📊 Unique Courses Available:")
+    print(f"  Core: {len(unique_core)} courses")
+    print(f"  HUL: {len(unique_hul)} courses")
+    print(f"  DE: {len(unique_de)} courses")
+
+    print(f"\n  Per-semester breakdown:")
+    for sem in sorted(courses_left.keys()):
+        hul_count = sum(1 for c in courses_left[sem] if c.get("type", "").startswith("HUL"))
+        de_count = sum(1 for c in courses_left[sem] if c.get("type") == "DE")
+        core_count = sum(1 for c in courses_left[sem] if c.get("type") == "Core")
+        total_count = len(courses_left[sem])
+        print(f"    Semester {sem}: {total_count} courses ({core_count} Core, {hul_count} HUL, {de_count} DE)")
 
-# ============================================================
-# MINOR INTEGRATION
-# ============================================================
+    return courses_left
 
-# Select a minor (or set to None)
-SELECTED_MINOR = "Computer Science"  # Change this
 
-if SELECTED_MINOR:
+def integrate_minor(minor_name, courses_left, selected_courses, user, all_courses):
+    """
+    Add a minor's courses to courses_left.
+    Returns (courses_left, minor_req, overlap_info).
+    """
     print("\n" + "="*70)
-    print(f"🎓 INTEGRATING MINOR: {SELECTED_MINOR}")
+    print(f"🎓 INTEGRATING MINOR: {minor_name}")
     print("="*70)
     
     # Initialize minor planner
-    mp = MinorPlanner()
+    mp = MinorPlanner(catalog=all_courses)
     
     # Get minor requirements
-    minor_req = mp.get_minor_requirements(SELECTED_MINOR)               #ntegrates the minor courses into the remaining courses you need (courses_left).
+    minor_req = mp.get_minor_requirements(minor_name)               #ntegrates the minor courses into the remaining courses you need (courses_left).
     if minor_req:
         print(f"\n📋 Minor Requirements:")
         print(f"   Total: {minor_req['total_required']} credits")
@@ -338,21 +173,12 @@ if SELECTED_MINOR:
     
     # Add minor courses to courses_left
     courses_left, overlap_info = mp.add_minor_to_courses_left(
-        SELECTED_MINOR,
+        minor_name,
         courses_left,
         selected_courses,  # Your EE program courses
         user.current_semester,
-        parse_prereqs      # Your parse_prereqs function
     )
     
-    # Save updated courses_left
-    with open("courses_left.json", "w",encoding="utf-8") as f:
-        json.dump(courses_left, f, indent=4)
-    
-    # Update user
-    user.selected_minor = SELECTED_MINOR                #courses_left: Updated dictionary including minor courses
-    user.overlap_info = overlap_info                     #overlap_info: Information about any overlapping courses currently being done and also in scope of minor  
-    
     print("\n Updated Summary (with minor):")
     for sem in sorted(courses_left.keys()):
         core_count = sum(1 for c in courses_left[sem] if c.get("type") == "Core")
@@ -364,815 +190,598 @@ if SELECTED_MINOR:
               f"({core_count} Core, {hul_count} HUL, {de_count} DE, {minor_count} Minor)")
     
     print("="*70 + "\n")
-else:
-    mp = None
-    minor_req = None
-    overlap_info = None
+    return courses_left, minor_req, overlap_info
 
 
-
-# creation of boolean variables for all courses_sem Eg: ELL202_sem3 - yes or no 
-# we create a dictionary course_var in which we add tuple:bool var as key:value pair e.g. (3, "ELL202"): BoolVar("ELL202_sem3"),
 # ============================================================
-# CONSTRAINT 1: SEMESTER CREDIT LIMITS WITH EXTENDED CREDITS
-# Replace your existing CONSTRAINT 1 section with this entire block
+# PLANNING API
 # ============================================================
+# Importing planner.py has no side effects: nothing is loaded, solved, printed
+# or written until PlanModelBuilder / plan() are called. A warm process (cohort
+# batch, service) keeps one builder per program, so the catalog, the expanded
+# program and the per-student courses_left are loaded once and reused.
 
-model = cp_model.CpModel()
-course_vars = {}
+def recommended_semesters(program):
+    """{code: semester} of the recommended sequence (placeholders such as DE match no course)"""
+    return {
+        code: sem
+        for sem, course_list in enumerate(program["recommended"], start=1)
+        for code in course_list
+    }
 
-# ============================================================
-# CREATE ALL COURSE VARIABLES FIRST
-# ============================================================
-print("\n📋 Creating course variables...")
-total_vars = 0
-for sem, courses in courses_left.items():
-    for course in courses:
-        code = course["code"]
-        course_vars[(sem, code)] = model.NewBoolVar(f"{code}_sem{sem}")
-        total_vars += 1
-
-print(f"✅ Created {total_vars} course variables across {len(courses_left)} semesters")
-print(f"   Average {total_vars // len(courses_left)} variables per semester\n")
 
-# ============================================================
-# CONSTRAINT 1: SEMESTER CREDIT LIMITS WITH EXTENDED CREDITS
-# ============================================================
+class PlanModelBuilder:
+    """
+    Builds plan models for many students of one program over the shared catalog.
 
-print("="*70)
-print("📋 CONSTRAINT 1: Semester Credit Limits (with Extended Credits)")
-print("="*70)
+        builder = PlanModelBuilder(Electrical)
+        built = builder.build(student, minor="Computer Science")
+        result = solve_plan(built)
 
-extended_semester_vars = {}
+    config overrides CONFIG keys (e.g. {"MODEL_ENGINE": "int"}).
+    """
 
-for sem, courses in courses_left.items():
-    total_credits = 0
-    
-    for course in courses:
-        code = course["code"]
-        total_credits += course_vars[(sem, code)] * int(course["credits"] * CONFIG["CREDIT_SCALE"])
-    
-    # Minimum credits constraint
-    model.Add(total_credits >= user.min_credits * CONFIG["CREDIT_SCALE"])
-    
-    # Maximum credits with extended credit rules
-    if sem > 2:
-        # After semester 2, can use up to 26.5 credits
-        model.Add(total_credits <= int(26.5 * CONFIG["CREDIT_SCALE"]))
-        
-        # Track if using extended credits
-        extended_semester_vars[sem] = model.NewBoolVar(f"extended_sem{sem}")
-        
-        # If not using extended, max is 24
-        model.Add(total_credits <= 24 * CONFIG["CREDIT_SCALE"]).OnlyEnforceIf(
-            extended_semester_vars[sem].Not()
+    def __init__(self, program=Electrical, config=None, catalog=None):
+        self.program = program
+        self.config = {**CONFIG, **(config or {})}
+        self.catalog = catalog if catalog is not None else get_catalog()
+        self.program_key = artifact_key(
+            "selected_courses",
+            file_digest(self.catalog.path),
+            file_digest(self.catalog.overlay_path),
+            spec_digest(program),
+            source_digest(),
         )
-    else:
-        # Strict 24 limit for semesters 1-2
-        model.Add(total_credits <= 24 * CONFIG["CREDIT_SCALE"])
-
-# Maximum 2 semesters can use extended credits
-if extended_semester_vars:
-    model.Add(sum(extended_semester_vars.values()) <= 2)
-    print(f"   ✅ Semester credit limits applied")
-    print(f"   ✅ At most 2 semesters can exceed 24 credits (up to 26.5)")
-
-print("="*70 + "\n")
-
-# ============================================================
-# CONSTRAINT 2 (UPDATED): Total Credits with Flexibility
-# Also update your CONSTRAINT 2 to allow some flexibility
-# ============================================================
-
-print("📋 CONSTRAINT 2: Total Credit Target (with flexibility)")
-
-total_target_credits = CONFIG["TOTAL_TARGET_CREDITS"]
-
-# Compute credits already completed
-credits_done = 0
-seen_courses = set()
-
-for sem, courses in user.EE_courses.items():
-    for course in courses:
-        code = course["code"]
-        if code in seen_courses:
-            continue
-
-        if code in user.completed_corecourses or code in user.completed_hul or code in user.completed_DE:
-            credits_done += course["credits"]
-            seen_courses.add(code)
-
-print(f"   Credits completed: {credits_done}")
-print(f"   Total target: {total_target_credits}")
-
-# Target credits for remaining semesters
-remaining_target_credits = int((total_target_credits - credits_done) * CONFIG["CREDIT_SCALE"])
-
-# Create sum across all remaining semesters
-total_remaining_credits = 0
-for (sem, code), var in course_vars.items():
-    for course in courses_left[sem]:
-        if course["code"] == code:
-            total_remaining_credits += var * int(course["credits"] * CONFIG["CREDIT_SCALE"])
-            break
-
-# Allow small flexibility: 150-159 credits total
-# This is because with discrete course credits, hitting exactly 150 might be impossible
-model.Add(total_remaining_credits >= remaining_target_credits)
-model.Add(total_remaining_credits <= remaining_target_credits + int(9 * CONFIG["CREDIT_SCALE"]))
-
-print(f"   Remaining needed: {remaining_target_credits / CONFIG['CREDIT_SCALE']} credits")
-print(f"   Allowed range: {remaining_target_credits / CONFIG['CREDIT_SCALE']}-{(remaining_target_credits + int(9 * CONFIG['CREDIT_SCALE'])) / CONFIG['CREDIT_SCALE']} credits")
-print(f"   ✅ Some flexibility to account for discrete course credits\n")
-
-
-# ============================================================
-# VERIFICATION: Check feasibility with new limits
-# ============================================================
-
-print("🔍 Feasibility Check with Extended Credits:")
-
-num_sems = len([s for s in courses_left.keys() if s > 2])  # Semesters after sem 2
-num_extended_allowed = 2
-
-# Calculate capacity
-normal_sems = num_sems - num_extended_allowed  # Semesters with 24 limit
-extended_sems = min(num_extended_allowed, num_sems)  # Semesters with 26.5 limit
-
-min_possible = num_sems * user.min_credits
-max_possible = (normal_sems * 24) + (extended_sems * 26.5)
-
-target_needed = remaining_target_credits / CONFIG['CREDIT_SCALE']
-
-print(f"   Semesters after sem 2: {num_sems}")
-print(f"   Normal capacity: {normal_sems} × 24 = {normal_sems * 24}")
-print(f"   Extended capacity: {extended_sems} × 26.5 = {extended_sems * 26.5}")
-print(f"   Total capacity: {min_possible} - {max_possible} credits")
-print(f"   Target needed: {target_needed} credits")
-
-if target_needed > max_possible:
-    print(f"   ❌ STILL INFEASIBLE: Need {target_needed - max_possible} more credits!")
-    print(f"      → Consider: Reduce minor requirements or extend to more semesters")
-else:
-    print(f"   ✅ FEASIBLE with extended credits")
-
-print()
- #sets the min credit limit instead of setting exact value like in previous lineconfig
-
-#CONSTRAINT 3 
-# max of 2 hul courses per sem 
-for sem, courses in courses_left.items():
-    hul_vars = []
-    for course in courses:
-        code = course["code"]
-        if course.get("type", "").startswith("HUL"):
-            hul_vars.append(course_vars[(sem, code)])
-    
-    # Constraint: sum of HUL course selection <= MAX_HUL_PER_SEM
-    if hul_vars:
-        model.Add(sum(hul_vars) <= CONFIG["MAX_HUL_PER_SEM"])
-
-# CONSTRAINT 4: PREREQS SHOULD COME BEFORE ACTUAL COURSE 
-for (sem, code), var in course_vars.items():
-    course_data = None
-    for c in courses_left[sem]:
-        if c["code"] == code:
-            course_data = c
-            break
-    
-    if course_data is None:
-        continue
-    
-    prereqs_parsed = course_data.get("prereqs_parsed", [])
-    
-    if not prereqs_parsed:
-        continue
-    
-    # For each prerequisite path, check if all courses in that path are satisfied
-    path_constraints = []
-    
-    for prereq_path in prereqs_parsed:
-        # Check if this path can be satisfied
-        prereq_vars_in_path = []
-        all_prereqs_satisfiable = True
-        
-        for prereq_code in prereq_path:
-            # Check if prereq is already completed
-            if (prereq_code in user.completed_corecourses or 
-                prereq_code in user.completed_hul or 
-                prereq_code in user.completed_DE):
-                # Prereq already done - automatically satisfied
-                continue
-            
-            # Check if prereq is in a future semester (can be scheduled)
-            prereq_found = False
-            for sem_p in range(1, sem):
-                if (sem_p, prereq_code) in course_vars:
-                    prereq_vars_in_path.append(course_vars[(sem_p, prereq_code)])
-                    prereq_found = True
-                    break
-            
-            if not prereq_found:
-                # Prereq not completed and not available in earlier semesters
-                all_prereqs_satisfiable = False
-                break
-        
-        # If this path is satisfiable
-        if all_prereqs_satisfiable:
-            if len(prereq_vars_in_path) == 0:
-                # All prereqs already completed - path is automatically satisfied
-                path_var = model.NewBoolVar(f'path_{code}_sem{sem}_completed')
-                model.Add(path_var == 1)  # Always satisfied
-                path_constraints.append(path_var)
-            elif len(prereq_vars_in_path) > 0:
-                # Some prereqs need to be scheduled
-                path_var = model.NewBoolVar(f'path_{code}_sem{sem}_{prereq_path}')
-                
-                # path_var == 1 iff all remaining prereqs are taken
-                model.AddMinEquality(path_var, prereq_vars_in_path)
-                
-                path_constraints.append(path_var)
-    
-    # If taking this course, at least one path must be satisfied
-    if path_constraints:
-        model.Add(sum(path_constraints) >= var)
-                 
-
-# Constraint 5 : every core course must be taken exactly once across the degree
-# Constraint 5: Every course must be taken AT MOST once across the degree
-# (Core courses exactly once, others at most once)
-
-print("\n📋 Applying Constraint 5: Course Uniqueness")
-
-# Collect all unique course codes across all semesters
-all_course_codes = {course["code"] for sem in courses_left.values() for course in sem}
-
-core_count = 0
-other_count = 0
-
-for code in all_course_codes:
-    # Gather all variables for this course across all semesters
-    course_vars_list = [var for (s, c), var in course_vars.items() if c == code]
-
-    if len(course_vars_list) > 1:
-        # Determine course type
-        course_type = next(
-            (course.get("type") for sem in courses_left.values() for course in sem if course["code"] == code),
-            None
+        self._selected_courses = None
+        self._plan_inputs = {}      # plan key -> courses_left / minor_req / overlap_info
+        self._templates = {}        # (first semester, minor) -> (ModelTemplate, its plan inputs)
+
+    def selected_courses(self):
+        """The program's recommended sequence expanded to course records (cached)"""
+        if self._selected_courses is None:
+            selected_courses = load_artifacts(self.program_key)
+            if selected_courses is None:
+                selected_courses = build_selected_courses(self.catalog, self.program)
+                save_artifacts(self.program_key, selected_courses)
+            self._selected_courses = selected_courses
+        return self._selected_courses
+
+    def student(self, student):
+        """A copy of a UserData with the program courses filled in (the caller's object is not touched)"""
+        student = copy.copy(student)
+        if not student.EE_courses:
+            student.EE_courses = self.selected_courses()
+        return student
+
+    def plan_key(self, student, minor=None):
+        return artifact_key(
+            "courses_left",
+            self.program_key,
+            file_digest(MINORS_PATH) if minor else "",
+            spec_digest(student_state(student)),
+            minor,
         )
 
-        if course_type == "Core":
-            model.Add(sum(course_vars_list) == 1)
-            core_count += 1
+    def plan_inputs(self, student, minor=None):
+        """{"key", "courses_left", "minor_req", "overlap_info"} for a student (cached)"""
+        key = self.plan_key(student, minor)
+        if key in self._plan_inputs:
+            return self._plan_inputs[key]
+
+        inputs = load_artifacts(key)
+        if inputs is None:
+            selected_courses = self.selected_courses()
+            courses_left = build_courses_left(student, selected_courses)
+
+            minor_req = None
+            overlap_info = None
+            if minor:
+                courses_left, minor_req, overlap_info = integrate_minor(
+                    minor, courses_left, selected_courses, student, self.catalog
+                )
+
+            inputs = {"courses_left": courses_left, "minor_req": minor_req, "overlap_info": overlap_info}
+            save_artifacts(key, inputs)
+        else:
+            # Minor courses missing from data.json get their ids per process: re-register them
+            inputs["courses_left"] = {sem: [self.catalog.adopt(course) for course in courses]
+                                      for sem, courses in inputs["courses_left"].items()}
+            print(f"♻️  Inputs unchanged - reusing cached courses_left "
+                  f"({sum(len(c) for c in inputs['courses_left'].values())} course slots, minor: {minor})")
+
+        self._plan_inputs[key] = {"key": key, **inputs}
+        return self._plan_inputs[key]
+
+    def template(self, current_semester, minor=None):
+        """(ModelTemplate, plan inputs) shared by the students starting at current_semester (cached)"""
+        key = (current_semester, minor)
+        if key not in self._templates:
+            blank = self.student(UserData(name="Template", current_semester=current_semester, completed_corecourses=[]))
+            inputs = self.plan_inputs(blank, minor)
+            template = ModelTemplate(inputs["courses_left"], blank, self.config, self.catalog,
+                                     inputs["minor_req"] if minor else None)
+            self._templates[key] = (template, inputs)
+        return self._templates[key]
+
+    def build(self, student, minor=None, previous=None):
+        """
+        Presolve and build the CP-SAT model for one student. Returns a dict with
+        the model, course_vars ((sem, course id) -> literal), course_at
+        ((sem, course id) -> course record), the pruned courses_left and the
+        credit bookkeeping of the engine. previous (a result's semester_plan)
+        is used as the warm start instead of the recommended sequence.
+        """
+        student = self.student(student)
+        use_template = self.config["MODEL_TEMPLATE"] and self.config["MODEL_ENGINE"] == "bool"
+        if use_template:
+            template, inputs = self.template(student.current_semester, minor)
+        else:
+            inputs = self.plan_inputs(student, minor)
+        if minor:
+            student.selected_minor = minor                      # courses_left includes the minor courses
+            student.overlap_info = inputs["overlap_info"]       # overlapping courses currently being done and in scope of the minor
+
+        if use_template:
+            # Presolve and model in one go: the department template with this student's
+            # completions, credit targets and semester windows fixed (model_template.py)
+            model, course_vars, info = template.instantiate(student)
+            courses_left, unschedulable = info["courses_left"], info["unschedulable"]
+            print(f"\n🧩 Model from the department template: {len(course_vars)} open course slots")
+            if unschedulable:
+                print(f"   ⚠ No feasible semester for: {', '.join(unschedulable)}")
         else:
-            model.Add(sum(course_vars_list) <= 1)
-            other_count += 1
+            # PRESOLVE: semester windows from the prerequisite DAG
+            # courses_left offers every course in every remaining semester; a course can't
+            # come before its prereq chain allows, and a Core course can't come after the
+            # semester its Core dependents need it by. Variables outside that window are
+            # never created (model_engines.restrict_to_windows).
+            courses_left = inputs["courses_left"]
+            offered = sum(len(courses) for courses in courses_left.values())
+            courses_left, unschedulable = restrict_to_windows(courses_left, student)
+            print(f"\n✂️  Semester windows: {offered} -> {sum(len(courses) for courses in courses_left.values())} course slots")
+            if unschedulable:
+                print(f"   ⚠ No feasible semester for: {', '.join(unschedulable)}")
+
+            # BUILD THE MODEL (engine picked by config["MODEL_ENGINE"], see model_engines.py)
+            build_model = ENGINES[self.config["MODEL_ENGINE"]]
+            model, course_vars, info = build_model(
+                courses_left, student, self.config, self.catalog, inputs["minor_req"] if minor else None,
+                missing_core=missing_core(inputs["courses_left"], unschedulable),   # forces INFEASIBLE
+            )
+        course_at, _ = course_index(courses_left, self.config["CREDIT_SCALE"])
+
+        # WARM START: Core courses in their recommended semester, or the previous plan
+        if self.config["HINTS"]:
+            if previous:
+                preferred = {course.code: sem for sem, courses in previous.items() for course in courses}
+            else:
+                preferred = recommended_semesters(self.program)
+            hinted = add_hints(model, course_vars, course_at, preferred,
+                               complete=bool(previous), strategy=self.config["DECISION_STRATEGY"])
+            print(f"💡 Hinted {hinted} courses from the {'previous plan' if previous else 'recommended sequence'}")
+
+        return {
+            "student": student,
+            "minor": minor,
+            "config": self.config,
+            "courses_left": courses_left,
+            "minor_req": inputs["minor_req"],
+            "unschedulable": unschedulable,
+            "model": model,
+            "course_vars": course_vars,
+            "course_at": course_at,
+            "credits_done": info["credits_done"],
+            "remaining_target_credits": info["remaining_target_credits"],
+        }
+
+    def explain(self, student, minor=None, solver_options=None):
+        """
+        Why a student has no plan: requirements (e.g. "Core course ELL409",
+        "at least 18 credits in semester 8") that cannot all hold together,
+        from one extra solve with every requirement behind an assumption
+        (model_engines.explain_infeasibility), shrunk so that dropping any one
+        of them removes the conflict. None if no conflict was isolated within
+        SOLVER_EXPLAIN_MAX_TIME (nor by the credit-bucket check) - meant for
+        students solve_plan found INFEASIBLE; proving a plan exists this way is slow.
+        """
+        config = {**self.config, **(solver_options or {})}
+        with contextlib.redirect_stdout(io.StringIO()):
+            student = self.student(student)
+            inputs = self.plan_inputs(student, minor)
+            courses_left, unschedulable = restrict_to_windows(inputs["courses_left"], student)
+            solver, _ = new_solver({**config, "SOLVER_MAX_TIME": config["SOLVER_EXPLAIN_MAX_TIME"], "SOLVER_LOG": False})
+            return explain_infeasibility(courses_left, student, config, self.catalog,
+                                         inputs["minor_req"] if minor else None, solver,
+                                         missing_core=missing_core(inputs["courses_left"], unschedulable))
+
+
+def new_solver(config):
+    """
+    (CpSolver, log lines) with the SOLVER_* parameters of a config. The log
+    list collects the search log when SOLVER_LOG is set, otherwise it is None.
+    """
+    solver = cp_model.CpSolver()
+    if config["SOLVER_MAX_TIME"] is not None:
+        solver.parameters.max_time_in_seconds = config["SOLVER_MAX_TIME"]
+    if config["SOLVER_WORKERS"]:
+        solver.parameters.num_workers = config["SOLVER_WORKERS"]
+    if config["SOLVER_SEED"] is not None:
+        solver.parameters.random_seed = config["SOLVER_SEED"]
+    if config["SOLVER_INTERLEAVE"]:
+        solver.parameters.interleave_search = True
+
+    log = None
+    if config["SOLVER_LOG"]:
+        log = []
+        solver.parameters.log_search_progress = True
+        solver.parameters.log_to_stdout = False
+        solver.log_callback = log.append
+    return solver, log
+
+
+def solve_plan(built, solver_options=None):
+    """
+    Solve a model from PlanModelBuilder.build() -> result dict:
+    status ("OPTIMAL", "FEASIBLE", "INFEASIBLE", ...), semester_plan
+    ({sem: [course records]}), minor_courses and the credit bookkeeping.
+    solver_options overrides the SOLVER_* keys of the builder's config.
+    """
+    solver, log = new_solver({**built["config"], **(solver_options or {})})
+    status = solver.Solve(built["model"])
+    value = solver.Value if status in (cp_model.OPTIMAL, cp_model.FEASIBLE) else None
+    return plan_result(built, solver.StatusName(status), solver.WallTime(), value, log)
 
-print(f"✅ Applied uniqueness constraint to {core_count + other_count} courses "
-      f"({core_count} core, {other_count} electives)\n")
 
+def plan_result(built, status, wall_time, value=None, log=None):
+    """
+    Result dict of a solution (see solve_plan). value(literal) reads the
+    solution; None for a solve that found none.
+    """
+    semester_plan = {}
+    minor_courses = []
+    if value is not None:
+        for (sem, cid), var in built["course_vars"].items():
+            if value(var):
+                course = built["course_at"][(sem, cid)]
+                semester_plan.setdefault(sem, []).append(course)
+                if course.get("type", "").startswith("Minor"):
+                    minor_courses.append({
+                        "semester": sem,
+                        "code": course.code,
+                        "name": course["name"],
+                        "credits": course["credits"],
+                        "type": course.get("type")
+                    })
 
+    return {
+        "status": status,
+        "feasible": value is not None,
+        "semester_plan": {sem: semester_plan[sem] for sem in sorted(semester_plan)},
+        "minor_courses": minor_courses,
+        "unschedulable": built["unschedulable"],
+        "credits_done": built["credits_done"],
+        "remaining_target_credits": built["remaining_target_credits"] / built["config"]["CREDIT_SCALE"],
+        "wall_time": wall_time,
+        "solver_log": "\n".join(log) if log is not None else None,
+        "conflicts": None,          # filled in by plan() for infeasible students
+    }
+
+
+class PlanStream(cp_model.CpSolverSolutionCallback):
+    """
+    Solution callback handing every new plan to on_plan(result) as soon as the
+    solver finds it. Plans closer than min_difference course-semester
+    assignments to an earlier one are skipped.
+    """
 
+    def __init__(self, built, on_plan=None, min_difference=1):
+        super().__init__()
+        self.built = built
+        self.on_plan = on_plan
+        self.min_difference = min_difference
+        self.plans = []         # result dicts, in the order found
+        self.taken = []         # their sets of (sem, course id)
+        # without an objective every plan is as good as any other, as CP-SAT reports it
+        self.status = "FEASIBLE" if built["model"].HasObjective() else "OPTIMAL"
+
+    def on_solution_callback(self):
+        taken = {key for key, var in self.built["course_vars"].items() if self.Value(var)}
+        if any(len(earlier - taken) < self.min_difference for earlier in self.taken):
+            return
+        result = plan_result(self.built, self.status, self.WallTime(), self.Value)
+        self.plans.append(result)
+        self.taken.append(taken)
+        if self.on_plan:
+            self.on_plan(result)
+
+
+def alternative_plans(built, k, min_difference=5, on_plan=None, solver_options=None):
+    """
+    Up to k plans from PlanModelBuilder.build(), each moving or dropping at
+    least min_difference of the course-semester assignments of every earlier
+    plan. Plans stream to on_plan(result) as they are found. A round re-solves
+    a copy of the model with one more "differ from this plan" constraint; the
+    stream ends early when no further plan exists (or the time limit hits).
+    """
+    model = built["model"].clone()
+    course_vars = built["course_vars"]
+    config = {**built["config"], **(solver_options or {})}
+    stream = PlanStream(built, on_plan, min_difference)
+
+    while len(stream.plans) < k:
+        found = len(stream.plans)
+        solver, log = new_solver(config)
+        solver.Solve(model, stream)
+        if len(stream.plans) == found:
+            break
+        for taken in stream.taken[found:]:
+            model.Add(sum(course_vars[key] for key in taken) <= len(taken) - min_difference)
+        if log is not None:
+            stream.plans[-1]["solver_log"] = "\n".join(log)
+    return stream.plans[:k]
 
-# Add these constraints after CONSTRAINT 4 (prerequisites) and before CONSTRAINT 5 (core courses)
 
-# CONSTRAINT 6: Minimum HUL credits = 15 across all semesters
-min_hul_credits=CONFIG["MIN_HUL_CREDITS"]
-hul_credit_vars = []
-for (sem, code), var in course_vars.items():
-    # Find course data
-    course_data = None
-    for c in courses_left[sem]:
-        if c["code"] == code:
-            course_data = c
-            break
-    
-    if course_data and course_data.get("type", "").startswith("HUL"):
-        # Add this course's scaled credits if selected
-        hul_credit_vars.append(var * int(course_data["credits"] * CONFIG["CREDIT_SCALE"]))
-
-# Account for already completed HUL credits
-hul_credits_done = sum(
-    course["credits"] for sem, courses in user.EE_courses.items()
-    for course in courses
-    if course["code"] in user.completed_hul
-)
-remaining_hul_needed = int((min_hul_credits - hul_credits_done) * CONFIG["CREDIT_SCALE"])
-
-if hul_credit_vars and remaining_hul_needed > 0:
-    model.Add(sum(hul_credit_vars) >= remaining_hul_needed)
-    print(f"✅ Added HUL credit constraint: min {remaining_hul_needed / CONFIG['CREDIT_SCALE']} more credits needed (total 15)")
-elif remaining_hul_needed <= 0:
-    print(f"✅ HUL credits already satisfied: {hul_credits_done} completed")
-
-# CONSTRAINT 7: Minimum DE credits = 10 across all semesters
-min_de_credits=CONFIG["MIN_DE_CREDITS"]
-de_credit_vars = []
-for (sem, code), var in course_vars.items():
-    # Find course data
-    course_data = None
-    for c in courses_left[sem]:
-        if c["code"] == code:
-            course_data = c
-            break
-    
-    if course_data and course_data.get("type") == "DE":
-        # Add this course's scaled credits if selected
-        de_credit_vars.append(var * int(course_data["credits"] * CONFIG["CREDIT_SCALE"]))
-
-# Account for already completed DE credits
-de_credits_done = sum(
-    course["credits"] for sem, courses in user.EE_courses.items()
-    for course in courses
-    if course["code"] in user.completed_DE
-)
-remaining_de_needed = int((min_de_credits - de_credits_done) * CONFIG["CREDIT_SCALE"])
-
-if de_credit_vars and remaining_de_needed > 0:
-    model.Add(sum(de_credit_vars) >= remaining_de_needed)
-    print(f"✅ Added DE credit constraint: min {remaining_de_needed / CONFIG['CREDIT_SCALE']} more credits needed (total 10)")
-elif remaining_de_needed <= 0:
-    print(f"✅ DE credits already satisfied: {de_credits_done} completed")
-
-
-#CONSTRAINT 8 : SLOTTING
-# ============================================================
-# CONSTRAINT 8: Slot Conflicts
-# ============================================================
+_builders = {}      # (program code, config) -> PlanModelBuilder, reused across plan() calls
 
-print("📋 CONSTRAINT 8: Slot conflicts (lecture vs lecture)")
 
-for sem, courses in courses_left.items():
-    # Group courses by slot
-    slot_to_courses = {}
-    for course in courses:
-        slot = course.get("slot")
-        if slot:
-            slot_to_courses.setdefault(slot, []).append(course)
+def plan(student, program=Electrical, minor=None, options=None, previous=None):
+    """
+    Plan the remaining semesters of one student: build + solve, quietly.
+
+    options overrides CONFIG keys, e.g. {"MODEL_ENGINE": "int", "SOLVER_MAX_TIME": 2,
+    "SOLVER_WORKERS": 1}; "VERBOSE": True keeps the build/solve progress output.
+    previous (a result's semester_plan) warm-starts the solve; an infeasible
+    result lists the conflicting requirements in "conflicts". Builders are kept
+    per program and model config (SOLVER_* keys only affect the solve), so
+    repeated calls in one process reuse the loaded data.
+    """
+    options = dict(options or {})
+    verbose = options.pop("VERBOSE", False)
+    solver_options = {name: options.pop(name) for name in list(options) if name.startswith("SOLVER_")}
+    key = (program["code"], spec_digest(options))
+    if key not in _builders:
+        _builders[key] = PlanModelBuilder(program, options)
+    builder = _builders[key]
+
+    with contextlib.nullcontext() if verbose else contextlib.redirect_stdout(io.StringIO()):
+        result = solve_plan(builder.build(student, minor, previous), solver_options)
+    if result["status"] == "INFEASIBLE":
+        result["conflicts"] = builder.explain(student, minor, solver_options)
+    return result
 
-    # Apply lecture-lecture constraint
-    for slot, slot_courses in slot_to_courses.items():
-        # Only consider lecture courses
-        lecture_courses = [c for c in slot_courses if c.get("hours", {}).get("lecture", 0) > 0]
-        
-        if len(lecture_courses) > 1:
-            # At most 1 lecture in this slot
-            vars_in_slot = [course_vars[(sem, c["code"])] for c in lecture_courses]
-            model.Add(sum(vars_in_slot) <= 1)
-            print(f"   ✅ Slot '{slot}' lecture conflict constraint added ({len(vars_in_slot)} courses)")
 
-print("✅ Slot constraints applied\n")
+def print_pre_solve(built):
+    """Pre-solve summary: credit targets and a quick feasibility check"""
+    user = built["student"]
+    courses_left = built["courses_left"]
+    credits_done = built["credits_done"]
+    remaining_target_credits = built["remaining_target_credits"]
+    scale = built["config"]["CREDIT_SCALE"]         # the built model's, not the module default
+
+    # RIGHT BEFORE solver.Solve(model)
+    print("\n🔍 PRE-SOLVE DEBUG:")
+    print(f"Semesters to plan: {sorted(courses_left.keys())}")
+    print(f"Total credits already done: {credits_done}")
+    print(f"Remaining credits needed: {remaining_target_credits / scale}")
+    print(f"Min/Max credits per semester: {user.min_credits} - {user.max_credits}")
+
+    # Calculate if solution is even possible
+    num_future_sems = len(courses_left.keys())
+    min_possible = num_future_sems * user.min_credits
+    max_possible = num_future_sems * user.max_credits
+    target_needed = remaining_target_credits / scale
+
+    print(f"\n📊 Feasibility check:")
+    print(f"  Future semesters: {num_future_sems}")
+    print(f"  Possible credit range: {min_possible} - {max_possible}")
+    print(f"  Target needed: {target_needed}")
+
+    if target_needed < min_possible:
+        print("  ❌ PROBLEM: Need too few credits (will exceed minimum)")
+    elif target_needed > max_possible:
+        print("  ❌ PROBLEM: Need too many credits (can't fit in max limits)")
+    else:
+        print("  ✅ Feasible range")
 
+    # Count available courses per semester
+    for sem in sorted(courses_left.keys()):
+        total_available = sum(c["credits"] for c in courses_left[sem])
+        core_credits = sum(c["credits"] for c in courses_left[sem] if c.get("type") == "Core")
+        print(f"\n  Sem {sem}: {len(courses_left[sem])} courses, {total_available} total credits")
+        print(f"    Core (mandatory): {core_credits} credits")
+
+
+def print_plan(result, user, minor=None):
+    """Solver status and the semester-wise plan, grouped by course type"""
+    # CHECK SOLVER STATUS
+    if result["status"] == "OPTIMAL":
+        print("✅ Optimal solution found!")
+    elif result["status"] == "FEASIBLE":
+        print("⚠️ Feasible solution found (not optimal)")
+    elif result["status"] == "INFEASIBLE":
+        print("❌ NO SOLUTION EXISTS - Constraints are impossible to satisfy!")
+        print("\n🔍 Debugging info:")
+        print(f"  - Completed credits: {result['credits_done']}")
+        print(f"  - Remaining target: {result['remaining_target_credits']}")
+        print(f"  - User min/max per sem: {user.min_credits} - {user.max_credits}")
+        if result["conflicts"]:
+            print("\n🔬 These requirements cannot all hold together:")
+            for requirement in result["conflicts"]:
+                print(f"   • {requirement}")
+        elif result["conflicts"] == []:
+            print("\n🔬 No named requirement is involved (check course uniqueness / unschedulable courses)")
+        else:
+            print("\n🔬 No conflict isolated within the time limit (SOLVER_EXPLAIN_MAX_TIME)")
+    else:
+        print(f"❓ Unknown status: {result['status']}")
 
-# ============================================================
-# MINOR CONSTRAINTS
-# ============================================================
+    if not result["feasible"]:
+        return
 
-if SELECTED_MINOR and minor_req:
+    # Print semester-wise plan
     print("\n" + "="*70)
-    print("🎯 Adding Minor Constraints")
-    print("="*70)
-    
-    # Collect minor course variables
-    minor_core_vars = []
-    minor_elec_vars = []
-    minor_all_credits = []
-    
-    for (sem, code), var in course_vars.items():
-        for c in courses_left[sem]:
-            if c["code"] == code and c.get("type", "").startswith("Minor"):
-                scaled_credits = var * int(c["credits"] * CONFIG["CREDIT_SCALE"])
-                
-                if c.get("type") == "Minor_Core":
-                    minor_core_vars.append(var)
-                    minor_all_credits.append(scaled_credits)
-                elif c.get("type") == "Minor_Elective":
-                    minor_elec_vars.append(var)
-                    minor_all_credits.append(scaled_credits)
-                break
-    
-    print(f"   Found {len(minor_core_vars)} core + {len(minor_elec_vars)} elective courses")
-    
-    if minor_all_credits:
-        # CONSTRAINT: Minimum unique minor credits (10 credits)
-        unique_required = CONFIG["MINOR_UNIQUE_CREDITS"]
-        min_scaled = int(unique_required * CONFIG["CREDIT_SCALE"])
-        
-        model.Add(sum(minor_all_credits) >= min_scaled)
-        print(f"   ✅ Minimum {unique_required} unique minor credits")
-        print(f"      (+ {CONFIG['MINOR_OC_CREDITS']} from OC = {CONFIG['MINOR_TOTAL_CREDITS']} total)")
-        
-        # CONSTRAINT: Core requirements
-        if minor_req["core_required"] > 0:
-            core_credits = [
-                var * int(c["credits"] * CONFIG["CREDIT_SCALE"])
-                for (sem, code), var in course_vars.items()
-                for c in courses_left[sem]
-                if c["code"] == code and c.get("type") == "Minor_Core"
-            ]
-            
-            if core_credits:
-                core_scaled = int(minor_req["core_required"] * CONFIG["CREDIT_SCALE"])
-                model.Add(sum(core_credits) >= core_scaled)
-                print(f"   ✅ Minimum {minor_req['core_required']} core credits")
-        
-        # CONSTRAINT: Max minor courses per semester
-        max_per_sem = CONFIG["MAX_MINOR_PER_SEM"]
-        for sem in courses_left.keys():
-            sem_minor_vars = [
-                var for (s, code), var in course_vars.items()
-                if s == sem
-                for c in courses_left[sem]
-                if c["code"] == code and c.get("type", "").startswith("Minor")
-            ]
-            if sem_minor_vars:
-                model.Add(sum(sem_minor_vars) <= max_per_sem)
-        
-        print(f"   ✅ Max {max_per_sem} minor courses per semester")
-    
+    print("📅 SEMESTER-WISE PLAN")
     print("="*70)
 
+    semester_plan = result["semester_plan"]
+    for sem in sorted(semester_plan.keys()):
+        print(f"\n{'='*70}")
+        print(f"📘 SEMESTER {sem}")
+        print(f"{'='*70}")
+
+        # Categorize courses
+        core = [c for c in semester_plan[sem] if c.get("type") == "Core"]
+        de = [c for c in semester_plan[sem] if c.get("type") == "DE"]
+        hul = [c for c in semester_plan[sem] if c.get("type", "").startswith("HUL")]
+        minor_core = [c for c in semester_plan[sem] if c.get("type") == "Minor_Core"]
+        minor_elec = [c for c in semester_plan[sem] if c.get("type") == "Minor_Elective"]
+
+        # Helper to print courses with slot
+        def print_course(c, extra=""):
+            slot = c.get("slot", "N/A")
+            print(f"    • {c['code']}: {c['name']} ({c['credits']} cr) [Slot: {slot}] {extra}")
+            if c.get('prereqs'):
+                print(f"      Prereqs: {c['prereqs']}")
+
+        # Print Core courses
+        if core:
+            print(f"\n  🔵 CORE COURSES:")
+            for c in core:
+                print_course(c)
+
+        # Print Minor courses
+        if minor_core or minor_elec:
+            print(f"\n  🟢 MINOR COURSES ({minor}):")
+            for c in minor_core:
+                print_course(c, "[CORE]")
+            for c in minor_elec:
+                print_course(c, "[ELECTIVE]")
+
+        # Print Department Electives
+        if de:
+            print(f"\n  🟡 DEPARTMENT ELECTIVES:")
+            for c in de:
+                print_course(c)
+
+        # Print Humanities
+        if hul:
+            print(f"\n  🟣 HUMANITIES:")
+            for c in hul:
+                print_course(c)
+
+        # Total credits for semester
+        total = sum(c['credits'] for c in semester_plan[sem])
+        print(f"\n  {'─'*66}")
+        print(f"  📊 Total Credits: {total}")
+        if total > 24:
+            print(f"      ⚠️  Extended credits (normal max is 24)")
+        print(f"  {'─'*66}")
 
 
 
+#--------------------------------------------------------------------------------#
 
 
+# Corrected User Initialization in planner.py
 
+def sample_student(selected_courses):
+    """The sample EE1 student the planner is run for"""
+    return UserData(
+        name="Monisha",
+        current_semester=4,  # You're STARTING semester 5 (not in it yet)
+        EE_courses=selected_courses,
 
+        # ALL courses completed in semesters 1-4
+        completed_corecourses=[
+            # Semester 1
+            'ELL101', 'PYL101', 'ELP101', 'MTL100', 'COL100',
+            'PYP100','NLN100',
 
+            # Semester 2
+            'APL100', 'CML101', 'MTL101', 'CMP100','MCP100','MCP101','NLN101',
 
+            # Semester 3
+            'ELL205', 'ELL203', 'ELL211', 'COL106', 'ELL202',
 
+            # Add any other CORE courses you've completed
+        ],
 
+        completed_hul=[
+            'HUL270',  # Add any HUL courses completed in sem 1-4
+        ],
 
+        completed_DE=[
+            # Add any DE courses completed
+        ],
 
+        completed_minor=[
+            'COL100',  # This was in your major, counts for minor too
+            'COL106',  # This was in your major, counts for minor too
+        ],
 
+        minor_type="CS",
+        min_credits=18,
+        max_credits=24
+    )
 
 
+# Select a minor (or set to None)
+SELECTED_MINOR = "Computer Science"  # Change this
 
 
+def main():
+    # 1️⃣ Load master data JSON (shared catalog, parsed once per process)
+    builder = PlanModelBuilder(Electrical)
 
+    # 2️⃣ Extract recommended courses semester-wise
+    # Derived artifacts are cached under a hash of everything they come from, so an
+    # unchanged re-run skips both the rebuild and the JSON writes.
+    selected_courses = builder.selected_courses()
+    output_file = f"{Electrical['code']}_courses_data.json"
+    if not is_written(output_file, builder.program_key):
+        # 3️⃣ Save to a JSON file (optional)
+        with atomic_write(output_file, "w", encoding="utf-8") as f:
+            json.dump(selected_courses, f, indent=4, default=Course.to_dict)
+        mark_written(output_file, builder.program_key)
 
-
-# RIGHT BEFORE solver.Solve(model)
-print("\n🔍 PRE-SOLVE DEBUG:")
-print(f"Semesters to plan: {sorted(courses_left.keys())}")
-print(f"Total credits already done: {credits_done}")
-print(f"Remaining credits needed: {remaining_target_credits / CONFIG['CREDIT_SCALE']}")
-print(f"Min/Max credits per semester: {user.min_credits} - {user.max_credits}")
-
-# Calculate if solution is even possible
-num_future_sems = len(courses_left.keys())
-min_possible = num_future_sems * user.min_credits
-max_possible = num_future_sems * user.max_credits
-target_needed = remaining_target_credits / CONFIG['CREDIT_SCALE']
-
-print(f"\n📊 Feasibility check:")
-print(f"  Future semesters: {num_future_sems}")
-print(f"  Possible credit range: {min_possible} - {max_possible}")
-print(f"  Target needed: {target_needed}")
-
-if target_needed < min_possible:
-    print("  ❌ PROBLEM: Need too few credits (will exceed minimum)")
-elif target_needed > max_possible:
-    print("  ❌ PROBLEM: Need too many credits (can't fit in max limits)")
-else:
-    print("  ✅ Feasible range")
-
-# Count available courses per semester
-for sem in sorted(courses_left.keys()):
-    total_available = sum(c["credits"] for c in courses_left[sem])
-    core_credits = sum(c["credits"] for c in courses_left[sem] if c.get("type") == "Core")
-    print(f"\n  Sem {sem}: {len(courses_left[sem])} courses, {total_available} total credits")
-    print(f"    Core (mandatory): {core_credits} credits")
-
-
-
-
-
-
-
-
-
-
-"""
-Diagnostic tool to identify which constraint is causing infeasibility
-Run this BEFORE the solver to check if your constraints are realistic
-"""
-
-def diagnose_constraints(user, courses_left, CONFIG, course_vars):
-    """
-    Analyze all constraints and identify potential conflicts
-    """
-    print("\n" + "="*70)
-    print("🔬 CONSTRAINT DIAGNOSTICS")
-    print("="*70)
-    
-    # Basic info
-    credits_done = 36.0  # Your completed credits
-    total_target = CONFIG["TOTAL_TARGET_CREDITS"]
-    remaining_needed = total_target - credits_done
-    
-    num_sems = len(courses_left.keys())
-    min_per_sem = user.min_credits
-    max_per_sem = user.max_credits
-    
-    print(f"\n📊 Basic Setup:")
-    print(f"   Semesters remaining: {num_sems}")
-    print(f"   Credits needed: {remaining_needed}")
-    print(f"   Per-semester range: {min_per_sem} - {max_per_sem}")
-    print(f"   Total capacity: {num_sems * min_per_sem} - {num_sems * max_per_sem}")
-    
-    # Check 1: Is target achievable?
-    min_possible = num_sems * min_per_sem
-    max_possible = num_sems * max_per_sem
-    
-    print(f"\n✓ Check 1: Total Credits Feasibility")
-    if remaining_needed < min_possible:
-        print(f"   ❌ PROBLEM: Need {remaining_needed} but minimum is {min_possible}")
-        print(f"      → You'll be forced to take more credits than needed")
-        print(f"      → SOLUTION: Reduce min_credits or adjust target")
-    elif remaining_needed > max_possible:
-        print(f"   ❌ PROBLEM: Need {remaining_needed} but maximum is {max_possible}")
-        print(f"      → Can't fit all required credits")
-        print(f"      → SOLUTION: Increase max_credits or extend semesters")
-    else:
-        print(f"   ✅ FEASIBLE: {remaining_needed} fits in range {min_possible}-{max_possible}")
-    
-    # Check 2: Core courses
-    print(f"\n✓ Check 2: Core Courses")
-    core_by_sem = {}
-    total_core_credits = 0
-    
-    for sem, courses in courses_left.items():
-        core_courses = [c for c in courses if c.get("type") == "Core"]
-        core_credits = sum(c["credits"] for c in core_courses)
-        core_by_sem[sem] = core_credits
-        total_core_credits += core_credits
-    
-    print(f"   Total mandatory core credits: {total_core_credits}")
-    
-    for sem in sorted(core_by_sem.keys()):
-        credits = core_by_sem[sem]
-        if credits > 0:
-            status = "⚠️" if credits > max_per_sem else "✓"
-            print(f"   {status} Sem {sem}: {credits} credits core (max: {max_per_sem})")
-            if credits > max_per_sem:
-                print(f"      ❌ PROBLEM: Core alone exceeds semester max!")
-    
-    # Check 3: HUL requirements
-    print(f"\n✓ Check 3: HUL Requirements")
-    hul_completed = 0  # You haven't completed any HUL
-    hul_needed = CONFIG["MIN_HUL_CREDITS"] - hul_completed
-    
-    hul_available = 0
-    for sem, courses in courses_left.items():
-        hul_courses = [c for c in courses if c.get("type", "").startswith("HUL")]
-        hul_available += len(hul_courses)
-    
-    print(f"   Need: {hul_needed} credits")
-    print(f"   HUL courses available: {hul_available} courses")
-    print(f"   Max HUL per semester: {CONFIG['MAX_HUL_PER_SEM']}")
-    print(f"   Max possible: {num_sems * CONFIG['MAX_HUL_PER_SEM']} courses = ~{num_sems * CONFIG['MAX_HUL_PER_SEM'] * 4} credits")
-    
-    if hul_needed > num_sems * CONFIG['MAX_HUL_PER_SEM'] * 4:
-        print(f"   ❌ PROBLEM: Can't take enough HUL courses!")
-    else:
-        print(f"   ✅ FEASIBLE")
-    
-    # Check 4: DE requirements
-    print(f"\n✓ Check 4: DE Requirements")
-    de_completed = 0
-    de_needed = CONFIG["MIN_DE_CREDITS"] - de_completed
-    
-    de_available = 0
-    for sem, courses in courses_left.items():
-        de_courses = [c for c in courses if c.get("type") == "DE"]
-        de_available += len(de_courses)
-    
-    print(f"   Need: {de_needed} credits")
-    print(f"   DE courses available: {de_available} courses")
-    
-    if de_needed > 0 and de_available == 0:
-        print(f"   ❌ PROBLEM: Need DE but none available!")
-    else:
-        print(f"   ✅ FEASIBLE")
-    
-    # Check 5: Minor requirements
-    print(f"\n✓ Check 5: Minor Requirements")
-    print(f"   Need: {CONFIG['MINOR_UNIQUE_CREDITS']} unique credits")
-    print(f"   Max per semester: {CONFIG['MAX_MINOR_PER_SEM']}")
-    
-    minor_available = 0
-    for sem, courses in courses_left.items():
-        minor_courses = [c for c in courses if c.get("type", "").startswith("Minor")]
-        minor_available += len(minor_courses)
-    
-    print(f"   Minor courses available: {minor_available} courses")
-    
-    max_minor_credits = num_sems * CONFIG['MAX_MINOR_PER_SEM'] * 4  # Assuming 4 credits per course
-    if CONFIG['MINOR_UNIQUE_CREDITS'] > max_minor_credits:
-        print(f"   ❌ PROBLEM: Can't take enough minor courses!")
-    else:
-        print(f"   ✅ FEASIBLE")
-    
-    # Check 6: Combined feasibility
-    print(f"\n✓ Check 6: Combined Requirements")
-    min_required = total_core_credits + hul_needed + de_needed + CONFIG['MINOR_UNIQUE_CREDITS']
-    
-    print(f"   Minimum to satisfy all:")
-    print(f"      Core: {total_core_credits}")
-    print(f"      HUL: {hul_needed}")
-    print(f"      DE: {de_needed}")
-    print(f"      Minor: {CONFIG['MINOR_UNIQUE_CREDITS']}")
-    print(f"      Total: {min_required}")
-    print(f"   Target: {remaining_needed}")
-    
-    if min_required > remaining_needed:
-        print(f"   ❌ PROBLEM: Minimum requirements ({min_required}) exceed target ({remaining_needed})!")
-        print(f"      Overage: {min_required - remaining_needed} credits")
-    else:
-        print(f"   ✅ FEASIBLE: Have {remaining_needed - min_required} credits of flexibility")
-    
-    # Check 7: Semester-by-semester feasibility
-    print(f"\n✓ Check 7: Semester Feasibility")
-    for sem in sorted(courses_left.keys()):
-        core_cr = sum(c["credits"] for c in courses_left[sem] if c.get("type") == "Core")
-        
-        if core_cr > max_per_sem:
-            print(f"   ❌ Sem {sem}: {core_cr} core credits > max {max_per_sem}")
-        elif core_cr > min_per_sem:
-            print(f"   ⚠️  Sem {sem}: {core_cr} core credits leaves only {max_per_sem - core_cr} for electives")
-        else:
-            print(f"   ✅ Sem {sem}: {core_cr} core credits, {min_per_sem - core_cr}-{max_per_sem - core_cr} for electives")
-    
-    # Summary
-    print(f"\n" + "="*70)
-    print("📋 SUMMARY")
-    print("="*70)
-    
-    issues = []
-    
-    if remaining_needed < min_possible or remaining_needed > max_possible:
-        issues.append("Total credit target infeasible")
-    
-    if any(core_by_sem[sem] > max_per_sem for sem in core_by_sem):
-        issues.append("Core courses exceed semester max")
-    
-    if min_required > remaining_needed:
-        issues.append("All requirements exceed total target")
-    
-    if issues:
-        print("❌ ISSUES FOUND:")
-        for i, issue in enumerate(issues, 1):
-            print(f"   {i}. {issue}")
-        print("\n💡 SUGGESTED FIXES:")
-        print("   1. Increase user.max_credits from 24 to 26-28")
-        print("   2. Reduce CONFIG['TOTAL_TARGET_CREDITS'] if overestimated")
-        print("   3. Temporarily disable minor constraints to test")
-        print("   4. Check if some core courses are duplicated")
+        print(f"✅ Department courses saved to '{output_file}'")
+        print(f"✅ Prerequisites parsed for all courses")
     else:
-        print("✅ All basic checks passed!")
-        print("   If solver still fails, check prerequisites and course availability")
-    
-    print("="*70 + "\n")
-
-
-# ============================================================
-# HOW TO USE THIS DIAGNOSTIC TOOL
-# ============================================================
-
-# Add this line RIGHT BEFORE solver.Solve(model) in your main code:
-# diagnose_constraints(user, courses_left, CONFIG, course_vars)
-#solver : dont edit below this line 
-
-
-#---------dont edit below this line ------------------
-solver = cp_model.CpSolver()
-
-status = solver.Solve(model)
-
-# CHECK SOLVER STATUS
-if status == cp_model.OPTIMAL:
-    print("✅ Optimal solution found!")
-elif status == cp_model.FEASIBLE:
-    print("⚠️ Feasible solution found (not optimal)")
-elif status == cp_model.INFEASIBLE:
-    print("❌ NO SOLUTION EXISTS - Constraints are impossible to satisfy!")
-    print("\n🔍 Debugging info:")
-    print(f"  - Completed credits: {credits_done}")
-    print(f"  - Remaining target: {remaining_target_credits / CONFIG['CREDIT_SCALE']}")
-    print(f"  - User min/max per sem: {user.min_credits} - {user.max_credits}")
-else:
-    print(f"❓ Unknown status: {status}")
-
-# Create a dictionary to collect courses per semester
-# Create a dictionary to collect courses per semester with full info
-semester_plan = {}
-
-for (sem, code), var in course_vars.items():
-    if solver.Value(var):
-        if sem not in semester_plan:
-            semester_plan[sem] = []
-        
-        # Get full course info from courses_left
-        for course in courses_left[sem]:
-            if course["code"] == code:
-                # Append the full course dictionary
-                semester_plan[sem].append(course)
-                break
-
-# Print grouped by semester with all details
-"""for sem in sorted(semester_plan.keys()):
-    print(f"\n📘 Semester {sem}")
-    total_credits = 0
-    for course in semester_plan[sem]:
-        code = course.get("code", "")
-        name = course.get("name", "Unknown Course")
-        credits = course.get("credits", 0)
-        prereqs= course.get("prereqs",[])
-        #desc = course.get("description", "No description available.")
-        ctype = course.get("type", "Unknown")
-
-        total_credits += credits
-        print(f"  - {code}: {name} ({credits} credits, Type: {ctype}), Prerequisites: {prereqs}")
-        #print(f"      {desc}")
-
-    print(f"👉 Total Credits: {total_credits}")"""
-# ============================================================
-# ENHANCED OUTPUT WITH MINOR TRACKING
-# ============================================================
+        print(f"♻️  Inputs unchanged - reusing cached department courses ('{output_file}' is up to date)")
+
+    user = sample_student(selected_courses)
+    user.print_user_summary(debug=True)
+
+    # BUILD courses_left (+ MINOR INTEGRATION) - cached like selected_courses
+    inputs = builder.plan_inputs(user, SELECTED_MINOR)
+    output_file = "courses_left.json"
+    if not is_written(output_file, inputs["key"]):
+        # Save courses_left (once, after the minor is integrated)
+        with atomic_write(output_file, "w", encoding="utf-8") as f:
+            json.dump(inputs["courses_left"], f, indent=4, default=Course.to_dict)
+        mark_written(output_file, inputs["key"])
+        print(f"✅ Courses left saved to '{output_file}'")
+
+    built = builder.build(user, SELECTED_MINOR)
+    print_pre_solve(built)
+
+    if CONFIG["ALTERNATIVE_PLANS"] > 1:
+        # Alternatives are printed one by one, as soon as the solver finds each
+        def show(result):
+            print(f"\n🔀 ALTERNATIVE PLAN (up to {CONFIG['ALTERNATIVE_PLANS']}, found after {result['wall_time']:.2f}s)")
+            print_plan(result, user, SELECTED_MINOR)
+
+        results = alternative_plans(built, CONFIG["ALTERNATIVE_PLANS"], CONFIG["ALTERNATIVE_MIN_DIFFERENCE"], on_plan=show)
+        print(f"\n✅ {len(results)} alternative plans")
+        return results
+
+    result = solve_plan(built)
+    if result["status"] == "INFEASIBLE":
+        # One extra solve with every requirement behind an assumption names the conflict
+        result["conflicts"] = builder.explain(user, SELECTED_MINOR)
+    print_plan(result, user, SELECTED_MINOR)
+    return result
 
-if status == cp_model.OPTIMAL or status == cp_model.FEASIBLE:
-    minor_courses_taken = []
-    
-    # Collect minor courses
-    for (sem, code), var in course_vars.items():
-        if solver.Value(var):
-            for course in courses_left[sem]:
-                if course["code"] == code and course.get("type", "").startswith("Minor"):
-                    minor_courses_taken.append({
-                        "semester": sem,
-                        "code": code,
-                        "name": course["name"],
-                        "credits": course["credits"],
-                        "type": course.get("type")
-                    })
-                    break
-    
-    # Print semester-wise plan
-    print("\n" + "="*70)
-    print("📅 SEMESTER-WISE PLAN")
-print("="*70)
 
-for sem in sorted(semester_plan.keys()):
-    print(f"\n{'='*70}")
-    print(f"📘 SEMESTER {sem}")
-    print(f"{'='*70}")
-    
-    # Categorize courses
-    core = [c for c in semester_plan[sem] if c.get("type") == "Core"]
-    de = [c for c in semester_plan[sem] if c.get("type") == "DE"]
-    hul = [c for c in semester_plan[sem] if c.get("type", "").startswith("HUL")]
-    minor_core = [c for c in semester_plan[sem] if c.get("type") == "Minor_Core"]
-    minor_elec = [c for c in semester_plan[sem] if c.get("type") == "Minor_Elective"]
-    
-    # Helper to print courses with slot
-    def print_course(c, extra=""):
-        slot = c.get("slot", "N/A")
-        print(f"    • {c['code']}: {c['name']} ({c['credits']} cr) [Slot: {slot}] {extra}")
-        if c.get('prereqs'):
-            print(f"      Prereqs: {c['prereqs']}")
-    
-    # Print Core courses
-    if core:
-        print(f"\n  🔵 CORE COURSES:")
-        for c in core:
-            print_course(c)
-    
-    # Print Minor courses
-    if minor_core or minor_elec:
-        print(f"\n  🟢 MINOR COURSES ({SELECTED_MINOR}):")
-        for c in minor_core:
-            print_course(c, "[CORE]")
-        for c in minor_elec:
-            print_course(c, "[ELECTIVE]")
-    
-    # Print Department Electives
-    if de:
-        print(f"\n  🟡 DEPARTMENT ELECTIVES:")
-        for c in de:
-            print_course(c)
-    
-    # Print Humanities
-    if hul:
-        print(f"\n  🟣 HUMANITIES:")
-        for c in hul:
-            print_course(c)
-    
-    # Total credits for semester
-    total = sum(c['credits'] for c in semester_plan[sem])
-    print(f"\n  {'─'*66}")
-    print(f"  📊 Total Credits: {total}")
-    if total > 24:
-        print(f"      ⚠️  Extended credits (normal max is 24)")
-    print(f"  {'─'*66}")
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,295 @@
+"""
+Prerequisite expressions.
+
+A prereq string is parsed into an AND/OR tree of hashable tuples:
+
+    parse_prereqs("[ELL101 and (ELL211 or (ELL231 and EC50))]")
+    -> ("and", (("course", "ELL101"),
+                ("or", (("course", "ELL211"),
+                        ("and", (("course", "ELL231"), ("credits", 50)))))))
+
+Leaves are ("course", code), ("credits", n) for earned-credit rules (EC50) and
+("other", text) for anything else ("instructor_permission", "HUL712[0]", ...).
+"and" binds tighter than "or"; parentheses nest. No prerequisite gives None.
+
+compile_prereqs() turns a tree into a CP-SAT literal with one auxiliary literal
+per and/or node, so the model grows linearly with the expression (the old
+list-of-paths form was the cartesian product of every OR group).
+
+The catalog parses every distinct prereq string once when it is built (see
+catalog_snapshot.py); planning code reads Course.prereqs_parsed and never parses.
+"""
+import re
+
+COURSE_CODE = re.compile(r"[A-Z]{3}\d{3}")
+EARNED_CREDITS = re.compile(r"EC(\d+)")
+_TOKEN = re.compile(r'\(|\)|"[^"]*"|[^\s()]+')
+
+
+def _tokenize(text):
+    text = text.strip()
+    if text.startswith("["):
+        text = text[1:]
+    if text.endswith("]"):
+        text = text[:-1]
+    return _TOKEN.findall(text)
+
+
+def _leaf(token):
+    if COURSE_CODE.fullmatch(token):
+        return ("course", token)
+    match = EARNED_CREDITS.fullmatch(token)
+    if match:
+        return ("credits", int(match.group(1)))
+    return ("other", token.strip('"'))
+
+
+def _node(op, children):
+    """and/or node with nested same-op nodes flattened and duplicates dropped"""
+    flat = []
+    for child in children:
+        for item in (child[1] if child[0] == op else (child,)):
+            if item not in flat:
+                flat.append(item)
+    if not flat:
+        return None
+    if len(flat) == 1:
+        return flat[0]
+    return (op, tuple(flat))
+
+
+def parse_prereqs(prereq_string):
+    """
+    Parse a prerequisite string into an AND/OR tree (None if there is none).
+    Lenient with the catalog's loose strings: unclosed parentheses close at the
+    end, stray ')' and dangling and/or are ignored, and two operands with no
+    operator between them are ANDed.
+    """
+    if not prereq_string or prereq_string.strip() in ["", "[]", "None"]:
+        return None
+
+    tokens = _tokenize(prereq_string)
+    pos = 0
+
+    def parse_or():
+        nonlocal pos
+        terms = []
+        while pos < len(tokens) and tokens[pos] != ")":
+            if tokens[pos].lower() == "or":
+                pos += 1
+                continue
+            term = parse_and()
+            if term is not None:
+                terms.append(term)
+        return _node("or", terms)
+
+    def parse_and():
+        nonlocal pos
+        factors = []
+        while pos < len(tokens) and tokens[pos] != ")" and tokens[pos].lower() != "or":
+            token = tokens[pos]
+            pos += 1
+            if token.lower() == "and":
+                continue
+            if token == "(":
+                factor = parse_or()
+                if pos < len(tokens):
+                    pos += 1                # the matching ')'
+            else:
+                factor = _leaf(token)
+            if factor is not None:
+                factors.append(factor)
+        return _node("and", factors)
+
+    trees = []
+    while pos < len(tokens):
+        tree = parse_or()
+        if tree is not None:
+            trees.append(tree)
+        pos += 1                            # stray ')'
+    return _node("and", trees)
+
+
+_trees = {}     # prereq string -> parsed tree, shared by every course with that string
+
+
+def prereq_tree(prereq_string):
+    """
+    Memoized parse_prereqs(). Trees are immutable tuples, so one parsed tree is
+    shared by every course (and every semester copy) with the same string.
+    """
+    if prereq_string not in _trees:
+        _trees[prereq_string] = parse_prereqs(prereq_string)
+    return _trees[prereq_string]
+
+
+def prereq_leaves(tree, kind=None):
+    """All leaves of a tree (optionally only one kind), in order, without duplicates"""
+    leaves = []
+    stack = [tree] if tree is not None else []
+    while stack:
+        node = stack.pop()
+        if node[0] in ("and", "or"):
+            stack.extend(reversed(node[1]))
+        elif (kind is None or node[0] == kind) and node not in leaves:
+            leaves.append(node)
+    return leaves
+
+
+def format_prereqs(tree):
+    """Readable form of a tree, e.g. 'ELL101 and (ELL211 or ELL231)'"""
+    if tree is None:
+        return ""
+    op, value = tree
+    if op == "course" or op == "other":
+        return value
+    if op == "credits":
+        return f"EC{value}"
+    parts = [format_prereqs(child) for child in value]
+    if op == "and":
+        parts = [f"({part})" if child[0] == "or" else part for part, child in zip(parts, value)]
+    return f" {op} ".join(parts)
+
+
+def compile_prereqs(model, tree, leaf, memo=None, name="prereq"):
+    """
+    Compile a tree into something that holds iff the prerequisites are met:
+    True, False, or a CP-SAT literal.
+
+    leaf(node) gives True / False / a literal for a leaf. Constant children are
+    folded away; every remaining and/or node gets one BoolVar that implies its
+    children (only the "node => children" direction is needed, since the
+    result is only ever required to be true). `memo` (node -> result) shares
+    identical subtrees between courses compiled for the same semester.
+    """
+    if tree is None:
+        return True
+    if memo is None:
+        memo = {}
+    if tree in memo:
+        return memo[tree]
+
+    op, value = tree
+    if op not in ("and", "or"):
+        result = leaf(tree)
+    else:
+        literals = []
+        result = None
+        for child in value:
+            child_result = compile_prereqs(model, child, leaf, memo, name)
+            if child_result is (op == "or"):
+                result = child_result       # True in an or / False in an and decides the node
+                break
+            if child_result is not (op == "and"):
+                literals.append(child_result)
+
+        if result is None:
+            if not literals:
+                result = op == "and"        # every child was the neutral constant
+            elif len(literals) == 1:
+                result = literals[0]
+            else:
+                result = model.NewBoolVar(f"{name}_{op}{len(memo)}")
+                if op == "and":
+                    model.AddBoolAnd(literals).OnlyEnforceIf(result)
+                else:
+                    model.AddBoolOr(literals).OnlyEnforceIf(result)
+
+    memo[tree] = result
+    return result
+
+
+def required_courses(tree):
+    """Course codes needed by every way of meeting the tree (and: union, or: intersection)"""
+    if tree is None:
+        return set()
+    op, value = tree
+    if op == "course":
+        return {value}
+    if op == "and":
+        return set().union(*(required_courses(child) for child in value))
+    if op == "or":
+        return set.intersection(*(required_courses(child) for child in value))
+    return set()
+
+
+def _ready(tree, ready_of):
+    """First semester from which a tree can hold, given ready_of(code) for its course leaves"""
+    if tree is None:
+        return 0
+    op, value = tree
+    if op == "course":
+        return ready_of(value)
+    if op == "and":
+        return max(_ready(child, ready_of) for child in value)
+    if op == "or":
+        return min(_ready(child, ready_of) for child in value)
+    return 0                        # earned credits, permissions, ...: no semester bound
+
+
+def satisfiable(tree, available):
+    """True if some way of meeting the tree only needs course leaves from `available`"""
+    return _ready(tree, lambda code: 0 if code in available else 1) == 0
+
+
+def semester_windows(trees, completed, mandatory, first, last):
+    """
+    Presolve over the prerequisite DAG: {code: (earliest, latest)} semesters in
+    which each planned course can be taken. An empty window (earliest > latest)
+    means the course cannot be taken at all.
+
+    trees:     {code: prereq tree} of the planned courses
+    completed: codes already done (their leaves always hold)
+    mandatory: codes that must be taken (Core); they also get a latest semester,
+               one before the latest semester of every mandatory course that
+               needs them on every prereq path
+
+    A course whose prereqs cannot be met by the plan at all (a prereq outside
+    both the plan and the completed set) is not modelled, as in CONSTRAINT 4,
+    so it keeps the full window.
+    """
+    never = last + 1
+
+    def outside(code):
+        return 0 if code in completed or code in trees else never
+
+    gated = {code for code, tree in trees.items() if _ready(tree, outside) >= never}
+
+    # Backward: latest semester of mandatory courses, from mandatory dependents
+    latest = {code: last for code in trees}
+    changed = True
+    while changed:
+        changed = False
+        for code in mandatory:
+            if code in gated or code not in trees:
+                continue
+            for needed in required_courses(trees[code]):
+                if needed not in mandatory or needed not in latest or needed in completed:
+                    continue
+                bound = max(latest[code] - 1, first - 1)        # first - 1: no semester left
+                if bound < latest[needed]:
+                    latest[needed] = bound
+                    changed = True
+
+    # Forward: earliest semester, one after the earliest semester of the prereqs
+    earliest = {code: first for code in trees}
+
+    def ready_of(code):
+        if code in completed:
+            return 0
+        if code not in trees or earliest[code] > latest[code]:
+            return never
+        return earliest[code] + 1
+
+    changed = True
+    while changed:
+        changed = False
+        for code, tree in trees.items():
+            if code in gated:
+                continue
+            ready = min(max(first, _ready(tree, ready_of)), never)
+            if ready > earliest[code]:
+                earliest[code] = ready
+                changed = True
+
+    return {code: (earliest[code], latest[code]) for code in trees}
@@ -1,23 +1,35 @@
 import json
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from catalog import write_overlay
+from timetable import MEETING_KINDS, parse_meetings
+
+# Term these offerings belong to (overlay file name), e.g. python merge.py 2025-26-2
+TERM = sys.argv[1] if len(sys.argv) > 1 else "2025-26-1"
 
 # Load the clean courses JSON (from CSV)
 with open("courses_clean.json", "r", encoding="utf-8") as f:
     clean_courses = json.load(f)
 
-# Load the existing detailed data.json
-with open("../data.json", "r", encoding="utf-8") as f:
-    detailed_courses = json.load(f)
-
-# Update data.json directly
+# Slot assignments go into a small per-semester overlay; data.json is left untouched
+patches = {}
 for course in clean_courses:
     code = course["Course Code"].strip()
-    slot = course["Slot Name"]
+    patch = {"slot": course["Slot Name"]}           # add or update slot
+
+    # Weekly day x half-hour bitmasks of the actual meeting times
+    timetable = {}
+    for kind in MEETING_KINDS:
+        mask = parse_meetings(course.get(f"{kind.capitalize()} Time"))
+        if mask:
+            timetable[kind] = mask
+    if timetable:
+        patch["timetable"] = timetable
 
-    if code in detailed_courses:
-        detailed_courses[code]["slot"] = slot  # add or update slot
+    patches[code] = patch
 
-# Save the updated data.json
-with open("../data.json", "w", encoding="utf-8") as f:
-    json.dump(detailed_courses, f, indent=4, ensure_ascii=False)
+overlay_file = write_overlay(TERM, patches)
 
-print(f"Updated {len(clean_courses)} courses in data.json with slot info!")
+print(f"Wrote slot info for {len(patches)} courses to {overlay_file}")
@@ -1,54 +1,94 @@
+import glob
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
 import pandas as pd
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from fileio import atomic_write, file_sha256
+
 # Allowed slots
 allowed_slots = set("ABHJCDEFMKL")
 
-csv_files = ["Courses_Offered_1.csv", "Courses_Offered_2.csv"]
-all_dfs = []
+# Parsed offerings are cached per file, keyed by the hash of the file contents
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".offerings_cache")
+PARSER_VERSION = 2      # bump when parse_offerings() output changes
 
-for csv_file in csv_files:
-    # Read CSV, skip first line (department header)
-    df = pd.read_csv(csv_file, skiprows=1)
-    
-    # Strip column names and remove empty ones
-    df.columns = [col.strip() for col in df.columns]
-    df = df.loc[:, df.columns != '']
-    
-    # Extract department from first line
+TIME_COLUMNS = ["Lecture Time", "Tutorial Time", "Practical Time"]
+COLUMNS = ["Department", "Course Code", "Course Name", "Slot Name"] + TIME_COLUMNS
+
+
+def parse_offerings(csv_file):
+    """Parse one Courses_Offered_*.csv into the clean DataFrame"""
     with open(csv_file, encoding="utf-8") as f:
+        # First line is the department header, the table starts right after it
         first_line = f.readline().strip()
+        df = pd.read_csv(f)
     dept = first_line.split(":")[-1].strip()
-    
+
+    # Strip column names and remove empty ones
+    df.columns = [col.strip() for col in df.columns]
+    df = df.loc[:, df.columns != '']
+
     # Add department column
     df.insert(0, "Department", dept)
-    
-    # Split course name and code
-    def split_course_name(course_str):
-        if pd.isna(course_str):
-            return pd.Series(["", ""])
-        parts = course_str.rsplit("-", 1)
-        if len(parts) == 2:
-            return pd.Series([parts[0].strip(), parts[1].strip()])
-        return pd.Series([course_str.strip(), ""])
-    
-    df[["Course Name", "Course Code"]] = df["Course Name"].apply(split_course_name)
-    
-    # Keep only relevant columns
-    df = df[["Department", "Course Code", "Course Name", "Slot Name"]]
-    
-    # Remove rows with empty or null Course Code
-    df = df[df["Course Code"].notna() & (df["Course Code"] != "")]
-    df["Course Code"] = df["Course Code"].str.strip()
-    
+
+    # Split "NAME-CODE" on the last dash with vectorized string ops
+    parts = df["Course Name"].str.rsplit("-", n=1, expand=True).reindex(columns=[0, 1])
+    df["Course Name"] = parts[0].fillna("").str.strip()
+    df["Course Code"] = parts[1].fillna("").str.strip()
+
+    # Keep only relevant columns (older exports may lack the time columns)
+    df = df.reindex(columns=COLUMNS)
+
+    # Remove rows with empty Course Code
+    df = df[df["Course Code"] != ""]
+
     # ✅ Keep only courses with allowed slots
     df = df[df["Slot Name"].isin(allowed_slots)]
-    
-    all_dfs.append(df)
 
-# Combine all files into a single DataFrame
-combined_df = pd.concat(all_dfs, ignore_index=True)
+    return df
+
+
+def load_offerings(csv_file, use_cache=True):
+    """parse_offerings() with an on-disk cache keyed by file hash"""
+    if not use_cache:
+        return parse_offerings(csv_file)
+
+    cache_file = os.path.join(CACHE_DIR, f"{file_sha256(csv_file)}.v{PARSER_VERSION}.pkl")
+    if os.path.exists(cache_file):
+        return pd.read_pickle(cache_file)
+
+    df = parse_offerings(csv_file)
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    with atomic_write(cache_file, "wb") as f:
+        df.to_pickle(f)
+    return df
+
+
+def load_all_offerings(csv_files, workers=None, use_cache=True):
+    """Parse any number of offerings files in parallel and combine them"""
+    csv_files = list(csv_files)
+    if len(csv_files) > 1 and workers != 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            dfs = list(pool.map(load_offerings, csv_files, [use_cache] * len(csv_files)))
+    else:
+        dfs = [load_offerings(csv_file, use_cache) for csv_file in csv_files]
+
+    if not dfs:
+        return pd.DataFrame(columns=COLUMNS)
+    return pd.concat(dfs, ignore_index=True)
+
+
+if __name__ == "__main__":
+    # python slotparsing.py [files...]   (defaults to every Courses_Offered_*.csv)
+    csv_files = sys.argv[1:] or sorted(glob.glob("Courses_Offered_*.csv"))
+
+    # Combine all files into a single DataFrame
+    combined_df = load_all_offerings(csv_files)
 
-# Save to JSON
-combined_df.to_json("courses_clean.json", orient="records", indent=4)
+    # Save to JSON
+    combined_df.to_json("courses_clean.json", orient="records", indent=4)
 
-print("JSON saved with", len(combined_df), "courses")
+    print("JSON saved with", len(combined_df), "courses")
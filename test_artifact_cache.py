@@ -0,0 +1,52 @@
+import artifact_cache
+import planner
+from artifact_cache import is_written, mark_written
+from catalog import CourseCatalog
+
+
+def test_plan_key_changes_with_its_inputs(tmp_path):
+    builder = planner.PlanModelBuilder()
+    student = builder.student(planner.sample_student(None))
+    key = builder.plan_key(student, planner.SELECTED_MINOR)
+    assert builder.plan_key(builder.student(planner.sample_student(None)), planner.SELECTED_MINOR) == key
+
+    # student state
+    changed = builder.student(planner.sample_student(None))
+    changed.completed_hul = changed.completed_hul + ["HUL275"]
+    assert builder.plan_key(changed, planner.SELECTED_MINOR) != key
+    # minor
+    assert builder.plan_key(student, None) != key
+    assert builder.plan_key(student, "Economics") != key
+
+    # catalog contents
+    source = tmp_path / "data.json"
+    source.write_text('{"AAA100": {"code": "AAA100"}}', encoding="utf-8")
+    before = planner.PlanModelBuilder(catalog=CourseCatalog({}, str(source)))
+    source.write_text('{"AAA100": {"code": "AAA100", "credits": 3}}', encoding="utf-8")
+    after = planner.PlanModelBuilder(catalog=CourseCatalog({}, str(source)))
+    assert before.program_key != after.program_key
+    assert before.plan_key(student) != after.plan_key(student)
+
+
+def test_plan_key_does_not_depend_on_the_working_directory(tmp_path, monkeypatch):
+    builder = planner.PlanModelBuilder()
+    student = builder.student(planner.sample_student(None))
+    keys = builder.plan_key(student), builder.plan_key(student, planner.SELECTED_MINOR)
+    monkeypatch.chdir(tmp_path)
+    assert (builder.plan_key(student), builder.plan_key(student, planner.SELECTED_MINOR)) == keys
+
+
+def test_written_files_are_skipped_until_they_change(tmp_path, monkeypatch):
+    monkeypatch.setattr(artifact_cache, "CACHE_DIR", str(tmp_path / "cache"))
+    output = tmp_path / "courses_left.json"
+    output.write_text("[]", encoding="utf-8")
+    assert not is_written(str(output), "key1")
+
+    mark_written(str(output), "key1")
+    assert is_written(str(output), "key1")
+    assert not is_written(str(output), "key2")          # new inputs: write again
+
+    output.write_text("[1]", encoding="utf-8")          # edited by hand: write again
+    assert not is_written(str(output), "key1")
+    output.unlink()
+    assert not is_written(str(output), "key1")
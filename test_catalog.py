@@ -0,0 +1,109 @@
+import json
+import os
+import re
+import shutil
+
+import catalog as catalog_module
+from catalog import CourseCatalog, get_catalog, load_overlay, write_overlay
+from overlaps import maximal_cliques, parse_overlap
+
+
+def _scan(catalog, pattern):
+    """Reference answer: regex scan over the whole catalog"""
+    regex = re.compile("^" + pattern[:3] + "".join(r"\d" if ch == "X" else ch for ch in pattern[3:]))
+    return [code for code in catalog if regex.match(code)]
+
+
+def test_catalog_is_shared():
+    assert get_catalog() is get_catalog()
+
+
+def test_match_wildcard_buckets():
+    catalog = get_catalog()
+    for pattern in ["HUL2XX", "HUL3XX", "ELL3XX", "ELL", "ELL3X1", "ELL101", "XYZ"]:
+        assert catalog.match(pattern) == _scan(catalog, pattern), pattern
+
+
+def test_match_hul_bucket_only_has_hul2():
+    codes = get_catalog().match("HUL2XX")
+    assert codes
+    assert all(code.startswith("HUL2") for code in codes)
+
+
+def test_slot_overlay_is_applied_without_touching_base(tmp_path):
+    path = write_overlay("2099-00-1", {"ELL101": {"slot": "Z"}}, overlay_dir=tmp_path)
+    overlay = load_overlay(path)
+
+    assert CourseCatalog.from_snapshot(overlay=overlay)["ELL101"]["slot"] == "Z"
+    assert CourseCatalog.from_json(overlay=overlay)["ELL101"]["slot"] == "Z"
+    assert CourseCatalog.from_snapshot(catalog_module.DEFAULT_CATALOG_PATH)["ELL101"]["slot"] != "Z"
+
+
+def test_records_are_immutable_with_dense_ids():
+    catalog = get_catalog()
+    record = catalog.record("ELL101")
+
+    assert record is catalog.record("ELL101")
+    assert catalog.record_by_id(record.id) is record
+    assert 0 <= record.id < len(catalog)
+
+    core = record.tagged("Core")
+    assert core.type == "Core" and record.type is None
+    try:
+        record.slot = "Z"
+    except AttributeError:
+        pass
+    else:
+        raise AssertionError("records must be immutable")
+
+
+def test_overlap_cliques():
+    assert parse_overlap("ELL784, ELL789, COL341/COL774") == ["ELL784", "ELL789", "COL341", "COL774"]
+    assert parse_overlap("Some overlap with MTL 732, ELL201") == ["MTL732", "ELL201"]
+    assert parse_overlap("COL765 & COL226") == []
+
+    graph = {"A": {"B", "C"}, "B": {"A", "C"}, "C": {"A", "B", "D"}, "D": {"C"}}
+    assert maximal_cliques(graph) == [("A", "B", "C"), ("C", "D")]
+
+    cliques = get_catalog().overlap_cliques()
+    assert ("APL104", "APL105", "APL108") in cliques
+    assert all(len(clique) > 1 for clique in cliques)
+
+
+def test_snapshot_round_trips_data_json(tmp_path):
+    source = tmp_path / "data.json"
+    shutil.copy(catalog_module.DEFAULT_CATALOG_PATH, source)
+    with open(source, "r", encoding="utf-8") as f:
+        courses = json.load(f)
+
+    catalog = CourseCatalog.from_snapshot(str(source))          # builds data.catalog next to it
+    assert (tmp_path / "data.catalog").exists()
+    assert list(catalog) == list(courses)
+    for code, course in courses.items():
+        description = course.pop("description", "")
+        assert catalog[code] == course, code                     # int / float credits, null slots, hours
+        assert catalog.description(code) == description
+
+
+def test_stale_snapshot_is_rebuilt(tmp_path):
+    source = tmp_path / "data.json"
+    shutil.copy(catalog_module.DEFAULT_CATALOG_PATH, source)
+    assert CourseCatalog.from_snapshot(str(source))["ELL101"]["credits"] != 99
+
+    with open(source, "r", encoding="utf-8") as f:
+        courses = json.load(f)
+    courses["ELL101"]["credits"] = 99
+    with open(source, "w", encoding="utf-8") as f:
+        json.dump(courses, f)
+    stat = os.stat(source)
+    os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))     # newer than the snapshot
+
+    assert CourseCatalog.from_snapshot(str(source))["ELL101"]["credits"] == 99
+    assert not (tmp_path / "data.py").exists()          # only `python catalog_snapshot.py` writes data.py
+
+
+def test_data_module_matches_data_json():
+    import data
+    from fileio import file_sha256
+
+    assert data.SOURCE_SHA256 == file_sha256(catalog_module.DEFAULT_CATALOG_PATH)
@@ -1,9 +1,8 @@
-import json
 from dept import Electrical
+from catalog import get_catalog
 
-# Load data
-with open("data.json", "r") as f:
-    all_courses = json.load(f)
+# Load data (shared catalog)
+all_courses = get_catalog()
 
 # Check semester 3 courses
 print("Semester 3 recommended courses:")
@@ -0,0 +1,122 @@
+import contextlib
+import io
+
+from ortools.sat.python import cp_model
+
+from benchmark_engines import synthetic_inputs
+from catalog import CourseCatalog
+from model_engines import ENGINES, add_hints, course_index, explain_infeasibility, missing_core, restrict_to_windows
+from prereqs import prereq_leaves
+from user import UserData
+
+
+def solve(name, inputs):
+    model, course_vars, _ = ENGINES[name](*inputs)
+    solver = cp_model.CpSolver()
+    solver.parameters.max_time_in_seconds = 20
+    solver.parameters.num_workers = 8
+    status = solver.Solve(model)
+    assert status in (cp_model.OPTIMAL, cp_model.FEASIBLE)
+    return {cid: sem for (sem, cid), var in course_vars.items() if solver.Value(var)}
+
+
+def test_engines_agree_on_the_rules():
+    inputs = synthetic_inputs(60)
+    courses_left, user, config, catalog, _ = inputs
+    courses = {course.id: course for sem_courses in courses_left.values() for course in sem_courses}
+
+    for name in ENGINES:
+        taken = solve(name, inputs)
+        assert all(course.id in taken for course in courses.values() if course.type == "Core")
+        for cid, sem in taken.items():
+            # every course leaf of a Core course's prereqs is taken earlier (Core prereqs are plain ANDs)
+            if courses[cid].type == "Core":
+                for _, code in prereq_leaves(courses[cid].prereqs_parsed, "course"):
+                    assert taken[catalog.id_of(code)] < sem
+        for sem in range(1, 9):
+            load = sum(courses[cid].credits for cid, s in taken.items() if s == sem)
+            assert user.min_credits <= load <= 26.5
+
+
+def test_hints_go_to_the_closest_offered_semester():
+    courses_left, user, config, catalog, minor_req = synthetic_inputs(60)
+    model, course_vars, _ = ENGINES["bool"](courses_left, user, config, catalog, minor_req)
+    course_at, _ = course_index(courses_left, config["CREDIT_SCALE"])
+    code = next(c.code for c in courses_left[8] if c.type == "Core" and not any(x.code == c.code for x in courses_left[1]))
+
+    assert add_hints(model, course_vars, course_at, {code: 1, "NOT_A_COURSE": 3}) == 1
+    hints = dict(zip(model.Proto().solution_hint.vars, model.Proto().solution_hint.values))
+    first = min(sem for sem, cid in course_vars if course_at[(sem, cid)].code == code)
+    for (sem, cid), var in course_vars.items():
+        if course_at[(sem, cid)].code == code:
+            assert hints[var.Index()] == int(sem == first)
+
+
+def earned_credit_inputs(credits_done=0, semesters=(1, 2, 3)):
+    """Three 4-credit Core courses and a DE course with prereqs [EC8], over `semesters`"""
+    data = {code: {"code": code, "name": code, "credits": 4, "prereqs": "", "overlap": "",
+                   "hours": {"lecture": 0, "tutorial": 0, "practical": 0}}
+            for code in ("AAA101", "AAA102", "AAA103", "DDD101")}
+    data["DDD101"]["prereqs"] = "[EC8]"
+    catalog = CourseCatalog(data)
+    types = {"AAA101": "Core", "AAA102": "Core", "AAA103": "Core", "DDD101": "DE"}
+    courses = [catalog.record(code).tagged(kind) for code, kind in types.items()]
+    courses_left = {sem: list(courses) for sem in semesters}
+
+    # credits_done comes from completed program courses listed in EE_courses
+    done = {"code": "AAA100", "credits": credits_done, "type": "Core"}
+    user = UserData(name="EC", EE_courses={0: [done]}, completed_corecourses=["AAA100"] if credits_done else [],
+                    min_credits=0, max_credits=24)
+    config = {"TOTAL_TARGET_CREDITS": 16 + credits_done, "CREDIT_SCALE": 10, "MAX_HUL_PER_SEM": 2,
+              "MIN_HUL_CREDITS": 0, "MIN_DE_CREDITS": 4, "MINOR_UNIQUE_CREDITS": 0, "MAX_MINOR_PER_SEM": 2}
+    return courses_left, user, config, catalog, None
+
+
+def feasible(name, inputs, taken):
+    """Can the plan take exactly the courses of `taken` ({code: sem}) in those semesters?"""
+    courses_left, _, _, catalog, _ = inputs
+    with contextlib.redirect_stdout(io.StringIO()):
+        model, course_vars, _ = ENGINES[name](*inputs)
+    for code, sem in taken.items():
+        model.Add(course_vars[(sem, catalog.id_of(code))] == 1)
+    return cp_model.CpSolver().Solve(model) in (cp_model.OPTIMAL, cp_model.FEASIBLE)
+
+
+def test_earned_credit_prereqs():
+    for name in ENGINES:
+        inputs = earned_credit_inputs()
+        assert not feasible(name, inputs, {"DDD101": 1})                                    # 0 earned
+        assert not feasible(name, inputs, {"AAA101": 1, "AAA102": 2, "AAA103": 2, "DDD101": 2})   # 4 earned
+        assert feasible(name, inputs, {"AAA101": 1, "AAA102": 1, "AAA103": 2, "DDD101": 2})       # 8 earned
+        # credits completed before the plan count too
+        assert feasible(name, earned_credit_inputs(credits_done=8), {"DDD101": 1})
+        # semesters with a gap (5, 7, 8 left): credits carry over from the previous planned semester
+        gapped = earned_credit_inputs(semesters=(5, 7, 8))
+        assert not feasible(name, gapped, {"AAA101": 5, "AAA102": 7, "AAA103": 7, "DDD101": 7})
+        assert feasible(name, gapped, {"AAA101": 5, "AAA102": 5, "AAA103": 7, "DDD101": 7})
+
+
+def test_unschedulable_core_courses_make_the_plan_infeasible():
+    """Only semester 8 left: the Core chain AAA101 -> BBB101 cannot fit, the DE courses can"""
+    data = {code: {"code": code, "name": code, "credits": 4, "prereqs": "", "overlap": "",
+                   "hours": {"lecture": 0, "tutorial": 0, "practical": 0}}
+            for code in ("AAA101", "BBB101", "DDD101", "DDD102")}
+    data["BBB101"]["prereqs"] = "[AAA101]"
+    catalog = CourseCatalog(data)
+    types = {"AAA101": "Core", "BBB101": "Core", "DDD101": "DE", "DDD102": "DE"}
+    user = UserData(name="S8", current_semester=8, min_credits=0, max_credits=24)
+    config = {"TOTAL_TARGET_CREDITS": 8, "CREDIT_SCALE": 10, "MAX_HUL_PER_SEM": 2,
+              "MIN_HUL_CREDITS": 0, "MIN_DE_CREDITS": 8, "MINOR_UNIQUE_CREDITS": 0, "MAX_MINOR_PER_SEM": 2}
+    planned = {8: [catalog.record(code).tagged(kind) for code, kind in types.items()]}
+
+    courses_left, unschedulable = restrict_to_windows(planned, user)
+    assert unschedulable == ["AAA101", "BBB101"]
+    missing = missing_core(planned, unschedulable)
+    assert missing == ["AAA101", "BBB101"]
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        for name in ENGINES:
+            model, _, _ = ENGINES[name](courses_left, user, config, catalog, None, missing_core=missing)
+            assert cp_model.CpSolver().Solve(model) == cp_model.INFEASIBLE
+        conflict = explain_infeasibility(courses_left, user, config, catalog, missing_core=missing)
+    assert conflict in (["Core course AAA101"], ["Core course BBB101"])
@@ -0,0 +1,39 @@
+import contextlib
+import io
+
+from ortools.sat.python import cp_model
+
+import planner
+
+
+def solve(model, course_vars, fixed=None):
+    """{key: value} of a solution, optionally with course_vars fixed to `fixed` first"""
+    model = model.clone()
+    for key, value in (fixed or {}).items():
+        model.Add(course_vars[key] == value)
+    solver = cp_model.CpSolver()
+    solver.parameters.num_workers = 8
+    solver.parameters.max_time_in_seconds = 20
+    assert solver.Solve(model) in (cp_model.OPTIMAL, cp_model.FEASIBLE)
+    return {key: solver.Value(var) for key, var in course_vars.items()}
+
+
+def test_template_matches_scratch_model():
+    scratch = planner.PlanModelBuilder()
+    template = planner.PlanModelBuilder(config={"MODEL_TEMPLATE": True})
+
+    students = [planner.sample_student(None)]
+    fewer = planner.sample_student(None)                        # semester 3 courses still to do
+    fewer.completed_corecourses = fewer.completed_corecourses[:14]
+    students.append(fewer)
+
+    for student in students:
+        with contextlib.redirect_stdout(io.StringIO()):
+            a = scratch.build(student, planner.SELECTED_MINOR)
+            b = template.build(student, planner.SELECTED_MINOR)
+        assert a["course_vars"].keys() == b["course_vars"].keys()
+        assert a["remaining_target_credits"] == b["remaining_target_credits"]
+
+        # each model accepts the other's solution
+        solve(a["model"], a["course_vars"], solve(b["model"], b["course_vars"]))
+        solve(b["model"], b["course_vars"], solve(a["model"], a["course_vars"]))
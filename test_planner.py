@@ -0,0 +1,113 @@
+import contextlib
+import importlib
+import io
+
+import planner
+
+
+def test_import_has_no_side_effects(capsys):
+    importlib.reload(planner)
+    assert capsys.readouterr().out == ""
+
+
+def test_plan_sample_student_twice():
+    student = planner.sample_student(None)
+    first = planner.plan(student, minor=planner.SELECTED_MINOR)
+    second = planner.plan(student, minor=planner.SELECTED_MINOR)
+
+    assert first["status"] == second["status"] == "OPTIMAL"
+    taken = [c.code for courses in first["semester_plan"].values() for c in courses]
+    assert len(taken) == len(set(taken))
+    assert not set(taken) & set(student.completed_corecourses)
+    # the caller's UserData is left as it was
+    assert student.EE_courses == {}
+    assert not hasattr(student, "selected_minor")
+
+
+def test_solver_options():
+    student = planner.sample_student(None)
+    result = planner.plan(student, minor=planner.SELECTED_MINOR, options={
+        "SOLVER_MAX_TIME": 30, "SOLVER_WORKERS": 1, "SOLVER_SEED": 3, "SOLVER_INTERLEAVE": True, "SOLVER_LOG": True,
+    })
+    assert result["status"] == "OPTIMAL"
+    assert "num_workers: 1" in result["solver_log"]
+    assert "random_seed: 3" in result["solver_log"]
+    # solver options only affect the solve, not which builder is used
+    builders = len(planner._builders)
+    planner.plan(student, minor=planner.SELECTED_MINOR, options={"SOLVER_MAX_TIME": 10})
+    assert len(planner._builders) == builders
+
+
+def test_alternative_plans_stream_and_differ():
+    builder = planner.PlanModelBuilder()
+    with contextlib.redirect_stdout(io.StringIO()):
+        built = builder.build(planner.sample_student(None), planner.SELECTED_MINOR)
+
+    streamed = []
+    plans = planner.alternative_plans(built, 3, min_difference=4, on_plan=streamed.append)
+    assert len(plans) == 3 and streamed == plans
+
+    taken = [{(sem, c.code) for sem, courses in p["semester_plan"].items() for c in courses} for p in plans]
+    for i, later in enumerate(taken):
+        for earlier in taken[:i]:
+            assert len(earlier - later) >= 4
+
+
+def test_infeasible_plan_names_the_conflict():
+    student = planner.sample_student(None)
+    student.min_credits = 26        # above the 24 (26.5 extended) cap, and only 2 semesters can extend
+    result = planner.plan(student, minor=planner.SELECTED_MINOR, options={"SOLVER_MAX_TIME": 30})
+
+    assert result["status"] == "INFEASIBLE"
+    assert "at most 2 extended semesters" in result["conflicts"]
+    assert any(requirement.startswith("at least 26 credits in semester") for requirement in result["conflicts"])
+
+    # no minor courses allowed in any semester: the minor core can't be met
+    result = planner.plan(planner.sample_student(None), minor=planner.SELECTED_MINOR,
+                          options={"MAX_MINOR_PER_SEM": 0, "SOLVER_MAX_TIME": 30})
+    assert result["status"] == "INFEASIBLE"
+    assert any(requirement.endswith("minor core credits") for requirement in result["conflicts"])
+
+    # only presolve sees this one quickly: the credit-bucket check names it after the time limit
+    result = planner.plan(planner.sample_student(None), minor=planner.SELECTED_MINOR,
+                          options={"MIN_DE_CREDITS": 80, "SOLVER_MAX_TIME": 30, "SOLVER_EXPLAIN_MAX_TIME": 1})
+    assert result["status"] == "INFEASIBLE"
+    assert "80.0 more DE credits" in result["conflicts"]
+    assert "94.0 more credits (at most 9 over)" in result["conflicts"]
+
+
+def test_explain_is_quiet_and_uses_its_options(capsys):
+    builder = planner.PlanModelBuilder()
+    conflicts = builder.explain(planner.sample_student(None), planner.SELECTED_MINOR,
+                                {"MIN_DE_CREDITS": 80, "SOLVER_EXPLAIN_MAX_TIME": 1})
+    assert capsys.readouterr().out == ""
+    assert "80.0 more DE credits" in conflicts
+
+
+def test_cached_inputs_register_minor_only_courses():
+    from catalog import CourseCatalog
+
+    student = planner.sample_student(None)
+    with contextlib.redirect_stdout(io.StringIO()):
+        planner.PlanModelBuilder().plan_inputs(student, planner.SELECTED_MINOR)     # warms the cache
+        # a fresh catalog, as in a new process: COL320 is only in minors.json
+        catalog = CourseCatalog.from_snapshot()
+        inputs = planner.PlanModelBuilder(catalog=catalog).plan_inputs(student, planner.SELECTED_MINOR)
+
+    records = [course for courses in inputs["courses_left"].values() for course in courses]
+    assert "COL320" in {course.code for course in records}
+    assert all(catalog.id_of(course.code) == course.id for course in records)
+    assert catalog.record_by_id(catalog.id_of("COL320")).code == "COL320"
+
+
+def test_pre_solve_summary_uses_the_builder_scale():
+    student = planner.sample_student(None)
+    for scale in (10, 100):
+        builder = planner.PlanModelBuilder(config={"CREDIT_SCALE": scale})
+        with contextlib.redirect_stdout(io.StringIO()):
+            built = builder.build(student, planner.SELECTED_MINOR)
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            planner.print_pre_solve(built)
+        assert "Remaining credits needed: 94.0" in out.getvalue()
+        assert "Target needed: 94.0" in out.getvalue()
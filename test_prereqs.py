@@ -0,0 +1,95 @@
+from ortools.sat.python import cp_model
+
+from prereqs import compile_prereqs, format_prereqs, parse_prereqs, prereq_leaves, semester_windows
+
+
+def test_parse_nested_and_or():
+    tree = parse_prereqs("[ELL101 and (ELL211 or (ELL231 and EC50))]")
+    assert tree == ("and", (
+        ("course", "ELL101"),
+        ("or", (("course", "ELL211"), ("and", (("course", "ELL231"), ("credits", 50))))),
+    ))
+    assert format_prereqs(tree) == "ELL101 and (ELL211 or ELL231 and EC50)"
+    assert parse_prereqs("[]") is parse_prereqs(None) is parse_prereqs("None") is None
+
+
+def test_parse_is_lenient_and_simplifies():
+    # unclosed parenthesis, duplicate group
+    assert parse_prereqs("[(MTL100 or MTL101) and (MTL100 or MTL101) and (APL101") == \
+        ("and", (("or", (("course", "MTL100"), ("course", "MTL101"))), ("course", "APL101")))
+    assert prereq_leaves(parse_prereqs("[COL106 and (MTL106 or instructor_permission)]"), "other") == \
+        [("other", "instructor_permission")]
+
+
+def test_compile_is_linear_in_expression_size():
+    # 12 OR groups of 3: 3**12 paths as DNF, 12 + 1 nodes as a tree
+    groups = [" or ".join(f"ABC{3 * g + i:03d}" for i in range(3)) for g in range(12)]
+    tree = parse_prereqs("[" + " and ".join(f"({group})" for group in groups) + "]")
+    model = cp_model.CpModel()
+    taken = {}
+
+    def leaf(node):
+        return taken.setdefault(node[1], model.NewBoolVar(node[1]))
+
+    compile_prereqs(model, tree, leaf)
+    assert len(model.Proto().constraints) == 13
+
+
+def test_compiled_literal_enforces_the_expression():
+    tree = parse_prereqs("[COL765 or (COL703 and COL226)]")
+    for done, expected in [({"COL765"}, True), ({"COL703"}, False), ({"COL703", "COL226"}, True)]:
+        model = cp_model.CpModel()
+        satisfied = compile_prereqs(model, tree, lambda node: node[1] in done)
+        assert satisfied is expected
+
+    model = cp_model.CpModel()
+    taken = {code: model.NewBoolVar(code) for code in ("COL765", "COL703", "COL226")}
+    satisfied = compile_prereqs(model, tree, lambda node: taken[node[1]])
+    model.Add(satisfied == 1)
+    model.Add(taken["COL765"] == 0)
+    model.Add(taken["COL226"] == 0)
+    assert cp_model.CpSolver().Solve(model) == cp_model.INFEASIBLE
+
+
+def test_catalog_records_come_parsed(monkeypatch):
+    import prereqs
+    from catalog import CourseCatalog, get_catalog
+
+    get_catalog()           # makes sure the snapshot is built
+    expected = {code: parse_prereqs(course["prereqs"]) for code, course in get_catalog().items()}
+
+    # Loading the snapshot and building records must not parse anything
+    def no_parsing(prereq_string):
+        raise AssertionError(f"parsed {prereq_string!r} at planning time")
+
+    monkeypatch.setattr(prereqs, "parse_prereqs", no_parsing)
+    monkeypatch.setattr(prereqs, "_trees", {})
+    catalog = CourseCatalog.from_snapshot()
+    assert {code: catalog.record(code).prereqs_parsed for code in catalog} == expected
+
+
+def test_semester_windows():
+    trees = {
+        "AAA100": None,
+        "BBB100": parse_prereqs("[AAA100]"),
+        "CCC100": parse_prereqs("[BBB100 or DNE100]"),
+        "DDD100": parse_prereqs("[BBB100 and CCC100]"),
+        "EEE100": parse_prereqs("[XYZ999]"),          # prereq outside the plan: not modelled
+        "FFF100": parse_prereqs("[DDD100]"),
+    }
+    windows = semester_windows(trees, completed={"DNE100"}, mandatory={"AAA100", "BBB100", "DDD100"}, first=5, last=8)
+    assert windows["AAA100"] == (5, 6)       # BBB100 (Core) needs it, and DDD100 (Core) needs BBB100 by 7
+    assert windows["BBB100"] == (6, 7)
+    assert windows["CCC100"] == (5, 8)       # DNE100 already satisfies it
+    assert windows["DDD100"] == (7, 8)
+    assert windows["EEE100"] == (5, 8)
+    assert windows["FFF100"] == (8, 8)
+
+    # A chain longer than the remaining semesters leaves an empty window
+    windows = semester_windows(trees, completed=set(), mandatory=set(), first=7, last=8)
+    assert windows["DDD100"][0] > windows["DDD100"][1]
+
+    # ... also when the chain is mandatory (the backward pass bottoms out at first - 1)
+    chain = {"AAA100": None, "BBB100": parse_prereqs("[AAA100]"), "CCC100": parse_prereqs("[BBB100]")}
+    windows = semester_windows(chain, completed=set(), mandatory=set(chain), first=8, last=8)
+    assert windows == {"AAA100": (8, 7), "BBB100": (9, 7), "CCC100": (9, 8)}
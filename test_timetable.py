@@ -0,0 +1,40 @@
+from timetable import clash_groups, format_mask, parse_meetings, planning_mask
+
+
+def test_parse_meetings():
+    assert format_mask(parse_meetings("TWF 09:00-10:00")) == "T 09:00-10:00, W 09:00-10:00, F 09:00-10:00"
+    assert format_mask(parse_meetings("MW 11:00-12:00 ,Th 12:00-13:00")) == \
+        "M 11:00-12:00, W 11:00-12:00, Th 12:00-13:00"
+    assert parse_meetings("") == parse_meetings(None) == parse_meetings("00-13:00") == 0
+
+
+def test_clash_is_bitwise_and():
+    a = parse_meetings("MTh 09:30-11:00")
+    b = parse_meetings("MTh 08:00-09:30")
+    c = parse_meetings("TWF 10:00-11:00")
+    assert a & b == 0           # back to back, no overlap
+    assert b & c == 0
+    assert a & parse_meetings("M 10:30-11:00")
+
+
+def test_clash_groups_cover_every_overlapping_pair():
+    masks = {
+        "A": parse_meetings("TWF 09:00-10:00"),
+        "B": parse_meetings("T 09:30-10:30"),
+        "C": parse_meetings("W 09:00-10:00"),
+        "D": parse_meetings("M 09:00-10:00"),
+    }
+    groups = clash_groups(masks)
+    for x in masks:
+        for y in masks:
+            if x < y:
+                together = any({x, y} <= group for group in groups)
+                assert together == bool(masks[x] & masks[y]), (x, y)
+
+
+def test_planning_mask_falls_back_to_slot():
+    fallback = {"D": parse_meetings("MTh 08:00-09:30")}
+    assert planning_mask({"slot": "D"}, fallback) == fallback["D"]
+    assert planning_mask({"slot": "P"}, fallback) == planning_mask({"slot": "P"}, {})
+    assert planning_mask({"slot": "P"}, {}) & planning_mask({"slot": "Q"}, {}) == 0
+    assert planning_mask({}, fallback) == 0
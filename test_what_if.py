@@ -0,0 +1,44 @@
+import contextlib
+import io
+
+from ortools.sat.python import cp_model
+
+import planner
+from what_if import WhatIfSession
+
+
+def taken(result):
+    return {course.code: sem for sem, courses in result["semester_plan"].items() for course in courses}
+
+
+def test_what_if_queries():
+    builder = planner.PlanModelBuilder()
+    student = planner.sample_student(None)
+    with contextlib.redirect_stdout(io.StringIO()):
+        session = WhatIfSession(builder, student, planner.SELECTED_MINOR)
+        scratch = builder.build(student, planner.SELECTED_MINOR)
+
+    base = session.solve()
+    assert base["status"] == "OPTIMAL"
+    base_taken = taken(base)
+
+    # the unedited session plan is a plan of the from-scratch model too
+    model = scratch["model"].clone()
+    for (sem, cid), var in scratch["course_vars"].items():
+        model.Add(var == int(any(c.id == cid for c in base["semester_plan"].get(sem, []))))
+    assert all((sem, c.id) in scratch["course_vars"] for sem, courses in base["semester_plan"].items() for c in courses)
+    assert cp_model.CpSolver().Solve(model) == cp_model.OPTIMAL
+
+    sem = base_taken["ELL303"]
+    moved = taken(session.solve(drop={"ELL303": sem}))
+    assert moved["ELL303"] != sem
+
+    capped = session.solve(caps={5: 18})
+    assert sum(c.credits for c in capped["semester_plan"][5]) <= 18
+
+    done = session.solve(complete=["ELL303"])
+    assert "ELL303" not in taken(done)
+    assert done["remaining_target_credits"] < base["remaining_target_credits"]
+
+    # edits do not stick: the next query starts from the student again
+    assert "ELL303" in taken(session.solve())
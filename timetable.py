@@ -0,0 +1,146 @@
+"""
+Weekly timetable bitmasks.
+
+A week is a grid of DAYS x half-hour cells; a course's meetings are an int
+with one bit per occupied cell, so two courses clash iff (a & b) != 0.
+
+    parse_meetings("TWF 09:00-10:00")
+    parse_meetings("MW 11:00-12:00 ,Th 12:00-13:00")
+"""
+import re
+from collections import Counter
+
+DAYS = ("M", "T", "W", "Th", "F", "S")
+CELLS_PER_HOUR = 2                          # half-hour resolution (e.g. 09:30-11:00)
+CELLS_PER_DAY = 24 * CELLS_PER_HOUR
+
+MEETING_KINDS = ("lecture", "tutorial", "practical")
+
+_DAY_TOKEN = re.compile(r"Th|M|T|W|F|S")
+_MEETING = re.compile(r"^\s*([A-Za-z]+)\s+(\d{1,2}):(\d{2})\s*-\s*(\d{1,2}):(\d{2})\s*$")
+
+
+def _cell(hour, minute, round_up=False):
+    cell = hour * CELLS_PER_HOUR + minute * CELLS_PER_HOUR // 60
+    if round_up and minute * CELLS_PER_HOUR % 60:
+        cell += 1
+    return min(cell, CELLS_PER_DAY)
+
+
+def parse_meetings(text):
+    """
+    Parse an offerings time string into a bitmask of day x half-hour cells.
+    Comma separated groups are OR-ed together; unparseable groups are skipped.
+    Empty / missing input gives 0.
+    """
+    if not isinstance(text, str):
+        return 0
+
+    mask = 0
+    for group in text.split(","):
+        match = _MEETING.match(group)
+        if not match:
+            continue
+        days, h1, m1, h2, m2 = match.groups()
+        day_tokens = _DAY_TOKEN.findall(days)
+        if "".join(day_tokens) != days:
+            continue            # unknown day letters
+
+        start = _cell(int(h1), int(m1))
+        end = _cell(int(h2), int(m2), round_up=True)
+        if end <= start:
+            continue
+        day_bits = ((1 << (end - start)) - 1) << start
+        for day in day_tokens:
+            mask |= day_bits << (DAYS.index(day) * CELLS_PER_DAY)
+    return mask
+
+
+def mask_cells(mask):
+    """Indices of the set cells of a mask"""
+    cells = []
+    while mask:
+        low = mask & -mask
+        cells.append(low.bit_length() - 1)
+        mask ^= low
+    return cells
+
+
+def format_mask(mask):
+    """Human readable form of a mask, e.g. 'T 09:00-10:00, W 09:00-10:00'"""
+    parts = []
+    cells = mask_cells(mask)
+    i = 0
+    while i < len(cells):
+        j = i
+        while j + 1 < len(cells) and cells[j + 1] == cells[j] + 1 and cells[j + 1] % CELLS_PER_DAY:
+            j += 1
+        day, start = divmod(cells[i], CELLS_PER_DAY)
+        end = cells[j] % CELLS_PER_DAY + 1
+        parts.append(
+            f"{DAYS[day]} {start // CELLS_PER_HOUR:02d}:{start % CELLS_PER_HOUR * 60 // CELLS_PER_HOUR:02d}"
+            f"-{end // CELLS_PER_HOUR:02d}:{end % CELLS_PER_HOUR * 60 // CELLS_PER_HOUR:02d}"
+        )
+        i = j + 1
+    return ", ".join(parts)
+
+
+def course_mask(course, kind="lecture"):
+    """Meeting mask of one kind stored on a catalog record (0 if unknown)"""
+    return course.get("timetable", {}).get(kind, 0)
+
+
+def slot_masks(courses, kind="lecture"):
+    """
+    Most common meeting mask per slot letter among courses that have both.
+    Used as a stand-in for courses that only carry a slot letter.
+    """
+    counts = {}
+    for course in courses:
+        slot = course.get("slot")
+        mask = course_mask(course, kind)
+        if slot and mask:
+            counts.setdefault(slot, Counter())[mask] += 1
+    return {slot: counter.most_common(1)[0][0] for slot, counter in counts.items()}
+
+
+def clash_groups(masks):
+    """
+    masks: {key: mask}. Returns the distinct groups of keys that share a cell
+    (one group per occupied cell, duplicates and single-key groups dropped).
+    Two keys clash iff they share a cell, i.e. appear together in a group,
+    so "at most one per group" forbids exactly the true time overlaps.
+    """
+    by_cell = {}
+    for key, mask in masks.items():
+        for cell in mask_cells(mask):
+            by_cell.setdefault(cell, []).append(key)
+
+    groups = {frozenset(keys) for keys in by_cell.values() if len(keys) > 1}
+    # Drop groups contained in a larger one; they add nothing
+    return [g for g in groups if not any(g < other for other in groups)]
+
+
+_slot_bits = {}     # slot letter -> synthetic cell past the end of the week
+
+
+def slot_bit(slot):
+    """A cell of its own for a slot letter with no known meeting times"""
+    if slot not in _slot_bits:
+        _slot_bits[slot] = len(DAYS) * CELLS_PER_DAY + len(_slot_bits)
+    return 1 << _slot_bits[slot]
+
+
+def planning_mask(course, fallback_masks, kind="lecture"):
+    """
+    Mask used for clash detection: the course's own meetings, else the usual
+    meetings of its slot letter, else a cell reserved for that slot letter
+    (which reproduces plain slot-letter equality). 0 if there is no slot at all.
+    """
+    mask = course_mask(course, kind)
+    if mask:
+        return mask
+    slot = course.get("slot")
+    if not slot:
+        return 0
+    return fallback_masks.get(slot) or slot_bit(slot)
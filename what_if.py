@@ -0,0 +1,112 @@
+"""
+What-if re-solving on a persistent model.
+
+    session = WhatIfSession(builder, student, minor="Computer Science")
+    base = session.solve()
+    session.solve(drop={"ELL303": 5})           # ELL303 not in semester 5 (None: not at all)
+    session.solve(pin={"ELL303": 6})            # ELL303 in semester 6
+    session.solve(complete=["ELL303"])          # as if ELL303 were already done
+    session.solve(caps={5: 18})                 # at most 18 credits in semester 5
+
+The model is the department template (model_template.py) cloned once per
+student with completions left free. Every edit is an assumption literal - a
+done[code] literal, a course literal or its negation, a per-semester cap
+literal - so a what-if query only swaps the assumptions and re-solves, with
+the previous solution as a hint. Cap literals are added the first time a cap
+value is asked for and reused after that.
+"""
+import copy
+
+from ortools.sat.python import cp_model
+
+from model_engines import completed_credits, course_index
+from planner import new_solver, plan_result
+
+
+class WhatIfSession:
+    """Persistent model of one student for interactive what-if queries"""
+
+    def __init__(self, builder, student, minor=None):
+        self.builder = builder
+        self.student = builder.student(student)
+        self.minor = minor
+        self.template, inputs = builder.template(self.student.current_semester, minor)
+        if minor:
+            self.student.selected_minor = minor
+            self.student.overlap_info = inputs["overlap_info"]
+
+        self.scale = builder.config["CREDIT_SCALE"]
+        self.model, self.course_vars = self.template.session(self.student)
+        self.course_at, self.scaled_credits = course_index(self.template.courses_left, self.scale)
+        self.completed = (set(self.student.completed_corecourses) | set(self.student.completed_hul)
+                          | set(self.student.completed_DE))
+        self.caps = {}          # (sem, scaled credits) -> literal
+        self.last = None        # {(sem, course id): value} of the previous solution
+
+    def _slots(self, code, sem=None):
+        """Course literals of a code (in one semester, or in all)"""
+        cid = self.builder.catalog.id_of(code)
+        sems = self.template.courses_left if sem is None else [sem]
+        slots = [self.course_vars[(s, cid)] for s in sems if (s, cid) in self.course_vars]
+        if not slots:
+            raise ValueError(f"{code} is not offered in semester {sem}" if sem else f"{code} is not in the plan")
+        return slots
+
+    def _cap(self, sem, credits):
+        """Literal for "at most `credits` credits in semester `sem`" (added once)"""
+        key = (sem, int(credits * self.scale))
+        if key not in self.caps:
+            literal = self.model.NewBoolVar(f"cap_sem{sem}_{credits}")
+            load = sum(var * self.scaled_credits[cid] for (s, cid), var in self.course_vars.items() if s == sem)
+            self.model.Add(load <= key[1]).OnlyEnforceIf(literal)
+            self.caps[key] = literal
+        return self.caps[key]
+
+    def assumptions(self, complete=(), uncomplete=(), pin=None, drop=None, caps=None):
+        """Assumption literals of one what-if query"""
+        completed = (self.completed | set(complete)) - set(uncomplete)
+        literals = [var if code in completed else var.Not() for code, var in self.template.done.items()]
+        for code, sem in (pin or {}).items():
+            literals.append(self._slots(code, sem)[0])
+        for code, sem in (drop or {}).items():
+            literals.extend(var.Not() for var in self._slots(code, sem))
+        for sem, credits in (caps or {}).items():
+            literals.append(self._cap(sem, credits))
+        return literals
+
+    def solve(self, complete=(), uncomplete=(), pin=None, drop=None, caps=None):
+        """
+        Re-solve under one what-if query -> result dict as planner.solve_plan gives.
+        complete / uncomplete: codes to treat as done / not done
+        pin / drop:            {code: semester} to take / not take (drop None: anywhere)
+        caps:                  {semester: max credits}
+        """
+        model = self.model
+        model.ClearAssumptions()
+        model.AddAssumptions(self.assumptions(complete, uncomplete, pin, drop, caps))
+        model.ClearHints()
+        for key, value in (self.last or {}).items():
+            model.AddHint(self.course_vars[key], value)
+
+        solver, log = new_solver(self.builder.config)
+        status = solver.Solve(model)
+        value = None
+        if status in (cp_model.OPTIMAL, cp_model.FEASIBLE):
+            value = solver.Value
+            self.last = {key: solver.Value(var) for key, var in self.course_vars.items()}
+
+        # Credit bookkeeping of the edited student
+        student = copy.copy(self.student)
+        student.completed_corecourses = sorted((set(student.completed_corecourses) | set(complete)) - set(uncomplete))
+        student.completed_hul = [code for code in student.completed_hul if code not in uncomplete]
+        student.completed_DE = [code for code in student.completed_DE if code not in uncomplete]
+        credits_done = completed_credits(student)[0]
+
+        return plan_result({
+            "course_vars": self.course_vars,
+            "course_at": self.course_at,
+            "unschedulable": [],
+            "credits_done": credits_done,
+            "remaining_target_credits": int((self.builder.config["TOTAL_TARGET_CREDITS"] - credits_done) * self.scale),
+            "config": self.builder.config,
+        }, solver.StatusName(status), solver.WallTime(), value, log)